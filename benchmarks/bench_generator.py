@@ -0,0 +1,240 @@
+"""Generator benchmark suite with baseline comparison.
+
+Measures, across every combination of ProjectConfig feature flags:
+
+- load_templates: building an Environment and compiling every template in the
+  manifest, cold and with the bytecode cache
+- render_template: rendering all templates of a project with a warm Environment,
+  alone and through a RenderMemo shared by all configurations as in a batch
+- generate_project: single-project latency, including writing to disk
+- generate_batch: throughput in projects per second
+
+Results are written as JSON. When a baseline is given, every metric is
+compared against it and the script exits with status 1 if any latency grew,
+or any throughput dropped, by more than the tolerance.
+
+Usage:
+    python benchmarks/bench_generator.py --output results.json
+    python benchmarks/bench_generator.py --baseline benchmarks/baseline.json
+    python benchmarks/bench_generator.py --save-baseline benchmarks/baseline.json
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from fastapi_ms_init import __version__
+from fastapi_ms_init.batch import generate_batch
+from fastapi_ms_init.config import FEATURE_FLAGS, ProjectConfig
+from fastapi_ms_init.generator import (
+    RenderMemo,
+    generate_project,
+    load_templates,
+    render_template,
+    select_templates,
+)
+from fastapi_ms_init.template_manifest import load_template_manifest
+
+DEFAULT_TOLERANCE = 0.25
+
+
+def all_configs() -> list[ProjectConfig]:
+    """Return one configuration per combination of feature flags."""
+    return [
+        ProjectConfig(
+            service_name=f"bench-{index}",
+            python_package_name=f"bench_{index}",
+            **dict(zip(FEATURE_FLAGS, values, strict=True)),
+        )
+        for index, values in enumerate(
+            itertools.product([False, True], repeat=len(FEATURE_FLAGS))
+        )
+    ]
+
+
+def latency_stats(samples: list[float]) -> dict[str, Any]:
+    """Summarize latency samples given in seconds, reported in milliseconds."""
+    millis = sorted(sample * 1000 for sample in samples)
+    p95 = millis[0]
+    if len(millis) > 1:
+        p95 = statistics.quantiles(millis, n=20, method="inclusive")[-1]
+    return {
+        "unit": "ms",
+        "samples": len(millis),
+        "mean": statistics.fmean(millis),
+        "median": statistics.median(millis),
+        "p95": p95,
+        "max": millis[-1],
+    }
+
+
+def time_calls(function: Callable[[], object], repeat: int) -> list[float]:
+    """Time repeated calls of a function."""
+    samples = []
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        samples.append(perf_counter() - start)
+    return samples
+
+
+def load_all_templates(use_cache: bool = True) -> None:
+    """Build an Environment and compile every template in the manifest."""
+    env = load_templates(use_cache=use_cache)
+    for entry in load_template_manifest().entries:
+        for template in (entry.template, *entry.depends_on):
+            env.get_template(template)
+
+
+def run_benchmarks(repeat: int) -> dict[str, dict[str, Any]]:
+    """Run every benchmark and return the metrics by name."""
+    configs = all_configs()
+    metrics: dict[str, dict[str, Any]] = {}
+
+    metrics["load_templates.cold"] = latency_stats(
+        time_calls(lambda: load_all_templates(use_cache=False), repeat)
+    )
+    load_all_templates()  # populate the bytecode cache
+    metrics["load_templates.cached"] = latency_stats(time_calls(load_all_templates, repeat))
+
+    env = load_templates()
+    render_samples = []
+    for config in configs:
+        entries = select_templates(config)
+        for _ in range(repeat):
+            start = perf_counter()
+            for entry in entries:
+                render_template(env, entry.template, {"config": config})
+            render_samples.append(perf_counter() - start)
+    metrics["render_template.project"] = latency_stats(render_samples)
+
+    memo_samples = []
+    for _ in range(repeat):
+        memo = RenderMemo()
+        for config in configs:
+            start = perf_counter()
+            for entry in select_templates(config):
+                memo.render(env, entry.template, config)
+            memo_samples.append(perf_counter() - start)
+    metrics["render_template.memo"] = latency_stats(memo_samples)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        generate_samples = []
+        for round_index in range(repeat):
+            for config in configs:
+                output_path = Path(tmp) / f"single-{round_index}" / config.service_name
+                start = perf_counter()
+                generate_project(config, output_path, env=env)
+                generate_samples.append(perf_counter() - start)
+        metrics["generate_project.latency"] = latency_stats(generate_samples)
+
+        throughputs = []
+        for round_index in range(repeat):
+            start = perf_counter()
+            results = generate_batch(configs, Path(tmp) / f"batch-{round_index}")
+            elapsed = perf_counter() - start
+            failed = [result for result in results if not result.ok]
+            if failed:
+                raise RuntimeError(f"Batch generation failed: {failed[0].error}")
+            throughputs.append(len(configs) / elapsed)
+        metrics["generate_batch.throughput"] = {
+            "unit": "projects/s",
+            "samples": len(throughputs),
+            "median": statistics.median(throughputs),
+            "min": min(throughputs),
+        }
+
+    return metrics
+
+
+def compare(
+    metrics: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    tolerance: float,
+) -> list[str]:
+    """Compare medians against a baseline.
+
+    Returns:
+        Descriptions of the regressed metrics
+    """
+    regressions = []
+    for name, current in sorted(metrics.items()):
+        reference = baseline.get(name)
+        if reference is None:
+            print(f"{name:<28} {current['median']:10.2f} {current['unit']:<10} (no baseline)")
+            continue
+
+        ratio = current["median"] / reference["median"]
+        higher_is_better = current["unit"].endswith("/s")
+        regressed = ratio < 1 - tolerance if higher_is_better else ratio > 1 + tolerance
+        marker = "REGRESSION" if regressed else "ok"
+        print(
+            f"{name:<28} {current['median']:10.2f} {current['unit']:<10} "
+            f"baseline {reference['median']:10.2f}  {ratio:6.2f}x  {marker}"
+        )
+        if regressed:
+            regressions.append(f"{name}: {reference['median']:.2f} -> {current['median']:.2f}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="rounds per benchmark")
+    parser.add_argument("--output", type=Path, help="write results JSON to this file")
+    parser.add_argument("--baseline", type=Path, help="baseline results JSON to compare with")
+    parser.add_argument("--save-baseline", type=Path, help="write results as a new baseline")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="allowed relative slowdown before failing (default: %(default)s)",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        os.environ["FASTAPI_MS_INIT_CACHE_DIR"] = cache_dir
+        metrics = run_benchmarks(args.repeat)
+
+    results = {
+        "meta": {
+            "generator_version": __version__,
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+            "configs": 2 ** len(FEATURE_FLAGS),
+            "repeat": args.repeat,
+        },
+        "metrics": metrics,
+    }
+    text = json.dumps(results, indent=2) + "\n"
+
+    for path in (args.output, args.save_baseline):
+        if path is not None:
+            path.write_text(text, encoding="utf-8")
+
+    baseline = {}
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["metrics"]
+    regressions = compare(metrics, baseline, args.tolerance)
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
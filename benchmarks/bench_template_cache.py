@@ -0,0 +1,69 @@
+"""Benchmark cold vs warm template loading and rendering.
+
+Each iteration builds a fresh Environment, so Jinja's in-memory template
+cache is empty and only the on-disk caches can help:
+
+- cold: no caching, every template is lexed, parsed and compiled
+- bytecode: compiled bytecode is loaded from the user cache directory
+- precompiled: templates are imported from precompiled Python modules
+
+Usage:
+    python benchmarks/bench_template_cache.py [--iterations N]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from unittest.mock import patch
+
+from jinja2 import FileSystemLoader
+
+from fastapi_ms_init import generator
+from fastapi_ms_init.config import ProjectConfig
+from fastapi_ms_init.generator import load_templates, precompile_templates, render_template
+
+CONFIG = ProjectConfig(service_name="bench-service", python_package_name="bench_service")
+
+
+def render_all(use_cache: bool) -> None:
+    """Load a fresh environment and render every template once."""
+    env = load_templates(use_cache=use_cache)
+    for name in FileSystemLoader(str(generator.TEMPLATES_DIR)).list_templates():
+        render_template(env, name, {"config": CONFIG})
+
+
+def measure(label: str, use_cache: bool, iterations: int) -> None:
+    """Time render_all and print summary statistics in milliseconds."""
+    render_all(use_cache)  # populate caches
+    samples = []
+    for _ in range(iterations):
+        start = perf_counter()
+        render_all(use_cache)
+        samples.append((perf_counter() - start) * 1000)
+    print(
+        f"{label:<12} median {statistics.median(samples):7.2f} ms  "
+        f"min {min(samples):7.2f} ms  max {max(samples):7.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["FASTAPI_MS_INIT_CACHE_DIR"] = str(Path(tmp) / "cache")
+        compiled = Path(tmp) / "compiled"
+
+        with patch.object(generator, "PRECOMPILED_DIR", compiled):
+            measure("cold", use_cache=False, iterations=args.iterations)
+            measure("bytecode", use_cache=True, iterations=args.iterations)
+            precompile_templates(compiled)
+            measure("precompiled", use_cache=True, iterations=args.iterations)
+
+
+if __name__ == "__main__":
+    main()
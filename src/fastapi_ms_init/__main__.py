@@ -0,0 +1,26 @@
+"""Console script entrypoint for fastapi-ms-init.
+
+Answers ``--version`` without importing Typer or anything else from the
+CLI; every other invocation is handed to the Typer app.
+"""
+
+import sys
+
+VERSION_ARGS = (["--version"], ["-V"])
+
+
+def run() -> None:
+    """Run the fastapi-ms-init command line."""
+    if sys.argv[1:] in VERSION_ARGS:
+        from fastapi_ms_init import __version__
+
+        print(f"fastapi-ms-init {__version__}")
+        return
+
+    from fastapi_ms_init.cli import app
+
+    app(prog_name="fastapi-ms-init")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,198 @@
+"""Non-interactive batch generation for fastapi-ms-init."""
+
+import json
+import os
+import tomllib
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from fastapi_ms_init.config import ProjectConfig
+from fastapi_ms_init.errors import ManifestError
+from fastapi_ms_init.generator import RenderMemo, generate_project, load_templates
+from fastapi_ms_init.validators import (
+    derive_package_name,
+    is_valid_package_name,
+    is_valid_service_name,
+)
+
+if TYPE_CHECKING:
+    from fastapi_ms_init.output_cache import OutputCache
+
+CONFIG_FIELDS = frozenset(field.name for field in fields(ProjectConfig))
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Outcome of generating a single project in a batch.
+
+    Attributes:
+        service_name: Name of the generated service
+        output_path: Path where the project was generated
+        duration: Wall-clock generation time in seconds
+        error: Error message if generation failed, None on success
+    """
+
+    service_name: str
+    output_path: Path
+    duration: float
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the project was generated successfully."""
+        return self.error is None
+
+
+def config_from_mapping(data: Mapping[str, Any]) -> ProjectConfig:
+    """Build a validated ProjectConfig from a manifest entry.
+
+    The python_package_name is derived from service_name when omitted.
+
+    Args:
+        data: Mapping of ProjectConfig field names to values
+
+    Returns:
+        The validated project configuration
+
+    Raises:
+        ManifestError: If the entry has unknown fields or invalid names
+    """
+    unknown = set(data) - CONFIG_FIELDS
+    if unknown:
+        raise ManifestError(f"Unknown project fields: {', '.join(sorted(unknown))}")
+
+    service_name = data.get("service_name")
+    if not isinstance(service_name, str) or not is_valid_service_name(service_name):
+        raise ManifestError(f"Invalid service name: {service_name!r}")
+
+    values = dict(data)
+    values.setdefault("python_package_name", derive_package_name(service_name))
+    package_name = values["python_package_name"]
+    if not isinstance(package_name, str) or not is_valid_package_name(package_name):
+        raise ManifestError(
+            f"Invalid package name for '{service_name}': {package_name!r}"
+        )
+
+    for name, value in values.items():
+        if name not in ("service_name", "python_package_name") and not isinstance(value, bool):
+            raise ManifestError(f"Field '{name}' of '{service_name}' must be a boolean")
+
+    return ProjectConfig(**values)
+
+
+def _parse_manifest(manifest_path: Path) -> Any:
+    """Parse a manifest file according to its extension."""
+    text = manifest_path.read_text(encoding="utf-8")
+    suffix = manifest_path.suffix.lower()
+
+    if suffix == ".json":
+        return json.loads(text)
+    if suffix == ".toml":
+        return tomllib.loads(text)
+    if suffix in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise ManifestError(
+                "YAML manifests require PyYAML. "
+                "Install it with: pip install 'fastapi-ms-init[yaml]'"
+            ) from None
+        return yaml.safe_load(text)
+
+    raise ManifestError(
+        f"Unsupported manifest format '{suffix}'. Use .json, .toml, .yaml or .yml"
+    )
+
+
+def load_manifest(manifest_path: Path) -> list[ProjectConfig]:
+    """Load project configurations from a batch manifest.
+
+    The manifest is either a list of project entries or a mapping with a
+    ``projects`` list and optional ``defaults`` applied to every entry.
+
+    Args:
+        manifest_path: Path to a JSON, TOML or YAML manifest
+
+    Returns:
+        Project configurations in manifest order
+
+    Raises:
+        ManifestError: If the manifest cannot be parsed or is invalid
+    """
+    try:
+        data = _parse_manifest(manifest_path)
+    except (OSError, ValueError) as e:
+        raise ManifestError(f"Could not read manifest '{manifest_path}': {e}") from e
+
+    defaults: Mapping[str, Any] = {}
+    if isinstance(data, Mapping):
+        defaults = data.get("defaults", {})
+        data = data.get("projects")
+    if not isinstance(data, list) or not isinstance(defaults, Mapping):
+        raise ManifestError(
+            "Manifest must be a list of projects or a mapping with a 'projects' list"
+        )
+
+    configs = []
+    seen: set[str] = set()
+    for entry in data:
+        if not isinstance(entry, Mapping):
+            raise ManifestError(f"Project entry must be a mapping, got: {entry!r}")
+        config = config_from_mapping({**defaults, **entry})
+        if config.service_name in seen:
+            raise ManifestError(f"Duplicate service name: '{config.service_name}'")
+        seen.add(config.service_name)
+        configs.append(config)
+
+    return configs
+
+
+def generate_batch(
+    configs: Iterable[ProjectConfig],
+    output_dir: Path,
+    max_workers: int | None = None,
+    cache: "OutputCache | None" = None,
+) -> list[BatchResult]:
+    """Generate many projects concurrently with a shared template environment.
+
+    Renders are shared through a RenderMemo, so a template whose output
+    depends only on feature flags is rendered once per flag combination
+    rather than once per project.
+
+    With an output cache, projects generated before are copied from it,
+    and the templates are not even loaded when every project is cached.
+
+    A failing project does not stop the batch; its error is recorded in
+    the corresponding result instead.
+
+    Args:
+        configs: Project configurations to generate
+        output_dir: Directory under which each project is created
+        max_workers: Worker pool size (defaults to the CPU count)
+        cache: Output cache shared by the projects of the batch
+
+    Returns:
+        One result per configuration, in input order
+    """
+    configs = list(configs)
+    env = None
+    if cache is None or not all(config in cache for config in configs):
+        env = load_templates()
+    memo = RenderMemo()
+
+    def _generate(config: ProjectConfig) -> BatchResult:
+        output_path = output_dir / config.service_name
+        start = perf_counter()
+        error = None
+        try:
+            generate_project(config, output_path, env=env, memo=memo, cache=cache)
+        except Exception as e:
+            error = str(e)
+        return BatchResult(config.service_name, output_path, perf_counter() - start, error)
+
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+        return list(pool.map(_generate, configs))
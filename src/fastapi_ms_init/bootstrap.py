@@ -0,0 +1,244 @@
+"""Set up a generated project's environment and run its tests.
+
+Bootstrapping takes a freshly generated project to its first passing test
+run: it locks the dependencies, creates a virtualenv, installs the
+project with its dev extra and runs pytest. uv is used when it is on
+PATH, since it resolves, downloads and installs far faster than pip and
+links packages from its global cache instead of copying them. Otherwise
+the standard library venv and pip are used, with a requirements.lock
+produced by pip freeze.
+
+A directory of wheels can serve as a shared local mirror. Online runs
+add the project's locked dependencies and build requirements to it, and
+with offline set nothing is fetched from the package index, so a mirror
+filled once lets every later bootstrap run without network access.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import tomllib
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+
+from fastapi_ms_init.errors import BootstrapError
+
+VENV_DIR = ".venv"
+PIP_LOCK_FILE = "requirements.lock"
+
+# Lines of a failed command's output included in the error
+OUTPUT_TAIL_LINES = 20
+
+
+@dataclass(frozen=True)
+class BootstrapStep:
+    """A command run while bootstrapping.
+
+    Attributes:
+        name: Short description of the step
+        command: Arguments the command was run with
+        duration: Wall-clock time in seconds
+    """
+
+    name: str
+    command: tuple[str, ...]
+    duration: float
+
+
+@dataclass
+class BootstrapReport:
+    """Outcome of bootstrapping a project.
+
+    Attributes:
+        installer: "uv" or "pip"
+        lock_file: Lockfile written or reused, relative to the project
+        steps: Commands run, in order
+        tests_passed: Whether pytest passed, None if it was not run
+        test_output: Tail of the pytest output
+    """
+
+    installer: str
+    lock_file: str
+    steps: list[BootstrapStep] = field(default_factory=list)
+    tests_passed: bool | None = None
+    test_output: str = ""
+
+    @property
+    def elapsed(self) -> float:
+        """Total time of all steps in seconds."""
+        return sum(step.duration for step in self.steps)
+
+    @property
+    def time_to_first_pass(self) -> float | None:
+        """Seconds from the start of bootstrapping to a passing test run."""
+        return self.elapsed if self.tests_passed else None
+
+
+def venv_python(project_path: Path) -> Path:
+    """Return the interpreter of a project's virtualenv."""
+    if sys.platform == "win32":
+        return project_path / VENV_DIR / "Scripts" / "python.exe"
+    return project_path / VENV_DIR / "bin" / "python"
+
+
+def _tail(output: str) -> str:
+    return "\n".join(output.strip().splitlines()[-OUTPUT_TAIL_LINES:])
+
+
+class _Runner:
+    """Run the commands of one bootstrap in a project and time them."""
+
+    def __init__(self, project_path: Path, report: BootstrapReport):
+        self.project_path = project_path
+        self.report = report
+        # Commands must use the project's environment, not the one running the generator
+        self.env = {key: value for key, value in os.environ.items() if key != "VIRTUAL_ENV"}
+
+    def run(self, name: str, command: list[str], check: bool = True) -> subprocess.CompletedProcess:
+        start = perf_counter()
+        try:
+            result = subprocess.run(
+                command,
+                cwd=self.project_path,
+                env=self.env,
+                capture_output=True,
+                text=True,
+            )
+        except OSError as e:
+            raise BootstrapError(f"Could not {name}: {e}") from e
+        self.report.steps.append(BootstrapStep(name, tuple(command), perf_counter() - start))
+        if check and result.returncode != 0:
+            raise BootstrapError(
+                f"Could not {name} (exit code {result.returncode}):\n"
+                f"{_tail(result.stdout + result.stderr)}"
+            )
+        return result
+
+
+def _index_options(wheel_dir: Path | None, offline: bool, installer: str) -> list[str]:
+    options = []
+    if wheel_dir is not None:
+        options += ["--find-links", str(wheel_dir.resolve())]
+    if offline:
+        options.append("--offline" if installer == "uv" else "--no-index")
+    return options
+
+
+def _build_requires(project_path: Path) -> list[str]:
+    try:
+        with open(project_path / "pyproject.toml", "rb") as f:
+            build_system = tomllib.load(f).get("build-system", {})
+    except (OSError, tomllib.TOMLDecodeError):
+        return []
+    return list(build_system.get("requires", []))
+
+
+def _fill_wheel_dir(runner: _Runner, pip: list[str], wheel_dir: Path, requirements: str) -> None:
+    """Build or download wheels of a requirements file into the mirror."""
+    mirror = str(wheel_dir.resolve())
+    runner.run(
+        "fill wheel directory",
+        [
+            *pip,
+            "wheel",
+            "--disable-pip-version-check",
+            "--wheel-dir",
+            mirror,
+            "--find-links",
+            mirror,
+            "-r",
+            requirements,
+            # Installing the project offline needs its build backend too
+            *_build_requires(runner.project_path),
+        ],
+    )
+
+
+def _bootstrap_uv(runner: _Runner, uv: str, wheel_dir: Path | None, offline: bool) -> None:
+    options = _index_options(wheel_dir, offline, "uv")
+    runner.run("lock dependencies", [uv, "lock", *options])
+    # Creates the virtualenv in VENV_DIR as well
+    runner.run("install dependencies", [uv, "sync", "--locked", "--extra", "dev", *options])
+
+    if wheel_dir is not None and not offline:
+        exported = runner.run(
+            "export lockfile",
+            [uv, "export", "--frozen", "--no-hashes", "--extra", "dev", "--no-emit-project"],
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            requirements = Path(tmp) / "requirements.txt"
+            requirements.write_text(exported.stdout, encoding="utf-8")
+            # uv has no wheel command and its virtualenvs have no pip
+            _fill_wheel_dir(runner, [uv, "tool", "run", "pip"], wheel_dir, str(requirements))
+
+
+def _bootstrap_pip(runner: _Runner, wheel_dir: Path | None, offline: bool) -> None:
+    options = _index_options(wheel_dir, offline, "pip")
+    python = str(venv_python(runner.project_path))
+    pip = [python, "-m", "pip", "install", "--disable-pip-version-check", *options]
+
+    runner.run("create virtualenv", [sys.executable, "-m", "venv", VENV_DIR])
+    if (runner.project_path / PIP_LOCK_FILE).exists():
+        runner.run("install dependencies", [*pip, "-r", PIP_LOCK_FILE])
+        runner.run("install project", [*pip, "--no-deps", "-e", "."])
+    else:
+        runner.run("install dependencies", [*pip, "-e", ".[dev]"])
+        frozen = runner.run(
+            "lock dependencies",
+            [python, "-m", "pip", "freeze", "--disable-pip-version-check", "--exclude-editable"],
+        )
+        (runner.project_path / PIP_LOCK_FILE).write_text(frozen.stdout, encoding="utf-8")
+
+    if wheel_dir is not None and not offline:
+        _fill_wheel_dir(runner, [python, "-m", "pip"], wheel_dir, PIP_LOCK_FILE)
+
+
+def bootstrap_project(
+    project_path: Path,
+    wheel_dir: Path | None = None,
+    offline: bool = False,
+    run_tests: bool = True,
+    use_uv: bool = True,
+) -> BootstrapReport:
+    """Lock, install and test a generated project.
+
+    Args:
+        project_path: Root directory of a generated project
+        wheel_dir: Directory of wheels to install from besides the index,
+            filled with the project's locked dependencies unless offline
+        offline: Install only from wheel_dir and the installer's cache
+        run_tests: Run pytest once the environment is ready
+        use_uv: Use uv if it is installed
+
+    Returns:
+        The commands run, their timings and the test outcome
+
+    Raises:
+        BootstrapError: If a step other than the test run fails
+    """
+    if wheel_dir is not None and not wheel_dir.is_dir():
+        raise BootstrapError(f"Wheel directory '{wheel_dir}' does not exist")
+    # Commands run inside the project, so paths to its virtualenv must be absolute
+    project_path = project_path.resolve()
+
+    uv = shutil.which("uv") if use_uv else None
+    if uv is not None:
+        report = BootstrapReport(installer="uv", lock_file="uv.lock")
+        runner = _Runner(project_path, report)
+        _bootstrap_uv(runner, uv, wheel_dir, offline)
+    else:
+        report = BootstrapReport(installer="pip", lock_file=PIP_LOCK_FILE)
+        runner = _Runner(project_path, report)
+        _bootstrap_pip(runner, wheel_dir, offline)
+
+    if run_tests:
+        result = runner.run(
+            "run tests", [str(venv_python(project_path)), "-m", "pytest", "-q"], check=False
+        )
+        report.tests_passed = result.returncode == 0
+        report.test_output = _tail(result.stdout + result.stderr)
+
+    return report
@@ -0,0 +1,51 @@
+"""On-disk caches for fastapi-ms-init."""
+
+import hashlib
+
+from jinja2 import BytecodeCache, Environment, FileSystemBytecodeCache
+from jinja2.bccache import Bucket
+
+from fastapi_ms_init.paths import user_cache_dir
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """Jinja2 bytecode cache keyed on template name and source content.
+
+    Unlike the stock filesystem cache, editing a template produces a new
+    cache entry instead of overwriting the old one, so several template
+    revisions can share the cache directory. Write failures are ignored:
+    a read-only cache only costs a recompile.
+    """
+
+    def get_bucket(
+        self,
+        environment: Environment,
+        name: str,
+        filename: str | None,
+        source: str,
+    ) -> Bucket:
+        checksum = self.get_source_checksum(source)
+        key = hashlib.sha1(f"{name}|{checksum}".encode()).hexdigest()
+        bucket = Bucket(environment, key, checksum)
+        self.load_bytecode(bucket)
+        return bucket
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass
+
+
+def template_bytecode_cache() -> BytecodeCache | None:
+    """Create the bytecode cache in the user cache directory.
+
+    Returns:
+        The bytecode cache, or None if the cache directory is unusable
+    """
+    directory = user_cache_dir() / "jinja"
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return TemplateBytecodeCache(str(directory))
@@ -1,30 +1,57 @@
-"""CLI entrypoint for fastapi-ms-init."""
+"""CLI entrypoint for fastapi-ms-init.
 
+Rich, Jinja2 and the implementation of each command are imported lazily,
+so that ``--help``, ``--version`` and any one command do not pay for
+loading the others.
+"""
+
+from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Annotated
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
 
-from fastapi_ms_init.config import ProjectConfig
+from fastapi_ms_init import __version__
+from fastapi_ms_init.config import FEATURE_FLAGS, ProjectConfig
 from fastapi_ms_init.errors import (
+    BootstrapError,
     InvalidServiceNameError,
+    ManifestError,
     OutputDirectoryExistsError,
     PackageNameConflictError,
+    ProjectStateError,
 )
-from fastapi_ms_init.generator import generate_project
 from fastapi_ms_init.validators import (
     derive_package_name,
     is_valid_package_name,
     is_valid_service_name,
 )
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
 app = typer.Typer(
     name="fastapi-ms-init",
     help="Generate production-ready FastAPI microservice projects",
     add_completion=False,
 )
-console = Console()
+
+
+@lru_cache(maxsize=1)
+def console() -> "Console":
+    """Get the shared Rich console, creating it on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def version_callback(value: bool) -> None:
+    """Print the package version and exit."""
+    if value:
+        typer.echo(f"fastapi-ms-init {__version__}")
+        raise typer.Exit()
 
 
 def validate_service_name(service_name: str) -> str:
@@ -48,10 +75,68 @@ def validate_service_name(service_name: str) -> str:
     return service_name
 
 
-@app.command()
-def main():
+def run_bootstrap(
+    project_path: Path,
+    wheel_dir: Path | None = None,
+    offline: bool = False,
+    run_tests: bool = True,
+) -> None:
+    """Bootstrap a project's environment and print the step timings.
+
+    Raises:
+        BootstrapError: If installing the environment fails
+        typer.Exit: If the tests fail
+    """
+    from fastapi_ms_init.bootstrap import bootstrap_project
+
+    console().print("\n[bold]Bootstrapping environment...[/bold]")
+    report = bootstrap_project(project_path, wheel_dir, offline=offline, run_tests=run_tests)
+
+    for step in report.steps:
+        console().print(f"[green]✓[/green] {step.name:<22} {step.duration:7.2f}s")
+    console().print(f"Installed with {report.installer}, locked in {report.lock_file}")
+
+    if report.tests_passed is False:
+        console().print(report.test_output)
+        console().print(f"[red]✗[/red] Tests failed after {report.elapsed:.2f}s")
+        raise typer.Exit(code=1)
+    if report.time_to_first_pass is not None:
+        console().print(
+            f"[green]✓[/green] Time to first passing pytest: "
+            f"[bold]{report.time_to_first_pass:.2f}s[/bold]"
+        )
+
+
+@app.callback(invoke_without_command=True)
+def main(
+    ctx: typer.Context,
+    version: Annotated[
+        bool,
+        typer.Option(
+            "--version",
+            "-V",
+            callback=version_callback,
+            is_eager=True,
+            help="Show the version and exit.",
+        ),
+    ] = False,
+    bootstrap_env: Annotated[
+        bool,
+        typer.Option(
+            "--bootstrap",
+            help="Install the new project's dependencies and run its tests",
+        ),
+    ] = False,
+):
     """Generate a new FastAPI microservice project."""
-    console.print(
+    if ctx.invoked_subcommand is not None:
+        return
+
+    from rich.panel import Panel
+
+    from fastapi_ms_init.generator import generate_project
+
+    console().print(
         Panel.fit(
             "[bold blue]FastAPI Microservice Generator[/bold blue]\n"
             "Create production-ready FastAPI projects in seconds",
@@ -62,49 +147,74 @@ def main():
     # Prompt for service name with validation
     while True:
         service_name = typer.prompt(
-            "\n[1/5] Service name (e.g., 'my-api-service')",
+            "\n[1/10] Service name (e.g., 'my-api-service')",
             default="my-service",
         )
         try:
             service_name = validate_service_name(service_name)
             break
         except InvalidServiceNameError as e:
-            console.print(f"[red]✗[/red] {e}")
-            console.print("[yellow]Please try again.[/yellow]")
+            console().print(f"[red]✗[/red] {e}")
+            console().print("[yellow]Please try again.[/yellow]")
 
     # Derive and validate package name
     package_name = derive_package_name(service_name)
 
     if not is_valid_package_name(package_name):
-        console.print(
+        console().print(
             f"[red]✗[/red] Package name '{package_name}' conflicts with Python stdlib"
         )
         raise PackageNameConflictError(
             f"Package name '{package_name}' conflicts with Python standard library"
         )
 
-    console.print(f"[green]✓[/green] Python package name: [cyan]{package_name}[/cyan]")
+    console().print(f"[green]✓[/green] Python package name: [cyan]{package_name}[/cyan]")
 
     # Feature prompts for MVP (US1)
-    console.print("\n[bold]Feature Selection[/bold]")
+    console().print("\n[bold]Feature Selection[/bold]")
 
     use_postgres = typer.confirm(
-        "[2/5] Include PostgreSQL support?",
+        "[2/10] Include PostgreSQL support?",
         default=False,
     )
 
     use_redis = typer.confirm(
-        "[3/5] Include Redis support?",
+        "[3/10] Include Redis support?",
+        default=False,
+    )
+
+    use_otel = typer.confirm(
+        "[4/10] Include OpenTelemetry tracing and metrics?",
+        default=False,
+    )
+
+    use_prometheus = typer.confirm(
+        "[5/10] Expose Prometheus metrics?",
+        default=False,
+    )
+
+    use_compression = typer.confirm(
+        "[6/10] Compress responses and support ETags?",
+        default=False,
+    )
+
+    include_background_task = typer.confirm(
+        "[7/10] Include background task queue?",
         default=False,
     )
 
     include_example_route = typer.confirm(
-        "[4/5] Include example API route?",
+        "[8/10] Include example API route?",
+        default=True,
+    )
+
+    use_orjson = typer.confirm(
+        "[9/10] Use orjson for fast JSON encoding?",
         default=True,
     )
 
     generate_docker_compose = typer.confirm(
-        "[5/5] Generate docker-compose.yml?",
+        "[10/10] Generate docker-compose.yml?",
         default=True,
     )
 
@@ -116,10 +226,13 @@ def main():
         use_redis=use_redis,
         use_helm=False,  # Not in US1
         use_dagger=False,  # Not in US1
-        use_otel=False,  # Not in US1
+        use_otel=use_otel,
         include_example_route=include_example_route,
-        include_background_task=False,  # Not in US1
+        include_background_task=include_background_task,
         generate_docker_compose=generate_docker_compose,
+        use_orjson=use_orjson,
+        use_prometheus=use_prometheus,
+        use_compression=use_compression,
     )
 
     # Output path
@@ -127,36 +240,273 @@ def main():
 
     # Generate project
     try:
-        console.print("\n[bold]Generating project...[/bold]")
+        console().print("\n[bold]Generating project...[/bold]")
 
         generate_project(config, output_path)
 
-        console.print("[green]✓[/green] Project generated successfully!\n")
+        console().print("[green]✓[/green] Project generated successfully!\n")
+
+        next_steps = [f"cd {service_name}"]
+        if bootstrap_env:
+            run_bootstrap(output_path)
+            next_steps.append("source .venv/bin/activate  (or .venv\\Scripts\\activate on Windows)")
+        else:
+            next_steps += [
+                "python -m venv .venv && .venv\\Scripts\\activate  (Windows)\n"
+                "     or source .venv/bin/activate  (Linux/Mac)",
+                'pip install -e ".[dev]"',
+            ]
+        next_steps.append("uvicorn app.main:app --reload")
 
         # Success message with next steps
-        console.print(
+        console().print(
             Panel.fit(
                 f"[bold green]Success![/bold green]\n\n"
                 f"Your FastAPI project has been created at: [cyan]{output_path}[/cyan]\n\n"
                 f"[bold]Next steps:[/bold]\n"
-                f"  1. cd {service_name}\n"
-                f"  2. python -m venv .venv && .venv\\Scripts\\activate  (Windows)\n"
-                f"     or source .venv/bin/activate  (Linux/Mac)\n"
-                f"  3. pip install -e \".[dev]\"\n"
-                f"  4. uvicorn app.main:app --reload\n\n"
-                f"Visit http://localhost:8000/docs for API documentation!",
+                + "".join(f"  {number}. {step}\n" for number, step in enumerate(next_steps, 1))
+                + "\nVisit http://localhost:8000/docs for API documentation!",
                 border_style="green",
                 title="🎉 Project Created",
             )
         )
 
-    except OutputDirectoryExistsError as e:
-        console.print(f"[red]✗[/red] {e}")
+    except (OutputDirectoryExistsError, BootstrapError) as e:
+        console().print(f"[red]✗[/red] {e}")
         raise typer.Exit(code=1) from None
+    except typer.Exit:
+        raise
     except Exception as e:
-        console.print(f"[red]✗[/red] Error generating project: {e}")
+        console().print(f"[red]✗[/red] Error generating project: {e}")
         raise typer.Exit(code=1) from e
 
 
+@app.command()
+def batch(
+    manifest: Annotated[
+        Path,
+        typer.Argument(
+            exists=True,
+            dir_okay=False,
+            help="JSON, TOML or YAML manifest of projects to generate",
+        ),
+    ],
+    output_dir: Annotated[
+        Path,
+        typer.Option("--output-dir", "-o", help="Directory under which projects are generated"),
+    ] = Path("."),
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            "-w",
+            min=1,
+            help="Number of concurrent generations (defaults to CPU count)",
+        ),
+    ] = None,
+    use_cache: Annotated[
+        bool,
+        typer.Option(
+            "--cache/--no-cache",
+            help="Reuse projects generated before from the same config and templates",
+        ),
+    ] = True,
+):
+    """Generate projects non-interactively from a manifest."""
+    from rich.table import Table
+
+    from fastapi_ms_init.batch import generate_batch, load_manifest
+    from fastapi_ms_init.output_cache import OutputCache
+
+    try:
+        configs = load_manifest(manifest)
+    except ManifestError as e:
+        console().print(f"[red]✗[/red] {e}")
+        raise typer.Exit(code=1) from None
+
+    console().print(f"[bold]Generating {len(configs)} projects...[/bold]")
+    start = perf_counter()
+    cache = OutputCache() if use_cache else None
+    results = generate_batch(configs, output_dir.resolve(), max_workers=workers, cache=cache)
+    elapsed = perf_counter() - start
+
+    table = Table(title="Batch generation summary")
+    table.add_column("Service", style="cyan")
+    table.add_column("Status")
+    table.add_column("Time (ms)", justify="right")
+    for result in results:
+        status = "[green]✓[/green]" if result.ok else f"[red]✗ {result.error}[/red]"
+        table.add_row(result.service_name, status, f"{result.duration * 1000:.1f}")
+    console().print(table)
+
+    failed = sum(not result.ok for result in results)
+    cached = f" ({cache.hits} from cache)" if cache is not None and cache.hits else ""
+    console().print(
+        f"{len(results) - failed} generated, {failed} failed in {elapsed:.2f}s{cached}"
+    )
+    if failed:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def update(
+    project_path: Annotated[
+        Path,
+        typer.Argument(exists=True, file_okay=False, help="Generated project to update"),
+    ] = Path("."),
+    enable: Annotated[
+        list[str] | None,
+        typer.Option("--enable", help="Feature flag to turn on (repeatable)"),
+    ] = None,
+    disable: Annotated[
+        list[str] | None,
+        typer.Option("--disable", help="Feature flag to turn off (repeatable)"),
+    ] = None,
+    dry_run: Annotated[
+        bool,
+        typer.Option("--dry-run", help="Show what would change without writing"),
+    ] = False,
+):
+    """Re-render changed templates into an existing project."""
+    from fastapi_ms_init.state import read_project_state
+    from fastapi_ms_init.updater import FileStatus, update_project
+
+    flags = dict.fromkeys(enable or [], True) | dict.fromkeys(disable or [], False)
+    unknown = set(flags) - set(FEATURE_FLAGS)
+    if unknown:
+        console().print(
+            f"[red]✗[/red] Unknown feature flags: {', '.join(sorted(unknown))}. "
+            f"Choose from: {', '.join(FEATURE_FLAGS)}"
+        )
+        raise typer.Exit(code=1)
+
+    try:
+        config = replace(read_project_state(project_path).config, **flags)
+        report = update_project(project_path, config, dry_run=dry_run)
+    except ProjectStateError as e:
+        console().print(f"[red]✗[/red] {e}")
+        raise typer.Exit(code=1) from None
+
+    styles = {
+        FileStatus.CREATED: "green",
+        FileStatus.UPDATED: "green",
+        FileStatus.MERGED: "cyan",
+        FileStatus.REMOVED: "yellow",
+        FileStatus.SKIPPED: "dim",
+        FileStatus.CONFLICT: "red",
+    }
+    for file_path, status in sorted(report.files.items()):
+        if status is not FileStatus.UNCHANGED:
+            console().print(f"[{styles[status]}]{status:>9}[/{styles[status]}]  {file_path}")
+
+    prefix = "Would change" if dry_run else "Changed"
+    console().print(
+        f"{prefix} {len(report.changed)} files, {len(report.conflicts)} conflicts"
+    )
+    if report.conflicts:
+        console().print(
+            "[yellow]Conflicting files were left untouched; "
+            "merge the template changes by hand and run update again.[/yellow]"
+        )
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def bootstrap(
+    project_path: Annotated[
+        Path,
+        typer.Argument(exists=True, file_okay=False, help="Generated project to set up"),
+    ] = Path("."),
+    wheel_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--wheel-dir",
+            envvar="FASTAPI_MS_INIT_WHEEL_DIR",
+            file_okay=False,
+            help="Shared directory of wheels to install from, filled on online runs",
+        ),
+    ] = None,
+    offline: Annotated[
+        bool,
+        typer.Option("--offline", help="Install without contacting the package index"),
+    ] = False,
+    run_tests: Annotated[
+        bool,
+        typer.Option("--tests/--no-tests", help="Run pytest once dependencies are installed"),
+    ] = True,
+):
+    """Lock and install a project's dependencies, then run its tests."""
+    try:
+        run_bootstrap(project_path, wheel_dir, offline=offline, run_tests=run_tests)
+    except BootstrapError as e:
+        console().print(f"[red]✗[/red] {e}")
+        raise typer.Exit(code=1) from None
+
+
+@app.command()
+def scan(
+    root: Annotated[
+        Path,
+        typer.Argument(exists=True, file_okay=False, help="Directory tree to search for projects"),
+    ] = Path("."),
+    output: Annotated[
+        Path | None,
+        typer.Option("--output", "-o", dir_okay=False, help="Write the JSON report to a file"),
+    ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option("--workers", "-w", min=1, help="Number of concurrent workers"),
+    ] = None,
+    check: Annotated[
+        bool,
+        typer.Option("--check", help="Exit with an error if any project has drifted"),
+    ] = False,
+):
+    """Report how generated projects differ from the current templates."""
+    from fastapi_ms_init.scanner import scan_projects
+
+    report = scan_projects(root.resolve(), max_workers=workers)
+
+    if output is None:
+        typer.echo(report.to_json(), nl=False)
+    else:
+        output.write_text(report.to_json(), encoding="utf-8")
+        console().print(
+            f"Scanned {len(report.projects)} projects in {report.elapsed:.2f}s: "
+            f"{len(report.drifted)} drifted, {len(report.failed)} failed"
+        )
+
+    if check and (report.drifted or report.failed):
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def serve(
+    host: Annotated[str, typer.Option("--host", help="Address to listen on")] = "127.0.0.1",
+    port: Annotated[int, typer.Option("--port", "-p", help="Port to listen on")] = 8000,
+    max_concurrency: Annotated[
+        int | None,
+        typer.Option(
+            "--max-concurrency",
+            min=1,
+            help="Generations running at once (defaults to CPU count)",
+        ),
+    ] = None,
+):
+    """Serve project generation over HTTP from a warm template engine."""
+    try:
+        import uvicorn
+    except ImportError:
+        console().print(
+            "[red]✗[/red] The server requires uvicorn. "
+            "Install it with: pip install 'fastapi-ms-init\\[server]'"
+        )
+        raise typer.Exit(code=1) from None
+
+    from fastapi_ms_init.server import GenerationServer
+
+    uvicorn.run(GenerationServer(max_concurrency=max_concurrency), host=host, port=port)
+
+
 if __name__ == "__main__":
     app()
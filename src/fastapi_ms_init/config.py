@@ -1,6 +1,6 @@
 """Configuration models for fastapi-ms-init."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
 
 @dataclass(frozen=True)
@@ -18,6 +18,9 @@ class ProjectConfig:
         include_example_route: Include example API route
         include_background_task: Include background task example
         generate_docker_compose: Generate docker-compose.yml
+        use_orjson: Encode responses and decode request bodies with orjson
+        use_prometheus: Expose Prometheus metrics at /metrics
+        use_compression: Compress responses and add ETag helpers
     """
 
     service_name: str
@@ -30,3 +33,10 @@ class ProjectConfig:
     include_example_route: bool = True
     include_background_task: bool = False
     generate_docker_compose: bool = True
+    use_orjson: bool = True
+    use_prometheus: bool = False
+    use_compression: bool = False
+
+
+# Names of the boolean feature toggles of ProjectConfig
+FEATURE_FLAGS = tuple(field.name for field in fields(ProjectConfig) if field.type is bool)
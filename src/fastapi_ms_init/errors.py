@@ -23,3 +23,27 @@ class OutputDirectoryExistsError(Exception):
     """Raised when the output directory already exists."""
 
     pass
+
+
+class ManifestError(Exception):
+    """Raised when a batch manifest cannot be read or is invalid."""
+
+    pass
+
+
+class ProjectStateError(Exception):
+    """Raised when a project's generation state is missing or invalid."""
+
+    pass
+
+
+class TemplateManifestError(Exception):
+    """Raised when the template manifest is invalid."""
+
+    pass
+
+
+class BootstrapError(Exception):
+    """Raised when setting up a generated project's environment fails."""
+
+    pass
@@ -1,12 +1,36 @@
-"""Core project generation logic for fastapi-ms-init."""
+"""Core project generation logic for fastapi-ms-init.
 
-from pathlib import Path
-from typing import Any
+Jinja2 is imported lazily so that importing this module (and therefore the
+CLI) stays cheap; it is only loaded once templates are actually needed.
+"""
 
-from jinja2 import Environment, FileSystemLoader, Template
+import compileall
+import hashlib
+import threading
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from fastapi_ms_init.config import ProjectConfig
 from fastapi_ms_init.errors import OutputDirectoryExistsError
+from fastapi_ms_init.sinks import DirectorySink, OutputSink
+from fastapi_ms_init.state import PROJECT_STATE_FILE, FileState, ProjectState
+from fastapi_ms_init.template_manifest import TemplateEntry, load_template_manifest
+
+if TYPE_CHECKING:
+    from jinja2 import Environment
+
+    from fastapi_ms_init.output_cache import OutputCache
+
+TEMPLATES_DIR = Path(__file__).parent / "templates" / "base"
+PRECOMPILED_DIR = Path(__file__).parent / "templates" / "compiled"
+PRECOMPILED_KEY_FILE = "TEMPLATES_KEY"
+
+# Options shared by every Environment; precompiled modules depend on them
+TEMPLATE_OPTIONS: dict[str, Any] = {"trim_blocks": True, "lstrip_blocks": True}
+
+# Fields that are unique to each project, so output that depends on them is never reused
+IDENTITY_FIELDS = frozenset({"service_name", "python_package_name"})
 
 
 def check_output_directory(output_path: Path) -> None:
@@ -25,23 +49,106 @@ def check_output_directory(output_path: Path) -> None:
         )
 
 
-def load_templates() -> Environment:
+def templates_digest(templates_dir: Path = TEMPLATES_DIR) -> str:
+    """Compute a digest over the names and contents of all templates.
+
+    Args:
+        templates_dir: Root directory of the template tree
+
+    Returns:
+        Hex SHA-256 digest of the template tree
+    """
+    digest = hashlib.sha256()
+    for path in sorted(p for p in templates_dir.rglob("*") if p.is_file()):
+        digest.update(path.relative_to(templates_dir).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def template_hash(template_name: str, depends_on: Iterable[str] = ()) -> str:
+    """Compute the digest of a template source and its dependencies.
+
+    Args:
+        template_name: Name of the template relative to the templates root
+        depends_on: Templates it includes or imports
+
+    Returns:
+        Hex SHA-256 digest of the template files
+    """
+    digest = hashlib.sha256()
+    for name in (template_name, *depends_on):
+        digest.update((TEMPLATES_DIR / name).read_bytes())
+    return digest.hexdigest()
+
+
+def _precompiled_key() -> str:
+    """Key identifying templates compiled from the current sources."""
+    import jinja2
+
+    return f"{templates_digest()} jinja2-{jinja2.__version__}"
+
+
+def _has_precompiled_templates() -> bool:
+    """Check that precompiled modules exist and match the current templates."""
+    key_file = PRECOMPILED_DIR / PRECOMPILED_KEY_FILE
+    try:
+        return key_file.read_text(encoding="utf-8") == _precompiled_key()
+    except OSError:
+        return False
+
+
+def load_templates(use_cache: bool = True) -> "Environment":
     """Load Jinja2 templates from package.
 
+    With caching enabled, templates precompiled by precompile_templates()
+    are used when they match the current sources. Otherwise compiled
+    bytecode is cached in the user cache directory, so only the first
+    load after a template change pays for lexing and compiling.
+
+    Args:
+        use_cache: Use precompiled templates and the bytecode cache
+
     Returns:
         Jinja2 Environment configured with template loader
     """
-    # Get the templates directory relative to this file
-    templates_dir = Path(__file__).parent / "templates" / "base"
+    from jinja2 import BaseLoader, ChoiceLoader, Environment, FileSystemLoader, ModuleLoader
 
-    return Environment(
-        loader=FileSystemLoader(str(templates_dir)),
-        trim_blocks=True,
-        lstrip_blocks=True,
-    )
+    from fastapi_ms_init.cache import template_bytecode_cache
+
+    loader: BaseLoader = FileSystemLoader(str(TEMPLATES_DIR))
+    bytecode_cache = None
+
+    if use_cache:
+        if _has_precompiled_templates():
+            loader = ChoiceLoader([ModuleLoader(str(PRECOMPILED_DIR)), loader])
+        else:
+            bytecode_cache = template_bytecode_cache()
+
+    return Environment(loader=loader, bytecode_cache=bytecode_cache, **TEMPLATE_OPTIONS)
+
+
+def precompile_templates(target_dir: Path = PRECOMPILED_DIR) -> Path:
+    """Compile all templates into Python modules for shipping in a wheel.
+
+    Run this before building a distribution; load_templates() picks the
+    modules up as long as the template sources are unchanged.
+
+    Args:
+        target_dir: Directory to write the compiled modules to
+
+    Returns:
+        The directory containing the compiled modules
+    """
+    env = load_templates(use_cache=False)
+    env.compile_templates(str(target_dir), zip=None, ignore_errors=False)
+    compileall.compile_dir(str(target_dir), quiet=1)
+    (target_dir / PRECOMPILED_KEY_FILE).write_text(_precompiled_key(), encoding="utf-8")
+    return target_dir
 
 
-def render_template(env: Environment, template_name: str, context: dict[str, Any]) -> str:
+def render_template(env: "Environment", template_name: str, context: dict[str, Any]) -> str:
     """Render a template with given context.
 
     Args:
@@ -52,70 +159,210 @@ def render_template(env: Environment, template_name: str, context: dict[str, Any
     Returns:
         Rendered template string
     """
-    template: Template = env.get_template(template_name)
-    return template.render(**context)
+    return env.get_template(template_name).render(**context)
+
+
+def template_config_fields(env: "Environment", template_name: str) -> frozenset[str] | None:
+    """Find the ProjectConfig fields a template reads.
+
+    The template is parsed, along with any template it includes, imports
+    or extends, and every ``config.<field>`` lookup is collected.
+
+    Args:
+        env: Jinja2 Environment used to parse the template
+        template_name: Name of the template relative to the templates root
+
+    Returns:
+        Names of the fields read, or None if the template uses ``config``
+        in a way other than reading a field, such as passing it on whole
+    """
+    from jinja2 import meta, nodes
 
+    source = (TEMPLATES_DIR / template_name).read_text(encoding="utf-8")
+    ast = env.parse(source)
 
-def generate_project(config: ProjectConfig, output_path: Path) -> None:
+    uses = sum(1 for node in ast.find_all(nodes.Name) if node.name == "config")
+    lookups = [
+        node.attr
+        for node in ast.find_all(nodes.Getattr)
+        if isinstance(node.node, nodes.Name) and node.node.name == "config"
+    ]
+    if uses != len(lookups):
+        return None
+
+    fields = set(lookups)
+    for referenced in meta.find_referenced_templates(ast):
+        included = template_config_fields(env, referenced) if referenced else None
+        if included is None:
+            return None
+        fields |= included
+    return frozenset(fields)
+
+
+class RenderMemo:
+    """Reuse rendered templates between projects.
+
+    Each template is analysed once for the config fields it reads. Its
+    output is then memoized under the values of only those fields, so
+    projects that agree on them share a single render: a template that
+    reads no config, or only feature flags, renders once per distinct
+    combination instead of once per project. Templates that read a
+    project's name are rendered every time, since no two projects in a
+    batch share one.
+
+    Safe to share between threads. Keep one memo per Environment: the
+    memo assumes the templates do not change while it is in use.
+    """
+
+    def __init__(self) -> None:
+        self._fields: dict[str, frozenset[str] | None] = {}
+        self._outputs: dict[tuple[str, tuple[Any, ...]], str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _config_fields(self, env: "Environment", template_name: str) -> frozenset[str] | None:
+        try:
+            return self._fields[template_name]
+        except KeyError:
+            fields = template_config_fields(env, template_name)
+            with self._lock:
+                self._fields[template_name] = fields
+            return fields
+
+    def render(self, env: "Environment", template_name: str, config: ProjectConfig) -> str:
+        """Render a template for a configuration, reusing an equal earlier render.
+
+        Args:
+            env: Jinja2 Environment
+            template_name: Name of template file
+            config: Project configuration
+
+        Returns:
+            Rendered template string
+        """
+        context = {"config": config}
+        fields = self._config_fields(env, template_name)
+        if fields is None or fields & IDENTITY_FIELDS:
+            with self._lock:
+                self.misses += 1
+            return render_template(env, template_name, context)
+
+        key = (template_name, tuple(getattr(config, name) for name in sorted(fields)))
+        with self._lock:
+            output = self._outputs.get(key)
+            if output is not None:
+                self.hits += 1
+                return output
+
+        output = render_template(env, template_name, context)
+        with self._lock:
+            self._outputs[key] = output
+            self.misses += 1
+        return output
+
+
+def select_templates(config: ProjectConfig) -> list[TemplateEntry]:
+    """Select the templates to render for a configuration.
+
+    Args:
+        config: Project configuration
+
+    Returns:
+        Template manifest entries to render, in manifest order
+    """
+    return load_template_manifest().select(config)
+
+
+def render_project(
+    config: ProjectConfig,
+    env: "Environment | None" = None,
+    memo: RenderMemo | None = None,
+) -> dict[str, str]:
+    """Render all project files in memory.
+
+    Args:
+        config: Project configuration
+        env: Jinja2 Environment to reuse (loaded from the package if omitted)
+        memo: Memo to reuse renders from, shared by the projects of a batch
+
+    Returns:
+        Mapping of relative output path to rendered content
+    """
+    if env is None:
+        env = load_templates()
+
+    if memo is not None:
+        return {
+            entry.output: memo.render(env, entry.template, config)
+            for entry in select_templates(config)
+        }
+
+    context = {"config": config}
+    return {
+        entry.output: render_template(env, entry.template, context)
+        for entry in select_templates(config)
+    }
+
+
+def build_project_state(config: ProjectConfig, files: Mapping[str, str]) -> ProjectState:
+    """Record how the rendered files were produced.
+
+    Args:
+        config: Project configuration
+        files: Rendered files as returned by render_project()
+
+    Returns:
+        State to store in the generated project for later updates
+    """
+    return ProjectState(
+        config=config,
+        files={
+            entry.output: FileState(
+                template=entry.template,
+                template_hash=template_hash(entry.template, entry.depends_on),
+                content=files[entry.output],
+            )
+            for entry in select_templates(config)
+        },
+    )
+
+
+def generate_project(
+    config: ProjectConfig,
+    output: Path | OutputSink,
+    env: "Environment | None" = None,
+    memo: RenderMemo | None = None,
+    cache: "OutputCache | None" = None,
+) -> None:
     """Generate a FastAPI project based on configuration.
 
     Args:
         config: Project configuration
-        output_path: Path where project will be generated
+        output: Directory to create, or a sink that receives the files
+        env: Jinja2 Environment to reuse (loaded from the package if omitted)
+        memo: Memo to reuse renders from, shared by the projects of a batch
+        cache: Output cache to reuse an identical earlier project from
 
     Raises:
         OutputDirectoryExistsError: If output directory already exists
     """
-    # Check output directory
-    check_output_directory(output_path)
+    if isinstance(output, OutputSink):
+        sink = output
+    else:
+        # Check output directory
+        check_output_directory(output)
+        sink = DirectorySink(output)
 
-    # Load templates
-    env = load_templates()
+    files = cache.get(config) if cache is not None else None
+    if files is None:
+        # Render everything before touching the filesystem
+        files = render_project(config, env, memo)
 
-    # Template context
-    context = {"config": config}
-
-    # Create output directory structure
-    output_path.mkdir(parents=True, exist_ok=True)
-
-    # App structure
-    app_dir = output_path / "app"
-    app_dir.mkdir()
-    (app_dir / "api").mkdir()
-    (app_dir / "core").mkdir()
-
-    # Tests structure
-    tests_dir = output_path / "tests"
-    tests_dir.mkdir()
-
-    # Template file mappings: (template_name, output_path_relative)
-    templates_to_render = [
-        # App files
-        ("app/__init__.py.j2", "app/__init__.py"),
-        ("app/main.py.j2", "app/main.py"),
-        ("app/api/__init__.py.j2", "app/api/__init__.py"),
-        ("app/api/routes.py.j2", "app/api/routes.py"),
-        ("app/core/__init__.py.j2", "app/core/__init__.py"),
-        ("app/core/settings.py.j2", "app/core/settings.py"),
-        ("app/core/logging.py.j2", "app/core/logging.py"),
-        # Test files
-        ("tests/__init__.py.j2", "tests/__init__.py"),
-        ("tests/conftest.py.j2", "tests/conftest.py"),
-        ("tests/test_main.py.j2", "tests/test_main.py"),
-        ("tests/test_routes.py.j2", "tests/test_routes.py"),
-        # Root files
-        ("Dockerfile.j2", "Dockerfile"),
-        ("pyproject.toml.j2", "pyproject.toml"),
-        ("README.md.j2", "README.md"),
-        (".gitignore.j2", ".gitignore"),
-    ]
+        # Record the generation state so the project can be updated later
+        files[PROJECT_STATE_FILE] = build_project_state(config, files).to_json()
 
-    # Conditionally add docker-compose
-    if config.generate_docker_compose:
-        templates_to_render.append(("docker-compose.yml.j2", "docker-compose.yml"))
+        if cache is not None:
+            cache.put(config, files)
 
-    # Render and write all templates
-    for template_name, output_file_path in templates_to_render:
-        rendered_content = render_template(env, template_name, context)
-        output_file = output_path / output_file_path
-        output_file.write_text(rendered_content, encoding="utf-8")
+    sink.write(files)
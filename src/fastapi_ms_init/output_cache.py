@@ -0,0 +1,155 @@
+"""Content-addressed cache of generated projects.
+
+A generated project is fully determined by its ProjectConfig and the
+template tree, so identical requests can reuse an earlier result instead
+of rendering again. Entries are uncompressed tar archives named after a
+digest of both, and the least recently used ones are evicted once the
+cache outgrows its size limit.
+
+This module does not import Jinja2: a cache hit needs neither the
+template engine nor the templates.
+"""
+
+import contextlib
+import dataclasses
+import hashlib
+import io
+import json
+import os
+import tarfile
+import threading
+import uuid
+from collections.abc import Mapping
+from pathlib import Path
+
+from fastapi_ms_init import __version__
+from fastapi_ms_init.config import ProjectConfig
+from fastapi_ms_init.paths import user_cache_dir
+from fastapi_ms_init.template_manifest import TEMPLATE_MANIFEST_PATH
+
+# Size the cache directory may grow to before old entries are evicted
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+ENTRY_SUFFIX = ".tar"
+
+
+class OutputCache:
+    """Size-bounded LRU cache of rendered projects on disk.
+
+    Entries are keyed on the configuration, the template sources and the
+    manifest that selects them, and the generator version, so editing a
+    template never serves a stale project. Reading an entry marks it as
+    recently used. Failures to read or write the cache are treated as
+    misses: a broken cache only costs a render.
+
+    Safe to share between threads. The template digest is computed once
+    per instance, so keep one cache per run of the generator.
+
+    Args:
+        directory: Cache directory (defaults to "projects" in the user cache)
+        max_size: Total size in bytes the entries may occupy
+    """
+
+    def __init__(self, directory: Path | None = None, max_size: int = DEFAULT_MAX_SIZE):
+        self.directory = directory or user_cache_dir() / "projects"
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._digest: str | None = None
+        self._lock = threading.Lock()
+
+    def _templates_digest(self) -> str:
+        if self._digest is None:
+            from fastapi_ms_init import generator
+
+            digest = hashlib.sha256(generator.templates_digest(generator.TEMPLATES_DIR).encode())
+            digest.update(TEMPLATE_MANIFEST_PATH.read_bytes())
+            digest.update(__version__.encode())
+            self._digest = digest.hexdigest()
+        return self._digest
+
+    def key(self, config: ProjectConfig) -> str:
+        """Return the cache key of a configuration under the current templates."""
+        fields = json.dumps(dataclasses.asdict(config), sort_keys=True)
+        return hashlib.sha256(f"{self._templates_digest()}\0{fields}".encode()).hexdigest()
+
+    def _path(self, config: ProjectConfig) -> Path:
+        return self.directory / f"{self.key(config)}{ENTRY_SUFFIX}"
+
+    def __contains__(self, config: ProjectConfig) -> bool:
+        return self._path(config).is_file()
+
+    def get(self, config: ProjectConfig) -> dict[str, str] | None:
+        """Look up the files generated for a configuration.
+
+        Args:
+            config: Project configuration
+
+        Returns:
+            Mapping of relative output path to content, or None on a miss
+        """
+        path = self._path(config)
+        try:
+            with tarfile.open(path, "r:") as archive:
+                files = {
+                    member.name: archive.extractfile(member).read().decode("utf-8")
+                    for member in archive
+                    if member.isfile()
+                }
+        except (OSError, tarfile.TarError, UnicodeDecodeError):
+            with self._lock:
+                self.misses += 1
+            return None
+        # Refreshing the LRU position is best effort; the entry was read either way
+        with contextlib.suppress(OSError):
+            os.utime(path)
+
+        with self._lock:
+            self.hits += 1
+        return files
+
+    def put(self, config: ProjectConfig, files: Mapping[str, str]) -> None:
+        """Store the files generated for a configuration, then evict old entries.
+
+        Args:
+            config: Project configuration
+            files: Mapping of relative output path to content
+        """
+        path = self._path(config)
+        staging_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with tarfile.open(staging_path, "w:") as archive:
+                for file_path, content in sorted(files.items()):
+                    data = content.encode("utf-8")
+                    info = tarfile.TarInfo(file_path)
+                    info.size = len(data)
+                    archive.addfile(info, io.BytesIO(data))
+            staging_path.replace(path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                staging_path.unlink(missing_ok=True)
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits max_size."""
+        entries = []
+        try:
+            with os.scandir(self.directory) as scan:
+                for entry in scan:
+                    if entry.name.endswith(ENTRY_SUFFIX):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            return
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                os.unlink(entry_path)
+            except OSError:
+                continue
+            total -= size
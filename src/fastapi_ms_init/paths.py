@@ -0,0 +1,35 @@
+"""Filesystem locations used by fastapi-ms-init.
+
+Kept free of third-party imports, so that code which only needs a
+location, such as a cache lookup, stays cheap to import.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from fastapi_ms_init import __version__
+
+CACHE_DIR_ENV_VAR = "FASTAPI_MS_INIT_CACHE_DIR"
+
+
+def user_cache_dir() -> Path:
+    """Return the versioned per-user cache directory.
+
+    The location can be overridden with the FASTAPI_MS_INIT_CACHE_DIR
+    environment variable. Otherwise the platform cache location is used
+    (LOCALAPPDATA on Windows, XDG_CACHE_HOME or ~/.cache elsewhere).
+
+    Returns:
+        Cache directory specific to the installed package version
+    """
+    override = os.environ.get(CACHE_DIR_ENV_VAR)
+    if override:
+        base = Path(override)
+    elif sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA", Path.home())) / "fastapi-ms-init"
+    else:
+        xdg_cache = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        base = Path(xdg_cache) / "fastapi-ms-init"
+
+    return base / __version__
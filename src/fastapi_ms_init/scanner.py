@@ -0,0 +1,362 @@
+"""Drift detection across a fleet of generated projects."""
+
+import hashlib
+import json
+import mmap
+import os
+import tomllib
+from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from enum import StrEnum
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from fastapi_ms_init import __version__
+from fastapi_ms_init.config import FEATURE_FLAGS, ProjectConfig
+from fastapi_ms_init.errors import ProjectStateError
+from fastapi_ms_init.generator import RenderMemo, load_templates, render_project, templates_digest
+from fastapi_ms_init.state import PROJECT_STATE_FILE, ProjectState, read_project_state
+from fastapi_ms_init.template_manifest import load_template_manifest
+
+if TYPE_CHECKING:
+    from jinja2 import Environment
+
+# Directories never searched for projects
+SKIP_DIRS = frozenset(
+    {".git", ".hg", ".svn", ".venv", "venv", "node_modules", "__pycache__", ".tox", ".nox"}
+)
+
+# Files at least this large are hashed through a memory map instead of being read
+MMAP_MINIMUM_SIZE = 1024 * 1024
+
+# pyproject.toml description of generated projects, after the service name
+PYPROJECT_DESCRIPTION_SUFFIX = " - FastAPI microservice"
+
+
+class DriftStatus(StrEnum):
+    """How a project file compares with the current templates."""
+
+    CURRENT = "current"
+    OUTDATED = "outdated"
+    MODIFIED = "modified"
+    MISSING = "missing"
+    OBSOLETE = "obsolete"
+
+
+def hash_file(path: Path) -> str:
+    """Return the hex SHA-256 digest of a file without loading it whole.
+
+    Large files are hashed through a memory map, others in chunks.
+    """
+    with path.open("rb") as file:
+        if os.fstat(file.fileno()).st_size < MMAP_MINIMUM_SIZE:
+            return hashlib.file_digest(file, "sha256").hexdigest()
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha256(mapped).hexdigest()
+
+
+def _is_generated_pyproject(path: Path) -> bool:
+    try:
+        data = tomllib.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    description = data.get("project", {}).get("description", "")
+    return isinstance(description, str) and description.endswith(PYPROJECT_DESCRIPTION_SUFFIX)
+
+
+def _inspect_directory(path: Path) -> tuple[bool, list[Path]]:
+    """Check whether a directory is a generated project and list its subdirectories."""
+    names = set()
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                names.add(entry.name)
+                if entry.name not in SKIP_DIRS and entry.is_dir(follow_symlinks=False):
+                    subdirs.append(Path(entry.path))
+    except OSError:
+        return False, []
+
+    if PROJECT_STATE_FILE in names:
+        return True, []
+    if (
+        "pyproject.toml" in names
+        and (path / "app" / "main.py").is_file()
+        and _is_generated_pyproject(path / "pyproject.toml")
+    ):
+        return True, []
+    return False, subdirs
+
+
+def find_projects(root: Path, max_workers: int | None = None) -> list[Path]:
+    """Find generated projects under a directory.
+
+    Directories are listed concurrently. A project's own directories are
+    not searched, nor are VCS, virtualenv and cache directories.
+
+    Args:
+        root: Directory to search
+        max_workers: Number of directories listed at once
+
+    Returns:
+        Project root directories, sorted
+    """
+    projects = []
+    with ThreadPoolExecutor(max_workers=max_workers or _default_workers()) as pool:
+        pending: set[Future[tuple[bool, list[Path]]]] = set()
+        paths = {pool.submit(_inspect_directory, root): root}
+        pending.update(paths)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                is_project, subdirs = future.result()
+                if is_project:
+                    projects.append(paths.pop(future))
+                    continue
+                paths.pop(future)
+                for subdir in subdirs:
+                    child = pool.submit(_inspect_directory, subdir)
+                    paths[child] = subdir
+                    pending.add(child)
+    return sorted(projects)
+
+
+def infer_config(project_path: Path) -> ProjectConfig:
+    """Reconstruct the configuration of a project that has no recorded state.
+
+    Names come from pyproject.toml. A feature flag is taken to be on when
+    a file that is only generated with that flag exists; flags without
+    such a file keep their defaults.
+
+    Args:
+        project_path: Root directory of a generated project
+
+    Returns:
+        The inferred configuration
+
+    Raises:
+        ProjectStateError: If the project was not generated by fastapi-ms-init
+    """
+    try:
+        project = tomllib.loads((project_path / "pyproject.toml").read_text(encoding="utf-8"))
+        package_name = project["project"]["name"]
+        description = project["project"]["description"]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        raise ProjectStateError(f"Cannot infer the configuration of '{project_path}': {e}") from e
+    if not description.endswith(PYPROJECT_DESCRIPTION_SUFFIX):
+        raise ProjectStateError(f"'{project_path}' was not generated by fastapi-ms-init")
+
+    flags: dict[str, bool] = {}
+    for entry in load_template_manifest().entries:
+        if len(entry.when) == 1:
+            flag, value = entry.when[0]
+            if (project_path / entry.output).exists():
+                flags[flag] = value
+            elif flag not in flags:
+                flags[flag] = not value
+
+    return ProjectConfig(
+        service_name=description.removesuffix(PYPROJECT_DESCRIPTION_SUFFIX),
+        python_package_name=package_name,
+        **{flag: value for flag, value in flags.items() if flag in FEATURE_FLAGS},
+    )
+
+
+@dataclass
+class ProjectDrift:
+    """Drift of one project from the current templates.
+
+    Attributes:
+        path: Root directory of the project
+        service_name: Name of the service, if known
+        config_source: "state" if read from the project, "inferred" otherwise
+        generator_version: Version that last generated the project, if recorded
+        files: Status of every file compared, keyed by relative path
+        error: Why the project could not be scanned, None on success
+    """
+
+    path: Path
+    service_name: str | None = None
+    config_source: str | None = None
+    generator_version: str | None = None
+    files: dict[str, DriftStatus] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def drifted(self) -> bool:
+        """Whether any file differs from what the current templates produce."""
+        return any(status is not DriftStatus.CURRENT for status in self.files.values())
+
+    def to_dict(self, root: Path) -> dict[str, Any]:
+        """Summarize the project for the JSON report, listing only drifted files."""
+        return {
+            "path": self.path.relative_to(root).as_posix() or ".",
+            "service_name": self.service_name,
+            "config_source": self.config_source,
+            "generator_version": self.generator_version,
+            "drifted": self.drifted,
+            "error": self.error,
+            "counts": dict(Counter(str(status) for status in self.files.values())),
+            "files": {
+                path: str(status)
+                for path, status in sorted(self.files.items())
+                if status is not DriftStatus.CURRENT
+            },
+        }
+
+
+@dataclass
+class ScanReport:
+    """Outcome of scanning a directory tree for drift.
+
+    Attributes:
+        root: Directory that was scanned
+        projects: Drift of every project found
+        elapsed: Wall-clock scan time in seconds
+    """
+
+    root: Path
+    projects: list[ProjectDrift] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def drifted(self) -> list[ProjectDrift]:
+        """Projects with at least one file that differs from the templates."""
+        return [project for project in self.projects if project.drifted]
+
+    @property
+    def failed(self) -> list[ProjectDrift]:
+        """Projects that could not be scanned."""
+        return [project for project in self.projects if project.error is not None]
+
+    def to_json(self) -> str:
+        """Serialize the report to JSON."""
+        data = {
+            "generator_version": __version__,
+            "templates_digest": templates_digest(),
+            "root": str(self.root),
+            "elapsed_s": round(self.elapsed, 3),
+            "summary": {
+                "projects": len(self.projects),
+                "drifted": len(self.drifted),
+                "failed": len(self.failed),
+            },
+            "projects": [project.to_dict(self.root) for project in self.projects],
+        }
+        return json.dumps(data, indent=2) + "\n"
+
+
+def _file_status(
+    project_path: Path,
+    output_file_path: str,
+    expected_hash: str,
+    state: ProjectState | None,
+) -> DriftStatus:
+    """Compare a file on disk with its current render and its recorded content."""
+    try:
+        actual_hash = hash_file(project_path / output_file_path)
+    except FileNotFoundError:
+        return DriftStatus.MISSING
+    if actual_hash == expected_hash:
+        return DriftStatus.CURRENT
+
+    previous = state.files.get(output_file_path) if state is not None else None
+    if previous is not None and actual_hash == previous.content_hash:
+        # Untouched since generation; the templates moved on
+        return DriftStatus.OUTDATED
+    return DriftStatus.MODIFIED
+
+
+def scan_project(
+    project_path: Path,
+    env: "Environment | None" = None,
+    memo: RenderMemo | None = None,
+) -> ProjectDrift:
+    """Compare a project's files with what the current templates produce.
+
+    The configuration is read from the project's recorded state, or
+    inferred when there is none. Templates are rendered in memory and
+    compared by hash with the files on disk. Files whose content still
+    matches the recorded generation are reported as outdated, other
+    differences as modified.
+
+    Args:
+        project_path: Root directory of a generated project
+        env: Jinja2 Environment to reuse (loaded from the package if omitted)
+        memo: Memo to reuse renders from, shared by the projects of a scan
+
+    Returns:
+        Per-file drift of the project
+    """
+    drift = ProjectDrift(project_path)
+    state: ProjectState | None = None
+    try:
+        if (project_path / PROJECT_STATE_FILE).exists():
+            state = read_project_state(project_path)
+            config = state.config
+            drift.config_source = "state"
+            drift.generator_version = state.generator_version
+        else:
+            config = infer_config(project_path)
+            drift.config_source = "inferred"
+    except (ProjectStateError, OSError) as e:
+        drift.error = str(e)
+        return drift
+    drift.service_name = config.service_name
+
+    try:
+        for output_file_path, content in render_project(config, env, memo).items():
+            expected_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+            drift.files[output_file_path] = _file_status(
+                project_path, output_file_path, expected_hash, state
+            )
+    except OSError as e:
+        # An unreadable file fails this project, not the whole scan
+        drift.error = str(e)
+        return drift
+
+    # Files the recorded generation wrote that the current templates no longer produce
+    if state is not None:
+        for output_file_path in state.files.keys() - drift.files.keys():
+            if (project_path / output_file_path).exists():
+                drift.files[output_file_path] = DriftStatus.OBSOLETE
+
+    return drift
+
+
+def scan_projects(
+    root: Path,
+    projects: Iterable[Path] | None = None,
+    max_workers: int | None = None,
+) -> ScanReport:
+    """Scan every generated project under a directory for drift.
+
+    Projects are scanned concurrently, sharing one template environment
+    and render memo.
+
+    Args:
+        root: Directory to search for projects
+        projects: Project directories to scan (found under root if omitted)
+        max_workers: Worker pool size (defaults to a few more than the CPU count)
+
+    Returns:
+        Drift of every project, sorted by path
+    """
+    start = perf_counter()
+    if projects is None:
+        projects = find_projects(root, max_workers)
+    env = load_templates()
+    memo = RenderMemo()
+
+    with ThreadPoolExecutor(max_workers=max_workers or _default_workers()) as pool:
+        results = list(pool.map(lambda path: scan_project(path, env, memo), sorted(projects)))
+
+    return ScanReport(root, results, perf_counter() - start)
+
+
+def _default_workers() -> int:
+    # Scanning is mostly file system I/O, so use more threads than CPUs
+    return min(32, (os.cpu_count() or 1) + 4)
@@ -0,0 +1,309 @@
+"""Long-running generation server with a warm template engine.
+
+Every CLI invocation pays for interpreter startup and template loading.
+The server pays for them once: it keeps a single Jinja2 Environment with
+every template compiled, and a render memo shared by all requests, so a
+project is generated in milliseconds.
+
+The server is a plain ASGI application with no web framework. Run it with
+``fastapi-ms-init serve``, which needs the ``server`` extra (uvicorn), or
+mount it in any ASGI server:
+
+    POST /projects   ProjectConfig fields as JSON; responds with the
+                     generated project as a streamed .tar.gz
+    GET  /health     Liveness check
+    GET  /metrics    Request counts and latency percentiles as JSON
+"""
+
+import asyncio
+import gzip
+import json
+import os
+import threading
+from collections import deque
+from collections.abc import Awaitable, Callable, MutableMapping
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from fastapi_ms_init.batch import config_from_mapping
+from fastapi_ms_init.config import ProjectConfig
+from fastapi_ms_init.errors import ManifestError
+from fastapi_ms_init.generator import RenderMemo, generate_project, load_templates
+from fastapi_ms_init.sinks import TarSink
+from fastapi_ms_init.template_manifest import load_template_manifest
+
+if TYPE_CHECKING:
+    from jinja2 import Environment
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+# Largest accepted request body; a ProjectConfig is a few hundred bytes
+MAX_BODY_SIZE = 64 * 1024
+
+# Archive bytes are sent to the client in chunks of this size
+CHUNK_SIZE = 64 * 1024
+
+# Number of recent request latencies kept for percentiles
+LATENCY_WINDOW = 1024
+
+
+class ServerMetrics:
+    """Request counters and latencies of a server.
+
+    Only updated from the event loop, so no locking is needed.
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        self.requests = 0
+        self.generated = 0
+        self.rejected = 0
+        self.failed = 0
+        self.in_flight = 0
+        self.latencies: deque[float] = deque(maxlen=window)
+
+    def observe(self, seconds: float) -> None:
+        """Record the latency of a generation request."""
+        self.latencies.append(seconds)
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return a latency percentile in seconds over the recent window."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarize the metrics for the /metrics endpoint."""
+
+        def ms(value: float | None) -> float | None:
+            return None if value is None else round(value * 1000, 3)
+
+        return {
+            "requests": self.requests,
+            "generated": self.generated,
+            "rejected": self.rejected,
+            "failed": self.failed,
+            "in_flight": self.in_flight,
+            "latency_ms": {
+                "p50": ms(self.percentile(0.50)),
+                "p95": ms(self.percentile(0.95)),
+                "p99": ms(self.percentile(0.99)),
+                "max": ms(max(self.latencies, default=None)),
+            },
+        }
+
+
+class _ResponseWriter:
+    """Binary file object that streams an archive into an ASGI response.
+
+    Written to from a worker thread. The response headers go out with the
+    first chunk, so a failure before any output can still be answered
+    with an error status.
+    """
+
+    def __init__(
+        self,
+        send: Send,
+        loop: asyncio.AbstractEventLoop,
+        headers: list[tuple[bytes, bytes]],
+        start: float,
+    ):
+        self.send = send
+        self.loop = loop
+        self.headers = headers
+        self.start = start
+        self.started = False
+        self._buffer = bytearray()
+
+    def _send(self, message: Message) -> None:
+        asyncio.run_coroutine_threadsafe(self.send(message), self.loop).result()
+
+    def _send_body(self, more_body: bool) -> None:
+        if not self.started:
+            timing = f"generate;dur={(perf_counter() - self.start) * 1000:.2f}"
+            self._send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [*self.headers, (b"server-timing", timing.encode())],
+                }
+            )
+            self.started = True
+        body = bytes(self._buffer)
+        self._buffer.clear()
+        self._send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        if len(self._buffer) >= CHUNK_SIZE:
+            self._send_body(more_body=True)
+        return len(data)
+
+    def close(self) -> None:
+        """Send the remaining bytes and end the response."""
+        self._send_body(more_body=False)
+
+
+async def _send_json(send: Send, status: int, data: Any, headers: list | None = None) -> None:
+    body = json.dumps(data).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                *(headers or []),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _read_body(receive: Receive) -> bytes | None:
+    """Read the request body, or return None if it exceeds MAX_BODY_SIZE."""
+    body = bytearray()
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return bytes(body)
+        body += message.get("body", b"")
+        if len(body) > MAX_BODY_SIZE:
+            return None
+        if not message.get("more_body", False):
+            return bytes(body)
+
+
+class GenerationServer:
+    """ASGI application that generates projects on request.
+
+    Args:
+        max_concurrency: Generations running at once (defaults to the CPU count)
+        queue_timeout: Seconds a request waits for a free slot before 503
+        env: Jinja2 Environment to use (loaded from the package if omitted)
+        gzip_level: Archive compression level, 1-9; level 1 takes half
+            the time of tarfile's fixed level 9 for a slightly larger archive
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        queue_timeout: float = 1.0,
+        env: "Environment | None" = None,
+        gzip_level: int = 1,
+    ):
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self.queue_timeout = queue_timeout
+        self.env = env
+        self.gzip_level = gzip_level
+        self.memo = RenderMemo()
+        self.metrics = ServerMetrics()
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        self._warm_lock = threading.Lock()
+        self._warm = False
+
+    def warm(self) -> None:
+        """Load the Environment and compile every template, once."""
+        with self._warm_lock:
+            if self._warm:
+                return
+            if self.env is None:
+                self.env = load_templates()
+            # Templates do not change under a running server; skip per-render mtime checks
+            self.env.auto_reload = False
+            for entry in load_template_manifest().entries:
+                self.env.get_template(entry.template)
+            self._warm = True
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        route = (scope["method"], scope["path"])
+        if route == ("POST", "/projects"):
+            await self._generate(receive, send)
+        elif route == ("GET", "/health"):
+            await _send_json(send, 200, {"status": "ok"})
+        elif route == ("GET", "/metrics"):
+            await _send_json(send, 200, self.metrics.to_dict())
+        elif scope["path"] in ("/projects", "/health", "/metrics"):
+            await _send_json(send, 405, {"detail": "Method Not Allowed"})
+        else:
+            await _send_json(send, 404, {"detail": "Not Found"})
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await asyncio.to_thread(self.warm)
+                except Exception as e:
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _generate(self, receive: Receive, send: Send) -> None:
+        start = perf_counter()
+        self.metrics.requests += 1
+
+        body = await _read_body(receive)
+        if body is None:
+            await _send_json(send, 413, {"detail": "Request body too large"})
+            return
+        try:
+            data = json.loads(body)
+            if not isinstance(data, dict):
+                raise ManifestError("Expected a JSON object of ProjectConfig fields")
+            config = config_from_mapping(data)
+        except (ValueError, ManifestError) as e:
+            await _send_json(send, 400, {"detail": str(e)})
+            return
+
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+        except TimeoutError:
+            self.metrics.rejected += 1
+            await _send_json(send, 503, {"detail": "Server busy"}, [(b"retry-after", b"1")])
+            return
+
+        self.metrics.in_flight += 1
+        filename = f"{config.service_name}.tar.gz"
+        writer = _ResponseWriter(
+            send,
+            asyncio.get_running_loop(),
+            [
+                (b"content-type", b"application/gzip"),
+                (b"content-disposition", f'attachment; filename="{filename}"'.encode()),
+            ],
+            start,
+        )
+        try:
+            await asyncio.to_thread(self._write_archive, config, writer)
+        except Exception as e:
+            self.metrics.failed += 1
+            if writer.started:
+                raise
+            await _send_json(send, 500, {"detail": f"Generation failed: {e}"})
+            return
+        finally:
+            self.metrics.in_flight -= 1
+            self._slots.release()
+
+        self.metrics.generated += 1
+        self.metrics.observe(perf_counter() - start)
+
+    def _write_archive(self, config: ProjectConfig, writer: _ResponseWriter) -> None:
+        self.warm()
+        with gzip.GzipFile(fileobj=writer, mode="wb", compresslevel=self.gzip_level) as archive:
+            sink = TarSink(archive, prefix=config.service_name, compression="")
+            generate_project(config, sink, self.env, self.memo)
+        writer.close()
@@ -0,0 +1,173 @@
+"""Output sinks that receive rendered projects.
+
+A sink gets the complete set of rendered files in one call, so every
+backend can emit the project in a single pass: atomically on disk, into a
+dictionary, or as an archive streamed to any writable binary file object.
+"""
+
+import io
+import shutil
+import tarfile
+import time
+import uuid
+import zipfile
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, Literal
+
+from fastapi_ms_init.errors import OutputDirectoryExistsError
+
+FILE_MODE = 0o644
+DIRECTORY_MODE = 0o755
+
+
+def project_directories(files: Iterable[str]) -> list[str]:
+    """Compute the directories needed to hold the given files.
+
+    Args:
+        files: Relative POSIX paths of the project files
+
+    Returns:
+        Relative directory paths, parents before children
+    """
+    directories = set()
+    for file_path in files:
+        directories.update(str(parent) for parent in PurePosixPath(file_path).parents)
+    directories.discard(".")
+    return sorted(directories, key=lambda d: (d.count("/"), d))
+
+
+def write_project(
+    files: Mapping[str, str],
+    output_path: Path,
+    max_workers: int | None = None,
+) -> None:
+    """Atomically write rendered files as a new project directory.
+
+    Files are written concurrently into a staging directory next to
+    output_path, which is renamed into place once every write succeeded.
+    A failure removes the staging directory, so no partial project is
+    ever left behind.
+
+    Args:
+        files: Mapping of relative output path to file content
+        output_path: Path where project will be created
+        max_workers: Size of the writer thread pool
+
+    Raises:
+        OutputDirectoryExistsError: If output_path appeared in the meantime
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    staging_path = output_path.with_name(f".{output_path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    staging_path.mkdir()
+
+    try:
+        for directory in project_directories(files):
+            (staging_path / directory).mkdir()
+
+        def _write(item: tuple[str, str]) -> None:
+            file_path, content = item
+            (staging_path / file_path).write_text(content, encoding="utf-8")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            # Consume the iterator so that write errors are raised here
+            list(pool.map(_write, files.items()))
+
+        try:
+            staging_path.rename(output_path)
+        except OSError as e:
+            if output_path.exists():
+                raise OutputDirectoryExistsError(
+                    f"Directory '{output_path}' was created during generation."
+                ) from e
+            raise
+    except BaseException:
+        shutil.rmtree(staging_path, ignore_errors=True)
+        raise
+
+
+class OutputSink(ABC):
+    """Destination for a generated project."""
+
+    @abstractmethod
+    def write(self, files: Mapping[str, str]) -> None:
+        """Emit a complete project.
+
+        Args:
+            files: Mapping of relative POSIX path to file content
+        """
+
+
+class DirectorySink(OutputSink):
+    """Write the project as a new directory on disk, atomically."""
+
+    def __init__(self, path: Path, max_workers: int | None = None):
+        self.path = path
+        self.max_workers = max_workers
+
+    def write(self, files: Mapping[str, str]) -> None:
+        write_project(files, self.path, max_workers=self.max_workers)
+
+
+class MemorySink(OutputSink):
+    """Collect the project in memory as a mapping of path to bytes."""
+
+    def __init__(self) -> None:
+        self.files: dict[str, bytes] = {}
+
+    def write(self, files: Mapping[str, str]) -> None:
+        self.files.update((path, content.encode("utf-8")) for path, content in files.items())
+
+
+class TarSink(OutputSink):
+    """Stream the project as a tar archive into a binary file object.
+
+    The archive is written in streaming mode, so fileobj does not need to
+    be seekable (e.g. a socket or an HTTP response body).
+    """
+
+    def __init__(
+        self,
+        fileobj: BinaryIO,
+        prefix: str = "",
+        compression: Literal["", "gz", "bz2", "xz"] = "gz",
+    ):
+        self.fileobj = fileobj
+        self.prefix = prefix
+        self.compression = compression
+
+    def write(self, files: Mapping[str, str]) -> None:
+        mtime = int(time.time())
+        with tarfile.open(fileobj=self.fileobj, mode=f"w|{self.compression}") as tar:
+            for directory in project_directories(files):
+                info = tarfile.TarInfo(str(PurePosixPath(self.prefix, directory)))
+                info.type = tarfile.DIRTYPE
+                info.mode = DIRECTORY_MODE
+                info.mtime = mtime
+                tar.addfile(info)
+            for file_path, content in sorted(files.items()):
+                data = content.encode("utf-8")
+                info = tarfile.TarInfo(str(PurePosixPath(self.prefix, file_path)))
+                info.size = len(data)
+                info.mode = FILE_MODE
+                info.mtime = mtime
+                tar.addfile(info, io.BytesIO(data))
+
+
+class ZipSink(OutputSink):
+    """Write the project as a zip archive into a binary file object."""
+
+    def __init__(self, fileobj: BinaryIO, prefix: str = ""):
+        self.fileobj = fileobj
+        self.prefix = prefix
+
+    def write(self, files: Mapping[str, str]) -> None:
+        date_time = time.localtime()[:6]
+        with zipfile.ZipFile(self.fileobj, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for file_path, content in sorted(files.items()):
+                info = zipfile.ZipInfo(str(PurePosixPath(self.prefix, file_path)), date_time)
+                info.external_attr = FILE_MODE << 16
+                info.compress_type = zipfile.ZIP_DEFLATED
+                archive.writestr(info, content.encode("utf-8"))
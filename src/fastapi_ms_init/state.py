@@ -0,0 +1,123 @@
+"""Generation state recorded inside generated projects."""
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+
+from fastapi_ms_init import __version__
+from fastapi_ms_init.config import ProjectConfig
+from fastapi_ms_init.errors import ProjectStateError
+
+PROJECT_STATE_FILE = ".fastapi-ms-init.json"
+STATE_FORMAT_VERSION = 1
+
+
+def hash_text(content: str) -> str:
+    """Return the hex SHA-256 digest of a text."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class FileState:
+    """Generation record of a single output file.
+
+    Attributes:
+        template: Name of the template the file was rendered from
+        template_hash: Digest of the template source at render time
+        content: Rendered content, the merge base for later updates
+    """
+
+    template: str
+    template_hash: str
+    content: str
+
+    @property
+    def content_hash(self) -> str:
+        """Digest of the rendered content."""
+        return hash_text(self.content)
+
+
+@dataclass(frozen=True)
+class ProjectState:
+    """Everything needed to update a generated project later.
+
+    Attributes:
+        config: Configuration the project was generated with
+        files: File records keyed by relative output path
+        generator_version: fastapi-ms-init version that wrote the state
+    """
+
+    config: ProjectConfig
+    files: dict[str, FileState]
+    generator_version: str = __version__
+
+    def to_json(self) -> str:
+        """Serialize the state to JSON."""
+        data = {
+            "format": STATE_FORMAT_VERSION,
+            "generator_version": self.generator_version,
+            "config": asdict(self.config),
+            "files": {
+                path: {**asdict(record), "content_hash": record.content_hash}
+                for path, record in sorted(self.files.items())
+            },
+        }
+        return json.dumps(data, indent=2) + "\n"
+
+    @classmethod
+    def from_json(cls, text: str) -> "ProjectState":
+        """Deserialize a state written by to_json().
+
+        Raises:
+            ProjectStateError: If the state is malformed or unsupported
+        """
+        try:
+            data = json.loads(text)
+            if data["format"] != STATE_FORMAT_VERSION:
+                raise ProjectStateError(f"Unsupported state format: {data['format']!r}")
+            config_fields = {field.name for field in fields(ProjectConfig)}
+            unknown = set(data["config"]) - config_fields
+            if unknown:
+                raise ProjectStateError(
+                    f"Unknown config fields in state: {', '.join(sorted(unknown))}"
+                )
+            return cls(
+                config=ProjectConfig(**data["config"]),
+                files={
+                    path: FileState(
+                        template=record["template"],
+                        template_hash=record["template_hash"],
+                        content=record["content"],
+                    )
+                    for path, record in data["files"].items()
+                },
+                generator_version=data["generator_version"],
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            raise ProjectStateError(f"Invalid project state: {e}") from e
+
+
+def read_project_state(project_path: Path) -> ProjectState:
+    """Read the generation state of a project.
+
+    Args:
+        project_path: Root directory of a generated project
+
+    Returns:
+        The recorded project state
+
+    Raises:
+        ProjectStateError: If the state file is missing or invalid
+    """
+    state_file = project_path / PROJECT_STATE_FILE
+    try:
+        text = state_file.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        raise ProjectStateError(
+            f"'{project_path}' has no {PROJECT_STATE_FILE}; "
+            "it was not generated by fastapi-ms-init or predates update support."
+        ) from None
+    except UnicodeDecodeError as e:
+        raise ProjectStateError(f"Invalid project state: {e}") from e
+    return ProjectState.from_json(text)
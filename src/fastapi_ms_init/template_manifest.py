@@ -0,0 +1,140 @@
+"""Declarative manifest of the files rendered from the base templates."""
+
+import tomllib
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from fastapi_ms_init.config import FEATURE_FLAGS, ProjectConfig
+from fastapi_ms_init.errors import TemplateManifestError
+
+TEMPLATE_MANIFEST_PATH = Path(__file__).parent / "templates" / "manifest.toml"
+
+# Flags that must have the given values for a file to be rendered
+Condition = tuple[tuple[str, bool], ...]
+
+
+@dataclass(frozen=True)
+class TemplateEntry:
+    """A single file of the generated project.
+
+    Attributes:
+        template: Template path relative to the templates root
+        output: Output path relative to the project root
+        when: Flags and the values they must have for the file to render
+        depends_on: Templates this template includes or imports
+    """
+
+    template: str
+    output: str
+    when: Condition = ()
+    depends_on: tuple[str, ...] = ()
+
+
+def _parse_condition(template: str, when: Any) -> Condition:
+    """Parse a list of "flag" / "not flag" strings."""
+    if not isinstance(when, list):
+        raise TemplateManifestError(f"'when' of '{template}' must be a list of flags")
+
+    condition = []
+    for term in when:
+        flag = term.removeprefix("not ").strip() if isinstance(term, str) else term
+        if flag not in FEATURE_FLAGS:
+            raise TemplateManifestError(f"Unknown flag {term!r} in 'when' of '{template}'")
+        condition.append((flag, not term.startswith("not ")))
+    return tuple(sorted(condition))
+
+
+def _parse_entry(data: Mapping[str, Any]) -> TemplateEntry:
+    """Build a TemplateEntry from a [[files]] table."""
+    template = data.get("template")
+    if not isinstance(template, str) or not template.endswith(".j2"):
+        raise TemplateManifestError(f"Invalid template name: {template!r}")
+
+    unknown = set(data) - {"template", "output", "when", "depends_on"}
+    if unknown:
+        raise TemplateManifestError(
+            f"Unknown keys for '{template}': {', '.join(sorted(unknown))}"
+        )
+
+    depends_on = data.get("depends_on", [])
+    if not isinstance(depends_on, list) or not all(isinstance(d, str) for d in depends_on):
+        raise TemplateManifestError(f"'depends_on' of '{template}' must be a list of templates")
+
+    return TemplateEntry(
+        template=template,
+        output=data.get("output", template.removesuffix(".j2")),
+        when=_parse_condition(template, data.get("when", [])),
+        depends_on=tuple(depends_on),
+    )
+
+
+class TemplateManifest:
+    """Index of template entries grouped by their render condition.
+
+    Entries sharing a condition are evaluated together, so selecting the
+    files for a configuration costs one check per distinct condition
+    rather than one per template.
+    """
+
+    def __init__(self, entries: list[TemplateEntry]):
+        counts = Counter(entry.output for entry in entries)
+        duplicates = sorted(output for output, count in counts.items() if count > 1)
+        if duplicates:
+            raise TemplateManifestError(f"Duplicate outputs: {', '.join(duplicates)}")
+
+        self.entries = tuple(entries)
+        self._by_condition: dict[Condition, list[tuple[int, TemplateEntry]]] = {}
+        for position, entry in enumerate(entries):
+            self._by_condition.setdefault(entry.when, []).append((position, entry))
+
+    def select(self, config: ProjectConfig) -> list[TemplateEntry]:
+        """Select the entries rendered for a configuration.
+
+        Args:
+            config: Project configuration
+
+        Returns:
+            Matching entries in manifest order
+        """
+        selected: list[tuple[int, TemplateEntry]] = []
+        for condition, group in self._by_condition.items():
+            if all(getattr(config, flag) is value for flag, value in condition):
+                selected.extend(group)
+        return [entry for _, entry in sorted(selected, key=lambda item: item[0])]
+
+    @classmethod
+    def from_toml(cls, text: str) -> "TemplateManifest":
+        """Parse a manifest from TOML text.
+
+        Raises:
+            TemplateManifestError: If the manifest is invalid
+        """
+        try:
+            data = tomllib.loads(text)
+        except tomllib.TOMLDecodeError as e:
+            raise TemplateManifestError(f"Invalid template manifest: {e}") from e
+
+        files = data.get("files")
+        if not isinstance(files, list):
+            raise TemplateManifestError("Template manifest must contain [[files]] entries")
+        return cls([_parse_entry(entry) for entry in files])
+
+
+@cache
+def load_template_manifest(path: Path = TEMPLATE_MANIFEST_PATH) -> TemplateManifest:
+    """Load and index a template manifest, once per path.
+
+    Args:
+        path: Path to the manifest TOML file
+
+    Returns:
+        The indexed template manifest
+
+    Raises:
+        TemplateManifestError: If the manifest is invalid
+    """
+    return TemplateManifest.from_toml(path.read_text(encoding="utf-8"))
@@ -0,0 +1,274 @@
+"""Incremental updates of previously generated projects."""
+
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from enum import StrEnum
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from fastapi_ms_init.config import ProjectConfig
+from fastapi_ms_init.generator import (
+    load_templates,
+    render_template,
+    select_templates,
+    template_hash,
+)
+from fastapi_ms_init.state import (
+    PROJECT_STATE_FILE,
+    FileState,
+    ProjectState,
+    hash_text,
+    read_project_state,
+)
+
+if TYPE_CHECKING:
+    from jinja2 import Environment
+
+# A change relative to the merge base: (base_start, base_end, replacement_lines)
+Hunk = tuple[int, int, list[str]]
+
+
+class FileStatus(StrEnum):
+    """What an update did to a single file."""
+
+    UNCHANGED = "unchanged"
+    CREATED = "created"
+    UPDATED = "updated"
+    MERGED = "merged"
+    REMOVED = "removed"
+    SKIPPED = "skipped"
+    CONFLICT = "conflict"
+
+
+@dataclass
+class UpdateReport:
+    """Outcome of updating a project.
+
+    Attributes:
+        project_path: Root directory of the updated project
+        files: Status of every file considered, keyed by relative path
+    """
+
+    project_path: Path
+    files: dict[str, FileStatus] = field(default_factory=dict)
+
+    @property
+    def conflicts(self) -> list[str]:
+        """Files whose local edits could not be merged."""
+        return [path for path, status in self.files.items() if status is FileStatus.CONFLICT]
+
+    @property
+    def changed(self) -> list[str]:
+        """Files written or removed by the update."""
+        return [
+            path
+            for path, status in self.files.items()
+            if status in (FileStatus.CREATED, FileStatus.UPDATED, FileStatus.MERGED,
+                          FileStatus.REMOVED)
+        ]
+
+
+def _hunks(base: list[str], other: list[str]) -> list[Hunk]:
+    """Compute the changes that turn base into other."""
+    matcher = SequenceMatcher(None, base, other, autojunk=False)
+    return [
+        (i1, i2, other[j1:j2])
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ]
+
+
+def _apply(base: list[str], start: int, end: int, hunks: list[Hunk]) -> list[str]:
+    """Apply hunks to the base region [start, end)."""
+    lines: list[str] = []
+    position = start
+    for hunk_start, hunk_end, replacement in hunks:
+        lines += base[position:hunk_start]
+        lines += replacement
+        position = hunk_end
+    lines += base[position:end]
+    return lines
+
+
+def merge3(base: str, ours: str, theirs: str) -> str | None:
+    """Three-way merge two descendants of a common base, line by line.
+
+    Changes from both sides are combined when they touch different regions
+    of the base, or when both sides made the same change.
+
+    Args:
+        base: Common ancestor
+        ours: Locally edited version
+        theirs: Newly generated version
+
+    Returns:
+        The merged text, or None if the changes conflict
+    """
+    base_lines = base.splitlines(keepends=True)
+    changes = sorted(
+        [(hunk, "ours") for hunk in _hunks(base_lines, ours.splitlines(keepends=True))]
+        + [(hunk, "theirs") for hunk in _hunks(base_lines, theirs.splitlines(keepends=True))],
+        key=lambda change: change[0][:2],
+    )
+
+    merged: list[str] = []
+    position = 0
+    index = 0
+    while index < len(changes):
+        # Group changes whose base regions overlap or touch
+        start, end, _ = changes[index][0]
+        cluster = [changes[index]]
+        index += 1
+        while index < len(changes) and changes[index][0][0] <= end:
+            end = max(end, changes[index][0][1])
+            cluster.append(changes[index])
+            index += 1
+
+        ours_region = _apply(base_lines, start, end, [h for h, side in cluster if side == "ours"])
+        theirs_region = _apply(
+            base_lines, start, end, [h for h, side in cluster if side == "theirs"]
+        )
+        sides = {side for _, side in cluster}
+        if sides == {"ours"}:
+            region = ours_region
+        elif sides == {"theirs"} or ours_region == theirs_region:
+            region = theirs_region
+        else:
+            return None
+
+        merged += base_lines[position:start]
+        merged += region
+        position = end
+
+    merged += base_lines[position:]
+    return "".join(merged)
+
+
+def _read(path: Path) -> str | None:
+    """Read a project file, or None if it does not exist."""
+    try:
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def update_project(
+    project_path: Path,
+    config: ProjectConfig | None = None,
+    env: "Environment | None" = None,
+    dry_run: bool = False,
+) -> UpdateReport:
+    """Bring a generated project up to date with the current templates.
+
+    Only templates whose source or configuration changed since the last
+    generation are re-rendered. For each re-rendered file:
+
+    - files left untouched by the user are overwritten
+    - edited files are three-way merged with the new output, using the
+      previously generated content as the base; if the edits overlap the
+      template changes the file is left alone and reported as a conflict
+    - files the user deleted stay deleted
+
+    Files of features that were disabled are removed unless edited.
+
+    Args:
+        project_path: Root directory of a generated project
+        config: New configuration (defaults to the recorded one)
+        env: Jinja2 Environment to reuse (loaded from the package if omitted)
+        dry_run: Report what would change without writing anything
+
+    Returns:
+        Per-file report of the update
+
+    Raises:
+        ProjectStateError: If the project has no valid generation state
+    """
+    state = read_project_state(project_path)
+    if config is None:
+        config = state.config
+    config_changed = config != state.config
+
+    report = UpdateReport(project_path)
+    records: dict[str, FileState] = {}
+    writes: dict[str, str] = {}
+
+    for entry in select_templates(config):
+        template_name, output_file_path = entry.template, entry.output
+        previous = state.files.get(output_file_path)
+        current_hash = template_hash(template_name, entry.depends_on)
+
+        # Neither the template nor its inputs changed: nothing to render
+        if (
+            previous is not None
+            and not config_changed
+            and previous.template == template_name
+            and previous.template_hash == current_hash
+        ):
+            records[output_file_path] = previous
+            report.files[output_file_path] = FileStatus.UNCHANGED
+            continue
+
+        if env is None:
+            env = load_templates()
+        content = render_template(env, template_name, {"config": config})
+        record = FileState(template_name, current_hash, content)
+        on_disk = _read(project_path / output_file_path)
+
+        if previous is None:
+            if on_disk is None:
+                writes[output_file_path] = content
+                status = FileStatus.CREATED
+            elif on_disk == content:
+                status = FileStatus.UNCHANGED
+            else:
+                # An unrelated file is in the way; don't record it as ours
+                report.files[output_file_path] = FileStatus.CONFLICT
+                continue
+        elif on_disk is None:
+            status = FileStatus.SKIPPED
+        elif on_disk == content:
+            status = FileStatus.UNCHANGED
+        elif hash_text(on_disk) == previous.content_hash:
+            writes[output_file_path] = content
+            status = FileStatus.UPDATED
+        elif content == previous.content:
+            # Only the user changed the file; keep their version
+            status = FileStatus.SKIPPED
+        else:
+            merged = merge3(previous.content, on_disk, content)
+            if merged is None:
+                # Keep the old base so the next update can retry the merge
+                records[output_file_path] = previous
+                report.files[output_file_path] = FileStatus.CONFLICT
+                continue
+            writes[output_file_path] = merged
+            status = FileStatus.MERGED
+
+        records[output_file_path] = record
+        report.files[output_file_path] = status
+
+    # Files of templates that are no longer selected
+    removals = []
+    for output_file_path, previous in state.files.items():
+        if output_file_path in records or output_file_path in report.files:
+            continue
+        on_disk = _read(project_path / output_file_path)
+        if on_disk is None:
+            continue
+        if hash_text(on_disk) == previous.content_hash:
+            removals.append(output_file_path)
+            report.files[output_file_path] = FileStatus.REMOVED
+        else:
+            report.files[output_file_path] = FileStatus.SKIPPED
+
+    if not dry_run:
+        for output_file_path, content in writes.items():
+            target = project_path / output_file_path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(content, encoding="utf-8")
+        for output_file_path in removals:
+            (project_path / output_file_path).unlink()
+        new_state = ProjectState(config=config, files=records)
+        (project_path / PROJECT_STATE_FILE).write_text(new_state.to_json(), encoding="utf-8")
+
+    return report
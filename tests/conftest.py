@@ -1,11 +1,22 @@
 """Pytest configuration and shared fixtures."""
 
+import shutil
 import tempfile
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from pathlib import Path
 
 import pytest
 
+from fastapi_ms_init.generator import TEMPLATES_DIR
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch) -> Path:
+    """Keep generator caches out of the user's cache directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("FASTAPI_MS_INIT_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
 
 @pytest.fixture
 def temp_dir() -> Generator[Path, None, None]:
@@ -24,3 +35,22 @@ def sample_service_name() -> str:
 def sample_package_name() -> str:
     """Return a valid package name for testing."""
     return "my_test_service"
+
+
+@pytest.fixture
+def templates(temp_dir, monkeypatch) -> Path:
+    """Use an editable copy of the base templates."""
+    templates_dir = temp_dir / "templates"
+    shutil.copytree(TEMPLATES_DIR, templates_dir)
+    monkeypatch.setattr("fastapi_ms_init.generator.TEMPLATES_DIR", templates_dir)
+    return templates_dir
+
+
+@pytest.fixture
+def edit() -> Callable[[Path, str, str], None]:
+    """Return a function that replaces the first occurrence of text in a file."""
+
+    def replace_text(path: Path, old: str, new: str) -> None:
+        path.write_text(path.read_text().replace(old, new, 1))
+
+    return replace_text
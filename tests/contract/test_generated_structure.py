@@ -57,6 +57,13 @@ class TestGeneratedProjectContract:
         content = logging_py.read_text()
 
         assert "logging" in content.lower()
+        assert "QueueListener" in content
+        assert "JSONFormatter" in content
+        assert "RequestIdMiddleware" in content
+
+        main = (output_path / "app" / "main.py").read_text()
+        assert "setup_logging(settings)" in main
+        assert "app.add_middleware(RequestIdMiddleware)" in main
 
     def test_generated_project_has_valid_dockerfile(self, temp_dir):
         """Test that generated Dockerfile is valid."""
@@ -172,3 +179,340 @@ class TestGeneratedProjectContract:
         generate_project(config_without, output_without)
 
         assert not (output_without / "docker-compose.yml").exists()
+
+    def test_generated_project_respects_postgres_flag(self, temp_dir):
+        """Test that use_postgres adds a pooled async database layer."""
+        config = ProjectConfig(
+            service_name="pg-test",
+            python_package_name="pg_test",
+            use_postgres=True,
+        )
+        output_path = temp_dir / "pg-test"
+        generate_project(config, output_path)
+
+        database = (output_path / "app" / "core" / "database.py").read_text()
+        assert "create_async_engine" in database
+        assert "pool_size=settings.db_pool_size" in database
+        assert "async def get_session" in database
+
+        main = (output_path / "app" / "main.py").read_text()
+        assert "await init_database(settings)" in main
+        assert "await close_database()" in main
+        assert "/health/db" in main
+
+        settings = (output_path / "app" / "core" / "settings.py").read_text()
+        assert "database_url: str" in settings
+        assert "postgresql+asyncpg://" in settings
+
+        assert "asyncpg" in (output_path / "pyproject.toml").read_text()
+        assert "postgres:16-alpine" in (output_path / "docker-compose.yml").read_text()
+        assert (output_path / "tests" / "test_database.py").exists()
+
+        config = ProjectConfig(service_name="no-pg-test", python_package_name="no_pg_test")
+        output_path = temp_dir / "no-pg-test"
+        generate_project(config, output_path)
+
+        assert not (output_path / "app" / "core" / "database.py").exists()
+        assert not (output_path / "tests" / "test_database.py").exists()
+        assert "database" not in (output_path / "app" / "main.py").read_text()
+        assert "sqlalchemy" not in (output_path / "pyproject.toml").read_text()
+
+    def test_generated_project_respects_redis_flag(self, temp_dir):
+        """Test that use_redis adds a two-tier response cache."""
+        config = ProjectConfig(
+            service_name="redis-test",
+            python_package_name="redis_test",
+            use_redis=True,
+        )
+        output_path = temp_dir / "redis-test"
+        generate_project(config, output_path)
+
+        cache = (output_path / "app" / "core" / "cache.py").read_text()
+        assert "ConnectionPool.from_url" in cache
+        assert "class LRUCache" in cache
+        assert "def cached(" in cache
+
+        main = (output_path / "app" / "main.py").read_text()
+        assert "await init_cache(settings)" in main
+        assert "await close_cache()" in main
+
+        settings = (output_path / "app" / "core" / "settings.py").read_text()
+        assert 'cache_namespace: str = "redis-test"' in settings
+
+        assert "@cached(" in (output_path / "app" / "api" / "routes.py").read_text()
+        assert "fakeredis" in (output_path / "pyproject.toml").read_text()
+        assert "redis:7-alpine" in (output_path / "docker-compose.yml").read_text()
+        assert "fakeredis" in (output_path / "tests" / "conftest.py").read_text()
+
+        config = ProjectConfig(service_name="no-redis-test", python_package_name="no_redis_test")
+        output_path = temp_dir / "no-redis-test"
+        generate_project(config, output_path)
+
+        assert not (output_path / "app" / "core" / "cache.py").exists()
+        assert not (output_path / "tests" / "test_cache.py").exists()
+        assert "redis>=" not in (output_path / "pyproject.toml").read_text()
+
+    def test_generated_project_respects_otel_flag(self, temp_dir):
+        """Test that use_otel adds OpenTelemetry instrumentation."""
+        config = ProjectConfig(
+            service_name="otel-test",
+            python_package_name="otel_test",
+            use_otel=True,
+        )
+        output_path = temp_dir / "otel-test"
+        generate_project(config, output_path)
+
+        telemetry = (output_path / "app" / "core" / "telemetry.py").read_text()
+        assert "FastAPIInstrumentor.instrument_app" in telemetry
+        assert "BatchSpanProcessor" in telemetry
+        assert "max_queue_size=settings.otel_max_queue_size" in telemetry
+        assert "TraceIdRatioBased(settings.otel_sampling_ratio)" in telemetry
+
+        main = (output_path / "app" / "main.py").read_text()
+        assert "setup_telemetry(app, settings)" in main
+
+        settings = (output_path / "app" / "core" / "settings.py").read_text()
+        assert "otel_sampling_ratio: float" in settings
+
+        assert "opentelemetry-sdk" in (output_path / "pyproject.toml").read_text()
+        assert "otel-collector" in (output_path / "docker-compose.yml").read_text()
+        assert 'OTEL_EXPORTER"] = "memory"' in (output_path / "tests" / "conftest.py").read_text()
+
+        config = ProjectConfig(service_name="no-otel-test", python_package_name="no_otel_test")
+        output_path = temp_dir / "no-otel-test"
+        generate_project(config, output_path)
+
+        assert not (output_path / "app" / "core" / "telemetry.py").exists()
+        assert not (output_path / "tests" / "test_telemetry.py").exists()
+        assert "opentelemetry" not in (output_path / "pyproject.toml").read_text()
+
+    def test_generated_project_respects_prometheus_flag(self, temp_dir):
+        """Test that use_prometheus adds /metrics and request timing."""
+        config = ProjectConfig(
+            service_name="metrics-test",
+            python_package_name="metrics_test",
+            use_prometheus=True,
+        )
+        output_path = temp_dir / "metrics-test"
+        generate_project(config, output_path)
+
+        metrics = (output_path / "app" / "core" / "metrics.py").read_text()
+        assert "class MetricsMiddleware:" in metrics
+        assert '["method", "route", "status"]' in metrics
+        assert "event_loop_lag_seconds" in metrics
+
+        main = (output_path / "app" / "main.py").read_text()
+        assert "app.add_middleware(MetricsMiddleware)" in main
+        assert '@app.get("/metrics", include_in_schema=False)' in main
+
+        gunicorn_conf = (output_path / "gunicorn.conf.py").read_text()
+        assert "PROMETHEUS_MULTIPROC_DIR" in gunicorn_conf
+        assert "mark_process_dead(worker.pid)" in gunicorn_conf
+
+        assert "prometheus-client" in (output_path / "pyproject.toml").read_text()
+        assert "@pytest.mark.perf" in (output_path / "tests" / "test_metrics.py").read_text()
+
+        config = ProjectConfig(service_name="no-metrics-test", python_package_name="no_metrics")
+        output_path = temp_dir / "no-metrics-test"
+        generate_project(config, output_path)
+
+        assert not (output_path / "app" / "core" / "metrics.py").exists()
+        assert not (output_path / "tests" / "test_metrics.py").exists()
+        assert "prometheus" not in (output_path / "gunicorn.conf.py").read_text().lower()
+        assert "/metrics" not in (output_path / "app" / "main.py").read_text()
+
+    def test_generated_project_respects_compression_flag(self, temp_dir):
+        """Test that use_compression adds compression and ETag helpers."""
+        config = ProjectConfig(
+            service_name="compress-test",
+            python_package_name="compress_test",
+            use_compression=True,
+        )
+        output_path = temp_dir / "compress-test"
+        generate_project(config, output_path)
+
+        compression = (output_path / "app" / "core" / "compression.py").read_text()
+        assert "class CompressionMiddleware:" in compression
+        assert "brotli.Compressor" in compression
+
+        etag = (output_path / "app" / "core" / "etag.py").read_text()
+        assert "def not_modified(" in etag
+        assert "status_code=304" in etag
+
+        main = (output_path / "app" / "main.py").read_text()
+        assert "minimum_size=settings.compression_minimum_size" in main
+
+        settings = (output_path / "app" / "core" / "settings.py").read_text()
+        assert 'compression_algorithms: list[Literal["br", "gzip"]]' in settings
+
+        assert '"brotli>=' in (output_path / "pyproject.toml").read_text()
+
+        config = ProjectConfig(service_name="plain-test", python_package_name="plain_test")
+        output_path = temp_dir / "plain-test"
+        generate_project(config, output_path)
+
+        assert not (output_path / "app" / "core" / "compression.py").exists()
+        assert not (output_path / "app" / "core" / "etag.py").exists()
+        assert "brotli" not in (output_path / "pyproject.toml").read_text()
+
+    def test_generated_project_has_production_server(self, temp_dir):
+        """Test that projects ship a tuned multi-worker production server."""
+        config = ProjectConfig(
+            service_name="server-test",
+            python_package_name="server_test",
+        )
+        output_path = temp_dir / "server-test"
+        generate_project(config, output_path)
+
+        gunicorn_conf = (output_path / "gunicorn.conf.py").read_text()
+        assert "workers = worker_count(settings)" in gunicorn_conf
+        assert 'worker_class = "app.core.worker.UvicornWorker"' in gunicorn_conf
+        assert "max_requests_jitter" in gunicorn_conf
+
+        server = (output_path / "app" / "core" / "server.py").read_text()
+        assert "cpu.max" in server
+        assert "cpu.cfs_quota_us" in server
+
+        worker = (output_path / "app" / "core" / "worker.py").read_text()
+        assert "server_loop" in worker
+        assert "server_http" in worker
+
+        dockerfile = (output_path / "Dockerfile").read_text()
+        assert '"gunicorn", "-c", "gunicorn.conf.py"' in dockerfile
+
+        main = (output_path / "app" / "main.py").read_text()
+        assert "reload=True" not in main
+        assert "reload=settings.debug" in main
+
+    def test_generated_project_has_pooled_http_client(self, temp_dir):
+        """Test that projects share one pooled outbound HTTP client."""
+        config = ProjectConfig(
+            service_name="http-test",
+            python_package_name="http_test",
+        )
+        output_path = temp_dir / "http-test"
+        generate_project(config, output_path)
+
+        http_client = (output_path / "app" / "core" / "http_client.py").read_text()
+        assert "httpx.Limits(" in http_client
+        assert "http2=settings.http_use_http2" in http_client
+        assert "class CircuitBreaker" in http_client
+        assert "HTTPClientDep = " in http_client
+
+        main = (output_path / "app" / "main.py").read_text()
+        assert "await init_http_client(settings)" in main
+        assert "await close_http_client()" in main
+
+        settings = (output_path / "app" / "core" / "settings.py").read_text()
+        assert "http_max_connections: int" in settings
+
+        assert '"httpx[http2]>=' in (output_path / "pyproject.toml").read_text()
+        assert "httpx.MockTransport" in (
+            output_path / "tests" / "test_http_client.py"
+        ).read_text()
+
+    def test_generated_project_respects_orjson_flag(self, temp_dir):
+        """Test that use_orjson switches JSON encoding and decoding to orjson."""
+        config = ProjectConfig(service_name="json-test", python_package_name="json_test")
+        output_path = temp_dir / "json-test"
+        generate_project(config, output_path)
+
+        main = (output_path / "app" / "main.py").read_text()
+        assert "default_response_class=ORJSONResponse" in main
+        assert "app.router.route_class = ORJSONRoute" in main
+        routes = (output_path / "app" / "api" / "routes.py").read_text()
+        assert "APIRouter(route_class=ORJSONRoute)" in routes
+        assert "orjson" in (output_path / "pyproject.toml").read_text()
+        assert (output_path / "tests" / "test_serialization.py").exists()
+
+        config = ProjectConfig(
+            service_name="stdlib-json-test",
+            python_package_name="stdlib_json_test",
+            use_orjson=False,
+        )
+        output_path = temp_dir / "stdlib-json-test"
+        generate_project(config, output_path)
+
+        assert "ORJSON" not in (output_path / "app" / "main.py").read_text()
+        assert not (output_path / "app" / "core" / "serialization.py").exists()
+        assert "orjson" not in (output_path / "pyproject.toml").read_text()
+
+    def test_generated_dockerfile_is_multi_stage(self, temp_dir):
+        """Test that the image is built in stages into a slim, non-root runtime."""
+        config = ProjectConfig(
+            service_name="image-test",
+            python_package_name="image_test",
+        )
+        output_path = temp_dir / "image-test"
+        generate_project(config, output_path)
+
+        dockerfile = (output_path / "Dockerfile").read_text()
+        builder, runtime = dockerfile.split("AS runtime")
+        assert "AS builder" in builder
+        assert "--mount=type=cache,target=/root/.cache/pip" in builder
+        assert "pip wheel" in builder
+        assert "gcc" in builder
+        assert "gcc" not in runtime
+        assert "--no-index --find-links=/wheels" in runtime
+        assert "-e ." not in dockerfile
+        assert "compileall" in runtime
+        assert "USER app" in runtime
+        assert "HEALTHCHECK" in runtime
+        assert "/health" in runtime
+
+        dockerignore = (output_path / ".dockerignore").read_text()
+        assert "tests/" in dockerignore
+        assert ".venv/" in dockerignore
+
+    def test_generated_project_respects_background_task_flag(self, temp_dir):
+        """Test that include_background_task adds a bounded task queue."""
+        config = ProjectConfig(
+            service_name="tasks-test",
+            python_package_name="tasks_test",
+            include_background_task=True,
+        )
+        output_path = temp_dir / "tasks-test"
+        generate_project(config, output_path)
+
+        tasks = (output_path / "app" / "core" / "tasks.py").read_text()
+        assert "asyncio.Queue(max_size)" in tasks
+        assert "ProcessPoolExecutor" in tasks
+        assert "class QueueFullError" in tasks
+        assert "async def drain" in tasks
+
+        main = (output_path / "app" / "main.py").read_text()
+        assert "await start_task_queue(settings)" in main
+        assert "await stop_task_queue(settings)" in main
+        assert "/health/tasks" in main
+
+        routes = (output_path / "app" / "api" / "routes.py").read_text()
+        assert "tasks.submit(build_report, size)" in routes
+        assert "HTTP_503_SERVICE_UNAVAILABLE" in routes
+
+        config = ProjectConfig(service_name="no-tasks-test", python_package_name="no_tasks_test")
+        output_path = temp_dir / "no-tasks-test"
+        generate_project(config, output_path)
+
+        assert not (output_path / "app" / "core" / "tasks.py").exists()
+        assert "task_queue" not in (output_path / "app" / "main.py").read_text()
+
+    def test_generated_project_has_load_testing(self, temp_dir):
+        """Test that projects ship a load generator and a perf smoke test."""
+        config = ProjectConfig(
+            service_name="load-test",
+            python_package_name="load_test",
+        )
+        output_path = temp_dir / "load-test"
+        generate_project(config, output_path)
+
+        loadtest = (output_path / "scripts" / "loadtest.py").read_text()
+        assert "async def run_load" in loadtest
+        assert '"p99_ms"' in loadtest
+        assert 'DEFAULT_PATHS = ("/health", "/api/example")' in loadtest
+
+        perf_test = (output_path / "tests" / "test_performance.py").read_text()
+        assert "@pytest.mark.perf" in perf_test
+        assert "httpx.ASGITransport(app=app)" in perf_test
+        assert "PERF_MAX_P95_MS" in perf_test
+
+        assert '"perf: ' in (output_path / "pyproject.toml").read_text()
@@ -0,0 +1,76 @@
+"""Startup-time regression tests for the CLI."""
+
+import os
+import subprocess
+import sys
+
+# Cumulative import time budget for fastapi_ms_init.cli, as a multiple of a
+# bare ``import typer`` measured alongside it, so the budget holds on fast and
+# slow runners alike. The CLI measures about 1.55x; an eager Jinja2 or Rich
+# import pushes it past 1.9x. Raise it only with a good reason.
+IMPORT_TIME_BUDGET_RATIO = float(os.environ.get("FASTAPI_MS_INIT_IMPORT_BUDGET_RATIO", "1.8"))
+
+
+def run_python(code: str, *options: str) -> subprocess.CompletedProcess:
+    """Run a snippet in a fresh interpreter."""
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=30,
+    )
+
+
+def import_time_ms(module: str) -> float:
+    """Measure the cumulative import time of a module in a fresh interpreter."""
+    result = run_python(f"import {module}", "-X", "importtime")
+    for line in result.stderr.splitlines():
+        fields = [part.strip() for part in line.removeprefix("import time:").split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1000
+    raise AssertionError(f"{module} missing from importtime output:\n{result.stderr}")
+
+
+class TestStartup:
+    """Keep CLI startup fast."""
+
+    def test_cli_import_skips_heavy_modules(self):
+        """Test that importing the CLI does not load Rich or Jinja2."""
+        result = run_python(
+            "import sys, fastapi_ms_init.cli\n"
+            "print(sorted(m for m in ('jinja2', 'rich') if m in sys.modules))"
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_cli_import_skips_command_modules(self):
+        """Test that importing the CLI does not load any command's implementation."""
+        result = run_python(
+            "import sys, fastapi_ms_init.cli\n"
+            "print(sorted(m for m in sys.modules if m.startswith('fastapi_ms_init.')))"
+        )
+        assert result.stdout.strip() == (
+            "['fastapi_ms_init.cli', 'fastapi_ms_init.config', "
+            "'fastapi_ms_init.errors', 'fastapi_ms_init.validators']"
+        )
+
+    def test_version_fast_path_skips_typer(self):
+        """Test that --version is answered without importing Typer."""
+        result = run_python(
+            "import sys\n"
+            "sys.argv = ['fastapi-ms-init', '--version']\n"
+            "from fastapi_ms_init.__main__ import run\n"
+            "run()\n"
+            "print('typer' in sys.modules)"
+        )
+        assert result.stdout.splitlines() == ["fastapi-ms-init 0.1.0", "False"]
+
+    def test_cli_import_time_within_budget(self):
+        """Test that CLI import time stays within the budget relative to Typer."""
+        typer_ms = min(import_time_ms("typer") for _ in range(5))
+        cli_ms = min(import_time_ms("fastapi_ms_init.cli") for _ in range(5))
+        assert cli_ms <= typer_ms * IMPORT_TIME_BUDGET_RATIO, (
+            f"Importing fastapi_ms_init.cli took {cli_ms:.1f}ms, "
+            f"{cli_ms / typer_ms:.2f}x a bare import typer ({typer_ms:.1f}ms, "
+            f"budget {IMPORT_TIME_BUDGET_RATIO}x)"
+        )
@@ -0,0 +1,213 @@
+"""Unit tests for batch module."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from fastapi_ms_init.batch import (
+    BatchResult,
+    config_from_mapping,
+    generate_batch,
+    load_manifest,
+)
+from fastapi_ms_init.config import ProjectConfig
+from fastapi_ms_init.errors import ManifestError
+
+
+class TestConfigFromMapping:
+    """Test building ProjectConfig from manifest entries."""
+
+    def test_derives_package_name(self):
+        """Test that the package name is derived when omitted."""
+        config = config_from_mapping({"service_name": "orders-api", "use_redis": True})
+        assert config == ProjectConfig(
+            service_name="orders-api",
+            python_package_name="orders_api",
+            use_redis=True,
+        )
+
+    def test_rejects_unknown_fields(self):
+        """Test that unknown fields are reported."""
+        with pytest.raises(ManifestError, match="use_mongo"):
+            config_from_mapping({"service_name": "orders-api", "use_mongo": True})
+
+    def test_rejects_invalid_service_name(self):
+        """Test that invalid service names are rejected."""
+        with pytest.raises(ManifestError, match="Invalid service name"):
+            config_from_mapping({"service_name": "Orders_API"})
+
+    def test_rejects_missing_service_name(self):
+        """Test that a service name is required."""
+        with pytest.raises(ManifestError, match="Invalid service name"):
+            config_from_mapping({"use_redis": True})
+
+    def test_rejects_stdlib_package_name(self):
+        """Test that stdlib package names are rejected."""
+        with pytest.raises(ManifestError, match="Invalid package name"):
+            config_from_mapping({"service_name": "json"})
+
+    def test_rejects_non_string_package_name(self):
+        """Test that a package name of the wrong type is rejected."""
+        with pytest.raises(ManifestError, match="Invalid package name"):
+            config_from_mapping({"service_name": "orders-api", "python_package_name": 5})
+
+    def test_rejects_non_boolean_flags(self):
+        """Test that feature flags must be booleans."""
+        with pytest.raises(ManifestError, match="must be a boolean"):
+            config_from_mapping({"service_name": "orders-api", "use_redis": "yes"})
+
+
+class TestLoadManifest:
+    """Test manifest loading."""
+
+    def test_load_json_list(self, temp_dir):
+        """Test loading a JSON list of projects."""
+        manifest = temp_dir / "services.json"
+        manifest.write_text(json.dumps([
+            {"service_name": "orders-api"},
+            {"service_name": "billing-api", "use_postgres": True},
+        ]))
+
+        configs = load_manifest(manifest)
+
+        assert [c.service_name for c in configs] == ["orders-api", "billing-api"]
+        assert configs[1].use_postgres is True
+
+    def test_load_toml_with_defaults(self, temp_dir):
+        """Test loading a TOML manifest with defaults."""
+        manifest = temp_dir / "services.toml"
+        manifest.write_text(
+            "[defaults]\n"
+            "use_redis = true\n"
+            "\n"
+            "[[projects]]\n"
+            'service_name = "orders-api"\n'
+            "\n"
+            "[[projects]]\n"
+            'service_name = "billing-api"\n'
+            "use_redis = false\n"
+        )
+
+        configs = load_manifest(manifest)
+
+        assert configs[0].use_redis is True
+        assert configs[1].use_redis is False
+
+    def test_load_yaml(self, temp_dir):
+        """Test loading a YAML manifest."""
+        pytest.importorskip("yaml")
+        manifest = temp_dir / "services.yaml"
+        manifest.write_text("projects:\n  - service_name: orders-api\n")
+
+        configs = load_manifest(manifest)
+
+        assert configs[0].service_name == "orders-api"
+
+    def test_load_yaml_without_pyyaml(self, temp_dir):
+        """Test that a missing PyYAML is reported clearly."""
+        manifest = temp_dir / "services.yml"
+        manifest.write_text("projects: []\n")
+
+        with patch.dict("sys.modules", {"yaml": None}):
+            with pytest.raises(ManifestError, match="PyYAML"):
+                load_manifest(manifest)
+
+    def test_unsupported_extension(self, temp_dir):
+        """Test that unknown formats are rejected."""
+        manifest = temp_dir / "services.ini"
+        manifest.write_text("")
+
+        with pytest.raises(ManifestError, match="Unsupported manifest format"):
+            load_manifest(manifest)
+
+    def test_invalid_json(self, temp_dir):
+        """Test that parse errors are wrapped in ManifestError."""
+        manifest = temp_dir / "services.json"
+        manifest.write_text("{not json")
+
+        with pytest.raises(ManifestError, match="Could not read manifest"):
+            load_manifest(manifest)
+
+    def test_invalid_structure(self, temp_dir):
+        """Test that a manifest without projects is rejected."""
+        manifest = temp_dir / "services.json"
+        manifest.write_text(json.dumps({"defaults": {}}))
+
+        with pytest.raises(ManifestError, match="'projects' list"):
+            load_manifest(manifest)
+
+    def test_invalid_entry(self, temp_dir):
+        """Test that non-mapping entries are rejected."""
+        manifest = temp_dir / "services.json"
+        manifest.write_text(json.dumps(["orders-api"]))
+
+        with pytest.raises(ManifestError, match="must be a mapping"):
+            load_manifest(manifest)
+
+    def test_duplicate_service_names(self, temp_dir):
+        """Test that duplicate service names are rejected."""
+        manifest = temp_dir / "services.json"
+        manifest.write_text(json.dumps([
+            {"service_name": "orders-api"},
+            {"service_name": "orders-api"},
+        ]))
+
+        with pytest.raises(ManifestError, match="Duplicate"):
+            load_manifest(manifest)
+
+
+class TestGenerateBatch:
+    """Test concurrent batch generation."""
+
+    def test_generates_all_projects(self, temp_dir):
+        """Test that every project is generated in order."""
+        configs = [
+            ProjectConfig(service_name=f"service-{i}", python_package_name=f"service_{i}")
+            for i in range(4)
+        ]
+
+        results = generate_batch(configs, temp_dir, max_workers=2)
+
+        assert [r.service_name for r in results] == [c.service_name for c in configs]
+        assert all(r.ok for r in results)
+        for result in results:
+            assert (result.output_path / "app" / "main.py").exists()
+            assert result.duration >= 0
+
+    def test_shares_one_environment(self, temp_dir):
+        """Test that templates are loaded once for the whole batch."""
+        configs = [
+            ProjectConfig(service_name=f"service-{i}", python_package_name=f"service_{i}")
+            for i in range(3)
+        ]
+
+        with patch("fastapi_ms_init.batch.load_templates", wraps=lambda: None) as mock_load:
+            with patch("fastapi_ms_init.batch.generate_project") as mock_generate:
+                generate_batch(configs, temp_dir)
+
+        mock_load.assert_called_once()
+        assert mock_generate.call_count == 3
+
+    def test_failure_does_not_stop_batch(self, temp_dir):
+        """Test that a failing project is reported without aborting others."""
+        (temp_dir / "service-0").mkdir()
+        configs = [
+            ProjectConfig(service_name=f"service-{i}", python_package_name=f"service_{i}")
+            for i in range(2)
+        ]
+
+        results = generate_batch(configs, temp_dir)
+
+        assert not results[0].ok
+        assert "already exists" in results[0].error
+        assert results[1].ok
+
+
+class TestBatchResult:
+    """Test BatchResult."""
+
+    def test_ok_property(self, temp_dir):
+        """Test that ok reflects the error field."""
+        assert BatchResult("svc", temp_dir, 0.1).ok
+        assert not BatchResult("svc", temp_dir, 0.1, error="boom").ok
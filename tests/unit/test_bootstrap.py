@@ -0,0 +1,225 @@
+"""Unit tests for bootstrap module."""
+
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from fastapi_ms_init.bootstrap import (
+    PIP_LOCK_FILE,
+    BootstrapReport,
+    BootstrapStep,
+    bootstrap_project,
+    venv_python,
+)
+from fastapi_ms_init.errors import BootstrapError
+
+
+def completed(returncode=0, stdout="", stderr=""):
+    """Return the result of a finished command."""
+    return subprocess.CompletedProcess([], returncode, stdout, stderr)
+
+
+@pytest.fixture
+def run():
+    """Replace subprocess.run with a mock whose commands all succeed."""
+    with patch("fastapi_ms_init.bootstrap.subprocess.run", return_value=completed()) as mock:
+        yield mock
+
+
+def commands(run):
+    """Return the commands passed to the mocked subprocess.run."""
+    return [call.args[0] for call in run.call_args_list]
+
+
+class TestBootstrapWithUv:
+    """Test bootstrapping when uv is installed."""
+
+    @pytest.fixture(autouse=True)
+    def uv(self):
+        """Pretend uv is on PATH."""
+        with patch("fastapi_ms_init.bootstrap.shutil.which", return_value="/usr/bin/uv"):
+            yield
+
+    def test_locks_syncs_and_tests(self, temp_dir, run):
+        """Test the uv commands and the report."""
+        report = bootstrap_project(temp_dir)
+
+        assert commands(run) == [
+            ["/usr/bin/uv", "lock"],
+            ["/usr/bin/uv", "sync", "--locked", "--extra", "dev"],
+            [str(venv_python(temp_dir.resolve())), "-m", "pytest", "-q"],
+        ]
+        assert report.installer == "uv"
+        assert report.lock_file == "uv.lock"
+        assert report.tests_passed is True
+        assert report.time_to_first_pass == report.elapsed
+
+    def test_offline_wheel_dir(self, temp_dir, run):
+        """Test that the wheel directory and offline mode reach every uv command."""
+        wheels = temp_dir / "wheels"
+        wheels.mkdir()
+
+        bootstrap_project(temp_dir, wheel_dir=wheels, offline=True, run_tests=False)
+
+        for command in commands(run):
+            assert command[-3:] == ["--find-links", str(wheels.resolve()), "--offline"]
+
+    def test_online_run_fills_wheel_dir(self, temp_dir, run):
+        """Test that an online run adds the locked dependencies to the wheel directory."""
+        (temp_dir / "pyproject.toml").write_text(
+            '[build-system]\nrequires = ["setuptools>=68.0"]\n'
+        )
+        wheels = temp_dir / "wheels"
+        wheels.mkdir()
+        run.return_value = completed(stdout="fastapi==0.110.0\n")
+
+        bootstrap_project(temp_dir, wheel_dir=wheels, run_tests=False)
+
+        export, fill = commands(run)[2:]
+        assert export[1:3] == ["export", "--frozen"]
+        assert fill[:5] == ["/usr/bin/uv", "tool", "run", "pip", "wheel"]
+        assert fill[fill.index("--wheel-dir") + 1] == str(wheels.resolve())
+        assert fill[-1] == "setuptools>=68.0"
+
+    def test_commands_ignore_active_virtualenv(self, temp_dir, run, monkeypatch):
+        """Test that the generator's own virtualenv is not passed on."""
+        monkeypatch.setenv("VIRTUAL_ENV", "/somewhere/else")
+
+        bootstrap_project(temp_dir, run_tests=False)
+
+        assert "VIRTUAL_ENV" not in run.call_args.kwargs["env"]
+        assert run.call_args.kwargs["cwd"] == temp_dir.resolve()
+
+
+class TestBootstrapWithPip:
+    """Test the pip fallback."""
+
+    @pytest.fixture(autouse=True)
+    def no_uv(self):
+        """Pretend uv is not installed."""
+        with patch("fastapi_ms_init.bootstrap.shutil.which", return_value=None):
+            yield
+
+    def test_installs_and_writes_lock(self, temp_dir, run):
+        """Test that a fresh project is installed and its versions locked."""
+        run.return_value = completed(stdout="fastapi==0.110.0\n")
+
+        report = bootstrap_project(temp_dir, run_tests=False)
+
+        python = str(venv_python(temp_dir.resolve()))
+        assert commands(run)[0] == [sys.executable, "-m", "venv", ".venv"]
+        assert commands(run)[1][:4] == [python, "-m", "pip", "install"]
+        assert commands(run)[1][-2:] == ["-e", ".[dev]"]
+        assert (temp_dir / PIP_LOCK_FILE).read_text() == "fastapi==0.110.0\n"
+        assert report.installer == "pip"
+        assert report.tests_passed is None
+        assert report.time_to_first_pass is None
+
+    def test_installs_from_existing_lock(self, temp_dir, run):
+        """Test that a locked project installs exactly the locked versions."""
+        (temp_dir / PIP_LOCK_FILE).write_text("fastapi==0.110.0\n")
+        wheels = temp_dir / "wheels"
+        wheels.mkdir()
+
+        bootstrap_project(temp_dir, wheel_dir=wheels, offline=True, run_tests=False)
+
+        install, project = commands(run)[1:]
+        assert install[-2:] == ["-r", PIP_LOCK_FILE]
+        assert "--no-index" in install
+        assert str(wheels.resolve()) in install
+        assert project[-3:] == ["--no-deps", "-e", "."]
+
+    def test_online_run_fills_wheel_dir(self, temp_dir, run):
+        """Test that an online run builds wheels of the lockfile into the wheel directory."""
+        wheels = temp_dir / "wheels"
+        wheels.mkdir()
+
+        report = bootstrap_project(temp_dir, wheel_dir=wheels, run_tests=False)
+
+        fill = commands(run)[-1]
+        assert fill[1:4] == ["-m", "pip", "wheel"]
+        assert fill[fill.index("--wheel-dir") + 1] == str(wheels.resolve())
+        assert fill[-2:] == ["-r", PIP_LOCK_FILE]
+        assert report.steps[-1].name == "fill wheel directory"
+
+    def test_offline_run_does_not_fill_wheel_dir(self, temp_dir, run):
+        """Test that an offline run only reads from the wheel directory."""
+        wheels = temp_dir / "wheels"
+        wheels.mkdir()
+
+        bootstrap_project(temp_dir, wheel_dir=wheels, offline=True, run_tests=False)
+
+        assert all("wheel" not in command for command in commands(run))
+
+    def test_use_uv_false(self, temp_dir, run):
+        """Test that pip is used when uv is disabled."""
+        with patch("fastapi_ms_init.bootstrap.shutil.which") as which:
+            report = bootstrap_project(temp_dir, run_tests=False, use_uv=False)
+
+        which.assert_not_called()
+        assert report.installer == "pip"
+
+
+class TestBootstrapFailures:
+    """Test how failures are reported."""
+
+    @pytest.fixture(autouse=True)
+    def uv(self):
+        """Pretend uv is on PATH."""
+        with patch("fastapi_ms_init.bootstrap.shutil.which", return_value="uv"):
+            yield
+
+    def test_failed_step_raises(self, temp_dir, run):
+        """Test that a failing install step raises with the command output."""
+        run.return_value = completed(1, stderr="No solution found\n")
+
+        with pytest.raises(BootstrapError, match="(?s)lock dependencies.*No solution found"):
+            bootstrap_project(temp_dir)
+
+    def test_missing_command_raises(self, temp_dir, run):
+        """Test that a command that cannot be started raises."""
+        run.side_effect = FileNotFoundError("uv")
+
+        with pytest.raises(BootstrapError, match="Could not lock dependencies"):
+            bootstrap_project(temp_dir)
+
+    def test_failing_tests_are_reported(self, temp_dir, run):
+        """Test that failing tests are reported without raising."""
+        run.side_effect = [completed(), completed(), completed(1, stdout="1 failed\n")]
+
+        report = bootstrap_project(temp_dir)
+
+        assert report.tests_passed is False
+        assert report.test_output == "1 failed"
+        assert report.time_to_first_pass is None
+
+    def test_missing_wheel_dir(self, temp_dir, run):
+        """Test that a wheel directory that does not exist is rejected."""
+        with pytest.raises(BootstrapError, match="does not exist"):
+            bootstrap_project(temp_dir, wheel_dir=temp_dir / "missing")
+
+        run.assert_not_called()
+
+
+class TestBootstrapReport:
+    """Test report timings."""
+
+    def test_elapsed(self):
+        """Test that elapsed time sums the steps."""
+        report = BootstrapReport(
+            installer="uv",
+            lock_file="uv.lock",
+            steps=[BootstrapStep("a", ("a",), 1.5), BootstrapStep("b", ("b",), 2.0)],
+            tests_passed=True,
+        )
+
+        assert report.elapsed == 3.5
+        assert report.time_to_first_pass == 3.5
+
+    def test_venv_python_on_windows(self, temp_dir, monkeypatch):
+        """Test the virtualenv interpreter path on Windows."""
+        monkeypatch.setattr("sys.platform", "win32")
+
+        assert venv_python(temp_dir) == temp_dir / ".venv" / "Scripts" / "python.exe"
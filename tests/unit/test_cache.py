@@ -0,0 +1,83 @@
+"""Unit tests for cache module."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from jinja2 import DictLoader, Environment
+
+from fastapi_ms_init import __version__
+from fastapi_ms_init.cache import (
+    TemplateBytecodeCache,
+    template_bytecode_cache,
+    user_cache_dir,
+)
+
+
+class TestUserCacheDir:
+    """Test cache directory resolution."""
+
+    def test_env_override(self, monkeypatch, temp_dir):
+        """Test that the environment variable overrides the location."""
+        monkeypatch.setenv("FASTAPI_MS_INIT_CACHE_DIR", str(temp_dir))
+        assert user_cache_dir() == temp_dir / __version__
+
+    def test_xdg_cache_home(self, monkeypatch, temp_dir):
+        """Test that XDG_CACHE_HOME is honoured."""
+        monkeypatch.delenv("FASTAPI_MS_INIT_CACHE_DIR")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(temp_dir))
+        monkeypatch.setattr("sys.platform", "linux")
+        assert user_cache_dir() == temp_dir / "fastapi-ms-init" / __version__
+
+    def test_windows_local_app_data(self, monkeypatch, temp_dir):
+        """Test that LOCALAPPDATA is used on Windows."""
+        monkeypatch.delenv("FASTAPI_MS_INIT_CACHE_DIR")
+        monkeypatch.setenv("LOCALAPPDATA", str(temp_dir))
+        monkeypatch.setattr("sys.platform", "win32")
+        assert user_cache_dir() == temp_dir / "fastapi-ms-init" / __version__
+
+
+class TestTemplateBytecodeCache:
+    """Test the content-keyed bytecode cache."""
+
+    def _env(self, cache, source):
+        return Environment(loader=DictLoader({"t.j2": source}), bytecode_cache=cache)
+
+    def test_reuses_bytecode(self, temp_dir):
+        """Test that a second environment loads bytecode instead of compiling."""
+        cache = TemplateBytecodeCache(str(temp_dir))
+        assert self._env(cache, "Hi {{ name }}").get_template("t.j2").render(name="a") == "Hi a"
+        assert len(list(temp_dir.iterdir())) == 1
+
+        env = self._env(cache, "Hi {{ name }}")
+        with patch.object(env, "compile", side_effect=AssertionError("recompiled")):
+            assert env.get_template("t.j2").render(name="b") == "Hi b"
+
+    def test_new_entry_per_source_revision(self, temp_dir):
+        """Test that changed sources get their own cache entry."""
+        cache = TemplateBytecodeCache(str(temp_dir))
+        self._env(cache, "one").get_template("t.j2")
+        assert self._env(cache, "two").get_template("t.j2").render() == "two"
+        assert len(list(temp_dir.iterdir())) == 2
+
+    def test_ignores_write_errors(self, temp_dir):
+        """Test that an unwritable cache does not break rendering."""
+        cache = TemplateBytecodeCache(str(temp_dir / "missing"))
+        assert self._env(cache, "ok").get_template("t.j2").render() == "ok"
+
+
+class TestTemplateBytecodeCacheFactory:
+    """Test creation of the default bytecode cache."""
+
+    def test_creates_cache_directory(self, isolated_cache_dir):
+        """Test that the cache directory is created."""
+        cache = template_bytecode_cache()
+        assert isinstance(cache, TemplateBytecodeCache)
+        assert Path(cache.directory).is_dir()
+        assert Path(cache.directory).is_relative_to(isolated_cache_dir)
+
+    def test_unusable_directory(self, monkeypatch, temp_dir):
+        """Test that an unusable cache directory disables the cache."""
+        blocker = temp_dir / "file"
+        blocker.write_text("")
+        monkeypatch.setenv("FASTAPI_MS_INIT_CACHE_DIR", str(blocker))
+        assert template_bytecode_cache() is None
@@ -14,7 +14,7 @@ runner = CliRunner()
 class TestCLIBasicFunctionality:
     """Test basic CLI functionality."""
 
-    @patch("fastapi_ms_init.cli.generate_project")
+    @patch("fastapi_ms_init.generator.generate_project")
     @patch("fastapi_ms_init.cli.typer.confirm")
     @patch("fastapi_ms_init.cli.typer.prompt")
     def test_cli_minimal_generation(self, mock_prompt, mock_confirm, mock_generate):
@@ -24,7 +24,12 @@ class TestCLIBasicFunctionality:
         mock_confirm.side_effect = [
             False,  # use_postgres
             False,  # use_redis
+            False,  # use_otel
+            False,  # use_prometheus
+            False,  # use_compression
+            False,  # include_background_task
             True,   # include_example_route
+            True,   # use_orjson
             True,   # generate_docker_compose
         ]
 
@@ -36,7 +41,63 @@ class TestCLIBasicFunctionality:
         assert result.exit_code == 0
         mock_generate.assert_called_once()
 
-    @patch("fastapi_ms_init.cli.generate_project")
+    @patch("fastapi_ms_init.generator.generate_project")
+    @patch("fastapi_ms_init.cli.typer.confirm")
+    @patch("fastapi_ms_init.cli.typer.prompt")
+    def test_cli_passes_otel_choice(self, mock_prompt, mock_confirm, mock_generate):
+        """Test that the OpenTelemetry answer reaches the project config."""
+        mock_prompt.return_value = "my-test-service"
+        mock_confirm.side_effect = [False, False, True, False, False, False, True, True, True]
+
+        result = runner.invoke(app, [])
+
+        assert result.exit_code == 0
+        config = mock_generate.call_args.args[0]
+        assert config.use_otel is True
+
+    @patch("fastapi_ms_init.generator.generate_project")
+    @patch("fastapi_ms_init.cli.typer.confirm")
+    @patch("fastapi_ms_init.cli.typer.prompt")
+    def test_cli_passes_background_task_choice(self, mock_prompt, mock_confirm, mock_generate):
+        """Test that the background task answer reaches the project config."""
+        mock_prompt.return_value = "my-test-service"
+        mock_confirm.side_effect = [False, False, False, False, False, True, True, True, True]
+
+        result = runner.invoke(app, [])
+
+        assert result.exit_code == 0
+        config = mock_generate.call_args.args[0]
+        assert config.include_background_task is True
+
+    @patch("fastapi_ms_init.generator.generate_project")
+    @patch("fastapi_ms_init.cli.typer.confirm")
+    @patch("fastapi_ms_init.cli.typer.prompt")
+    def test_cli_passes_prometheus_choice(self, mock_prompt, mock_confirm, mock_generate):
+        """Test that the Prometheus answer reaches the project config."""
+        mock_prompt.return_value = "my-test-service"
+        mock_confirm.side_effect = [False, False, False, True, False, False, True, True, True]
+
+        result = runner.invoke(app, [])
+
+        assert result.exit_code == 0
+        config = mock_generate.call_args.args[0]
+        assert config.use_prometheus is True
+
+    @patch("fastapi_ms_init.generator.generate_project")
+    @patch("fastapi_ms_init.cli.typer.confirm")
+    @patch("fastapi_ms_init.cli.typer.prompt")
+    def test_cli_passes_compression_choice(self, mock_prompt, mock_confirm, mock_generate):
+        """Test that the compression answer reaches the project config."""
+        mock_prompt.return_value = "my-test-service"
+        mock_confirm.side_effect = [False, False, False, False, True, False, True, True, True]
+
+        result = runner.invoke(app, [])
+
+        assert result.exit_code == 0
+        config = mock_generate.call_args.args[0]
+        assert config.use_compression is True
+
+    @patch("fastapi_ms_init.generator.generate_project")
     @patch("fastapi_ms_init.cli.typer.confirm")
     @patch("fastapi_ms_init.cli.typer.prompt")
     def test_cli_invalid_service_name(self, mock_prompt, mock_confirm, mock_generate):
@@ -46,7 +107,7 @@ class TestCLIBasicFunctionality:
             "Invalid_Name",  # invalid service name
             "my-test-service",  # valid retry
         ]
-        mock_confirm.side_effect = [False, False, True, True]
+        mock_confirm.side_effect = [False, False, False, False, False, False, True, True, True]
         mock_generate.return_value = None
 
         runner.invoke(app, [])
@@ -77,13 +138,13 @@ class TestCLIValidation:
 class TestCLIErrorHandling:
     """Test CLI error handling."""
 
-    @patch("fastapi_ms_init.cli.generate_project")
+    @patch("fastapi_ms_init.generator.generate_project")
     @patch("fastapi_ms_init.cli.typer.confirm")
     @patch("fastapi_ms_init.cli.typer.prompt")
     def test_cli_handles_directory_exists_error(self, mock_prompt, mock_confirm, mock_generate):
         """Test CLI handles OutputDirectoryExistsError gracefully."""
         mock_prompt.return_value = "my-service"
-        mock_confirm.side_effect = [False, False, True, True]
+        mock_confirm.side_effect = [False, False, False, False, False, False, True, True, True]
         mock_generate.side_effect = OutputDirectoryExistsError(
             "Directory 'my-service' already exists"
         )
@@ -95,3 +156,325 @@ class TestCLIErrorHandling:
         # Check that error message is present (normalize output)
         output_lower = result.output.lower()
         assert "exist" in output_lower or "directory" in output_lower
+
+
+class TestCLIBatch:
+    """Test the non-interactive batch command."""
+
+    def test_batch_generates_projects(self, temp_dir):
+        """Test batch generation from a JSON manifest."""
+        manifest = temp_dir / "services.json"
+        manifest.write_text(
+            '[{"service_name": "orders-api"}, {"service_name": "billing-api"}]'
+        )
+        output_dir = temp_dir / "out"
+        output_dir.mkdir()
+
+        result = runner.invoke(app, ["batch", str(manifest), "-o", str(output_dir)])
+
+        assert result.exit_code == 0, result.output
+        assert (output_dir / "orders-api" / "app" / "main.py").exists()
+        assert (output_dir / "billing-api" / "app" / "main.py").exists()
+        assert "2 generated, 0 failed" in result.output
+
+    def test_batch_reuses_cached_projects(self, temp_dir):
+        """Test that a repeated batch is served from the output cache."""
+        manifest = temp_dir / "services.json"
+        manifest.write_text('[{"service_name": "orders-api"}]')
+        runner.invoke(app, ["batch", str(manifest), "-o", str(temp_dir / "first")])
+
+        cached = runner.invoke(app, ["batch", str(manifest), "-o", str(temp_dir / "second")])
+        uncached = runner.invoke(
+            app, ["batch", str(manifest), "-o", str(temp_dir / "third"), "--no-cache"]
+        )
+
+        assert cached.exit_code == 0, cached.output
+        assert "(1 from cache)" in cached.output
+        assert (temp_dir / "second" / "orders-api" / "app" / "main.py").exists()
+        assert "from cache" not in uncached.output
+
+    def test_batch_reports_failures(self, temp_dir):
+        """Test that failed projects produce a non-zero exit code."""
+        manifest = temp_dir / "services.json"
+        manifest.write_text('[{"service_name": "orders-api"}]')
+        (temp_dir / "orders-api").mkdir()
+
+        result = runner.invoke(app, ["batch", str(manifest), "-o", str(temp_dir)])
+
+        assert result.exit_code == 1
+        assert "0 generated, 1 failed" in result.output
+
+    def test_batch_invalid_manifest(self, temp_dir):
+        """Test that manifest errors are reported."""
+        manifest = temp_dir / "services.json"
+        manifest.write_text('[{"service_name": "Bad_Name"}]')
+
+        result = runner.invoke(app, ["batch", str(manifest)])
+
+        assert result.exit_code == 1
+        assert "Invalid service name" in result.output
+
+
+class TestCLIVersion:
+    """Test version reporting."""
+
+    def test_version_option(self):
+        """Test that --version prints the version."""
+        result = runner.invoke(app, ["--version"])
+
+        assert result.exit_code == 0
+        assert "fastapi-ms-init 0.1.0" in result.output
+
+    def test_entrypoint_version_fast_path(self, monkeypatch, capsys):
+        """Test that the console script answers --version directly."""
+        from fastapi_ms_init.__main__ import run
+
+        monkeypatch.setattr("sys.argv", ["fastapi-ms-init", "-V"])
+        with patch("fastapi_ms_init.cli.app") as mock_app:
+            run()
+
+        mock_app.assert_not_called()
+        assert capsys.readouterr().out == "fastapi-ms-init 0.1.0\n"
+
+    def test_entrypoint_delegates_to_app(self, monkeypatch):
+        """Test that other invocations are handed to the Typer app."""
+        from fastapi_ms_init.__main__ import run
+
+        monkeypatch.setattr("sys.argv", ["fastapi-ms-init", "--help"])
+        with patch("fastapi_ms_init.cli.app") as mock_app:
+            run()
+
+        mock_app.assert_called_once_with(prog_name="fastapi-ms-init")
+
+
+class TestCLIUpdate:
+    """Test the update command."""
+
+    def _generate(self, temp_dir):
+        from fastapi_ms_init.config import ProjectConfig
+        from fastapi_ms_init.generator import generate_project
+
+        project = temp_dir / "my-service"
+        generate_project(
+            ProjectConfig(service_name="my-service", python_package_name="my_service"),
+            project,
+        )
+        return project
+
+    def test_update_up_to_date_project(self, temp_dir):
+        """Test updating a project that is already current."""
+        project = self._generate(temp_dir)
+
+        result = runner.invoke(app, ["update", str(project)])
+
+        assert result.exit_code == 0, result.output
+        assert "Changed 0 files, 0 conflicts" in result.output
+
+    def test_update_toggles_features(self, temp_dir):
+        """Test enabling and disabling features."""
+        project = self._generate(temp_dir)
+
+        result = runner.invoke(
+            app, ["update", str(project), "--disable", "generate_docker_compose"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "removed" in result.output
+        assert not (project / "docker-compose.yml").exists()
+
+    def test_update_dry_run(self, temp_dir):
+        """Test that --dry-run leaves the project untouched."""
+        project = self._generate(temp_dir)
+
+        result = runner.invoke(
+            app, ["update", str(project), "--disable", "generate_docker_compose", "--dry-run"]
+        )
+
+        assert result.exit_code == 0
+        assert "Would change 2 files" in result.output
+        assert (project / "docker-compose.yml").exists()
+
+    def test_update_unknown_flag(self, temp_dir):
+        """Test that unknown feature flags are rejected."""
+        project = self._generate(temp_dir)
+
+        result = runner.invoke(app, ["update", str(project), "--enable", "use_mongo"])
+
+        assert result.exit_code == 1
+        assert "Unknown feature flags: use_mongo" in result.output
+
+    def test_update_not_generated_project(self, temp_dir):
+        """Test that projects without state are rejected."""
+        result = runner.invoke(app, ["update", str(temp_dir)])
+
+        assert result.exit_code == 1
+        assert ".fastapi-ms-init.json" in result.output
+
+    @patch("fastapi_ms_init.updater.update_project")
+    def test_update_reports_conflicts(self, mock_update, temp_dir):
+        """Test that conflicts produce a non-zero exit code."""
+        from fastapi_ms_init.updater import FileStatus, UpdateReport
+
+        project = self._generate(temp_dir)
+        mock_update.return_value = UpdateReport(
+            project, {"README.md": FileStatus.CONFLICT}
+        )
+
+        result = runner.invoke(app, ["update", str(project)])
+
+        assert result.exit_code == 1
+        assert "README.md" in result.output
+        assert "1 conflicts" in result.output
+
+
+class TestCLIScan:
+    """Test the scan command."""
+
+    def _generate(self, root, service_name):
+        from fastapi_ms_init.config import ProjectConfig
+        from fastapi_ms_init.generator import generate_project
+
+        project = root / service_name
+        generate_project(
+            ProjectConfig(
+                service_name=service_name, python_package_name=service_name.replace("-", "_")
+            ),
+            project,
+        )
+        return project
+
+    def test_scan_prints_json_report(self, temp_dir):
+        """Test that the drift report is printed as JSON."""
+        import json
+
+        self._generate(temp_dir, "orders-api")
+
+        result = runner.invoke(app, ["scan", str(temp_dir)])
+
+        assert result.exit_code == 0, result.output
+        report = json.loads(result.output)
+        assert report["summary"] == {"projects": 1, "drifted": 0, "failed": 0}
+
+    def test_scan_writes_report_file(self, temp_dir):
+        """Test writing the report to a file."""
+        self._generate(temp_dir, "orders-api")
+        output = temp_dir / "drift.json"
+
+        result = runner.invoke(app, ["scan", str(temp_dir), "-o", str(output), "-w", "2"])
+
+        assert result.exit_code == 0, result.output
+        assert "Scanned 1 projects" in result.output
+        assert '"drifted": 0' in output.read_text()
+
+    def test_scan_check_fails_on_drift(self, temp_dir):
+        """Test that --check exits with an error when a project has drifted."""
+        project = self._generate(temp_dir, "orders-api")
+        (project / "Dockerfile").unlink()
+
+        result = runner.invoke(app, ["scan", str(temp_dir), "--check"])
+
+        assert result.exit_code == 1
+
+
+class TestCLIServe:
+    """Test the serve command."""
+
+    def test_serve_runs_server(self):
+        """Test that the generation server is run with uvicorn."""
+        from unittest.mock import MagicMock
+
+        from fastapi_ms_init.server import GenerationServer
+
+        uvicorn = MagicMock()
+        with patch.dict("sys.modules", {"uvicorn": uvicorn}):
+            result = runner.invoke(app, ["serve", "--port", "9000", "--max-concurrency", "4"])
+
+        assert result.exit_code == 0, result.output
+        server = uvicorn.run.call_args.args[0]
+        assert isinstance(server, GenerationServer)
+        assert server.max_concurrency == 4
+        assert uvicorn.run.call_args.kwargs == {"host": "127.0.0.1", "port": 9000}
+
+    def test_serve_requires_uvicorn(self):
+        """Test the message shown when the server extra is not installed."""
+        with patch.dict("sys.modules", {"uvicorn": None}):
+            result = runner.invoke(app, ["serve"])
+
+        assert result.exit_code == 1
+        assert "fastapi-ms-init[server]" in result.output
+
+
+class TestCLIBootstrap:
+    """Test environment bootstrapping from the CLI."""
+
+    def _report(self, tests_passed=True):
+        from fastapi_ms_init.bootstrap import BootstrapReport, BootstrapStep
+
+        return BootstrapReport(
+            installer="uv",
+            lock_file="uv.lock",
+            steps=[
+                BootstrapStep("install dependencies", ("uv", "sync"), 1.25),
+                BootstrapStep("run tests", ("pytest",), 0.5),
+            ],
+            tests_passed=tests_passed,
+            test_output="1 failed",
+        )
+
+    @patch("fastapi_ms_init.bootstrap.bootstrap_project")
+    def test_bootstrap_reports_time_to_first_pass(self, mock_bootstrap, temp_dir):
+        """Test that step timings and the time to a passing test run are shown."""
+        mock_bootstrap.return_value = self._report()
+        wheels = temp_dir / "wheels"
+        wheels.mkdir()
+
+        result = runner.invoke(
+            app, ["bootstrap", str(temp_dir), "--wheel-dir", str(wheels), "--offline"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "install dependencies" in result.output
+        assert "Time to first passing pytest: 1.75s" in result.output
+        mock_bootstrap.assert_called_once_with(temp_dir, wheels, offline=True, run_tests=True)
+
+    @patch("fastapi_ms_init.bootstrap.bootstrap_project")
+    def test_bootstrap_failing_tests(self, mock_bootstrap, temp_dir):
+        """Test that failing tests produce a non-zero exit code."""
+        mock_bootstrap.return_value = self._report(tests_passed=False)
+
+        result = runner.invoke(app, ["bootstrap", str(temp_dir)])
+
+        assert result.exit_code == 1
+        assert "1 failed" in result.output
+        assert "Tests failed" in result.output
+
+    @patch("fastapi_ms_init.bootstrap.bootstrap_project")
+    def test_bootstrap_error(self, mock_bootstrap, temp_dir):
+        """Test that installation errors are reported."""
+        from fastapi_ms_init.errors import BootstrapError
+
+        mock_bootstrap.side_effect = BootstrapError("Could not lock dependencies")
+
+        result = runner.invoke(app, ["bootstrap", str(temp_dir)])
+
+        assert result.exit_code == 1
+        assert "Could not lock dependencies" in result.output
+
+    @patch("fastapi_ms_init.bootstrap.bootstrap_project")
+    @patch("fastapi_ms_init.generator.generate_project")
+    @patch("fastapi_ms_init.cli.typer.confirm")
+    @patch("fastapi_ms_init.cli.typer.prompt")
+    def test_generate_with_bootstrap(
+        self, mock_prompt, mock_confirm, mock_generate, mock_bootstrap
+    ):
+        """Test that --bootstrap sets up the new project after generating it."""
+        mock_prompt.return_value = "my-test-service"
+        mock_confirm.side_effect = [False] * 6 + [True] * 3
+        mock_bootstrap.return_value = self._report()
+
+        result = runner.invoke(app, ["--bootstrap"])
+
+        assert result.exit_code == 0, result.output
+        assert mock_bootstrap.call_args.args[0] == mock_generate.call_args.args[1]
+        assert "Time to first passing pytest" in result.output
+        assert "pip install" not in result.output
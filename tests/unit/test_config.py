@@ -32,6 +32,9 @@ class TestProjectConfig:
         assert config.include_example_route is True
         assert config.include_background_task is False
         assert config.generate_docker_compose is True
+        assert config.use_orjson is True
+        assert config.use_prometheus is False
+        assert config.use_compression is False
 
     def test_project_config_custom_values(self):
         """Test creating ProjectConfig with custom values."""
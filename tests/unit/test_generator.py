@@ -1,16 +1,21 @@
 """Unit tests for generator module."""
 
-
 import pytest
 
 from fastapi_ms_init.config import ProjectConfig
 from fastapi_ms_init.errors import OutputDirectoryExistsError
 from fastapi_ms_init.generator import (
+    RenderMemo,
     check_output_directory,
     generate_project,
     load_templates,
+    precompile_templates,
+    render_project,
     render_template,
+    template_config_fields,
+    templates_digest,
 )
+from fastapi_ms_init.sinks import MemorySink
 
 
 class TestCheckOutputDirectory:
@@ -60,6 +65,56 @@ class TestLoadTemplates:
         # Should be able to list templates (will have templates after T019-T032)
         assert env.loader is not None
 
+    def test_load_templates_uses_bytecode_cache(self):
+        """Test that the bytecode cache is enabled by default."""
+        env = load_templates()
+        assert env.bytecode_cache is not None
+
+    def test_load_templates_without_cache(self):
+        """Test that caching can be disabled."""
+        env = load_templates(use_cache=False)
+        assert env.bytecode_cache is None
+
+    def test_load_templates_prefers_precompiled(self, temp_dir, monkeypatch):
+        """Test that matching precompiled modules are used."""
+        from jinja2 import ChoiceLoader
+
+        compiled = temp_dir / "compiled"
+        monkeypatch.setattr("fastapi_ms_init.generator.PRECOMPILED_DIR", compiled)
+        precompile_templates(compiled)
+
+        env = load_templates()
+
+        assert isinstance(env.loader, ChoiceLoader)
+        config = ProjectConfig(service_name="my-service", python_package_name="my_service")
+        assert "my-service" in render_template(env, "app/main.py.j2", {"config": config})
+
+    def test_load_templates_ignores_stale_precompiled(self, temp_dir, monkeypatch):
+        """Test that precompiled modules for other sources are ignored."""
+        compiled = temp_dir / "compiled"
+        monkeypatch.setattr("fastapi_ms_init.generator.PRECOMPILED_DIR", compiled)
+        precompile_templates(compiled)
+        (compiled / "TEMPLATES_KEY").write_text("stale")
+
+        env = load_templates()
+
+        assert env.bytecode_cache is not None
+
+
+class TestTemplatesDigest:
+    """Test template tree digests."""
+
+    def test_digest_is_stable(self):
+        """Test that the digest is deterministic."""
+        assert templates_digest() == templates_digest()
+
+    def test_digest_changes_with_content(self, temp_dir):
+        """Test that editing a template changes the digest."""
+        (temp_dir / "a.j2").write_text("one")
+        before = templates_digest(temp_dir)
+        (temp_dir / "a.j2").write_text("two")
+        assert templates_digest(temp_dir) != before
+
 
 class TestRenderTemplate:
     """Test template rendering."""
@@ -128,3 +183,146 @@ class TestGenerateProject:
         # Verify config properties
         assert config.include_example_route is False
         assert config.generate_docker_compose is False
+
+
+class TestRenderProject:
+    """Test in-memory project rendering."""
+
+    def test_render_project_returns_all_files(self):
+        """Test that every selected template is rendered."""
+        config = ProjectConfig(service_name="my-service", python_package_name="my_service")
+
+        files = render_project(config)
+
+        assert "app/main.py" in files
+        assert "docker-compose.yml" in files
+        assert "my-service" in files["README.md"]
+
+    def test_render_project_respects_flags(self):
+        """Test that disabled features are not rendered."""
+        config = ProjectConfig(
+            service_name="my-service",
+            python_package_name="my_service",
+            generate_docker_compose=False,
+        )
+
+        assert "docker-compose.yml" not in render_project(config)
+
+
+class TestTemplateConfigFields:
+    """Test static analysis of the config fields templates read."""
+
+    def _write(self, templates_dir, name, source):
+        (templates_dir / name).write_text(source)
+
+    def test_collects_field_lookups(self, temp_dir, monkeypatch):
+        """Test that config.<field> lookups in expressions and tags are found."""
+        monkeypatch.setattr("fastapi_ms_init.generator.TEMPLATES_DIR", temp_dir)
+        self._write(
+            temp_dir,
+            "a.j2",
+            "{{ config.service_name | upper }}{% if config.use_redis %}x{% endif %}",
+        )
+
+        fields = template_config_fields(load_templates(use_cache=False), "a.j2")
+
+        assert fields == frozenset({"service_name", "use_redis"})
+
+    def test_template_without_config(self, temp_dir, monkeypatch):
+        """Test that templates that ignore the config read no fields."""
+        monkeypatch.setattr("fastapi_ms_init.generator.TEMPLATES_DIR", temp_dir)
+        self._write(temp_dir, "a.j2", "static {{ 1 + 1 }}")
+
+        assert template_config_fields(load_templates(use_cache=False), "a.j2") == frozenset()
+
+    def test_whole_config_use_is_unknown(self, temp_dir, monkeypatch):
+        """Test that using config other than through a field gives up."""
+        monkeypatch.setattr("fastapi_ms_init.generator.TEMPLATES_DIR", temp_dir)
+        self._write(temp_dir, "a.j2", "{{ config.use_redis }}{{ config }}")
+
+        assert template_config_fields(load_templates(use_cache=False), "a.j2") is None
+
+    def test_follows_included_templates(self, temp_dir, monkeypatch):
+        """Test that fields read by included templates are added."""
+        monkeypatch.setattr("fastapi_ms_init.generator.TEMPLATES_DIR", temp_dir)
+        self._write(temp_dir, "a.j2", "{{ config.use_redis }}{% include 'b.j2' %}")
+        self._write(temp_dir, "b.j2", "{{ config.use_otel }}")
+        self._write(temp_dir, "c.j2", "{% include name %}")
+
+        env = load_templates(use_cache=False)
+
+        assert template_config_fields(env, "a.j2") == frozenset({"use_redis", "use_otel"})
+        assert template_config_fields(env, "c.j2") is None
+
+    def test_shipped_templates(self):
+        """Test the analysis of templates that read flags only."""
+        env = load_templates()
+
+        assert template_config_fields(env, ".gitignore.j2") == frozenset()
+        assert template_config_fields(env, "tests/test_routes.py.j2") == frozenset(
+            {"include_example_route", "service_name"}
+        )
+
+
+class TestRenderMemo:
+    """Test reuse of rendered templates between projects."""
+
+    def _config(self, name, **flags):
+        return ProjectConfig(
+            service_name=name, python_package_name=name.replace("-", "_"), **flags
+        )
+
+    def test_reuses_renders_with_equal_fields(self):
+        """Test that templates reading only flags are rendered once per flag set."""
+        env = load_templates()
+        memo = RenderMemo()
+
+        first = memo.render(env, "tests/test_tasks.py.j2", self._config("one-service"))
+        second = memo.render(env, "tests/test_tasks.py.j2", self._config("two-service"))
+        memo.render(
+            env,
+            "tests/test_tasks.py.j2",
+            self._config("three-service", include_example_route=False),
+        )
+
+        assert first == second
+        assert (memo.hits, memo.misses) == (1, 2)
+
+    def test_does_not_reuse_project_specific_renders(self):
+        """Test that templates reading the project name are always rendered."""
+        env = load_templates()
+        memo = RenderMemo()
+
+        first = memo.render(env, "app/__init__.py.j2", self._config("one-service"))
+        second = memo.render(env, "app/__init__.py.j2", self._config("one-service"))
+
+        assert first == second
+        assert (memo.hits, memo.misses) == (0, 2)
+
+    def test_memoized_projects_match_plain_renders(self):
+        """Test that rendering through a memo produces identical projects."""
+        env = load_templates()
+        memo = RenderMemo()
+        configs = [
+            self._config("one-service"),
+            self._config("two-service", use_redis=True),
+            self._config("three-service"),
+        ]
+
+        for config in configs:
+            assert render_project(config, env, memo) == render_project(config, env)
+        assert memo.hits > 0
+
+
+class TestGenerateProjectToSink:
+    """Test generating into an output sink."""
+
+    def test_generate_into_memory(self):
+        """Test that a sink receives every file including the state."""
+        config = ProjectConfig(service_name="my-service", python_package_name="my_service")
+        sink = MemorySink()
+
+        generate_project(config, sink)
+
+        assert b"FastAPI" in sink.files["app/main.py"]
+        assert ".fastapi-ms-init.json" in sink.files
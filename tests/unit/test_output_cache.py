@@ -0,0 +1,134 @@
+"""Unit tests for output_cache module."""
+
+import os
+from dataclasses import replace
+from unittest.mock import patch
+
+import pytest
+
+from fastapi_ms_init import __version__
+from fastapi_ms_init.batch import generate_batch
+from fastapi_ms_init.config import ProjectConfig
+from fastapi_ms_init.generator import generate_project
+from fastapi_ms_init.output_cache import OutputCache
+from fastapi_ms_init.sinks import MemorySink
+
+
+@pytest.fixture
+def config():
+    """Return the configuration used for generated projects."""
+    return ProjectConfig(service_name="orders-api", python_package_name="orders_api")
+
+
+@pytest.fixture
+def cache(temp_dir):
+    """Create an empty output cache."""
+    return OutputCache(temp_dir / "cache")
+
+
+class TestOutputCache:
+    """Test the content-addressed project cache."""
+
+    def test_default_directory(self, isolated_cache_dir):
+        """Test that entries live in the user cache directory."""
+        assert OutputCache().directory == isolated_cache_dir / __version__ / "projects"
+
+    def test_round_trip(self, cache, config):
+        """Test that stored files are returned for the same configuration."""
+        files = {"app/main.py": "print('hi')\n", "README.md": "# Orders ✓\n"}
+
+        assert cache.get(config) is None
+        cache.put(config, files)
+
+        assert config in cache
+        assert cache.get(config) == files
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_key_depends_on_every_field(self, cache, config):
+        """Test that configurations differing in any field have different keys."""
+        assert cache.key(config) == cache.key(replace(config))
+        assert cache.key(config) != cache.key(replace(config, use_redis=True))
+        assert cache.key(config) != cache.key(replace(config, service_name="billing-api"))
+
+    def test_key_depends_on_templates(self, temp_dir, config, templates):
+        """Test that editing a template changes the key."""
+        before = OutputCache(temp_dir / "cache").key(config)
+
+        (templates / "README.md.j2").write_text("# Changed\n")
+
+        assert OutputCache(temp_dir / "cache").key(config) != before
+
+    def test_corrupt_entry_is_a_miss(self, cache, config):
+        """Test that an unreadable entry is treated as a miss."""
+        cache.put(config, {"README.md": "# Orders\n"})
+        (cache.directory / f"{cache.key(config)}.tar").write_bytes(b"not a tar")
+
+        assert cache.get(config) is None
+
+    def test_touch_failure_is_still_a_hit(self, cache, config):
+        """Test that failing to refresh an entry's mtime does not discard it."""
+        cache.put(config, {"README.md": "# Orders\n"})
+
+        with patch("fastapi_ms_init.output_cache.os.utime", side_effect=OSError("read-only")):
+            assert cache.get(config) == {"README.md": "# Orders\n"}
+
+        assert cache.hits == 1
+        assert cache.misses == 0
+
+    def test_write_failure_is_ignored(self, temp_dir, config):
+        """Test that an unwritable cache directory does not fail generation."""
+        blocker = temp_dir / "file"
+        blocker.write_text("")
+        cache = OutputCache(blocker / "cache")
+
+        cache.put(config, {"README.md": "# Orders\n"})
+
+        assert cache.get(config) is None
+
+    def test_evicts_least_recently_used(self, cache, config):
+        """Test that the oldest entries are removed once the cache is full."""
+        configs = [replace(config, service_name=f"svc-{i}") for i in range(3)]
+        content = {"data.txt": "x" * 10000}
+        for age, project in enumerate(configs):
+            cache.put(project, content)
+            entry = cache.directory / f"{cache.key(project)}.tar"
+            os.utime(entry, (1000 + age, 1000 + age))
+        # Reading an entry makes it the most recently used
+        assert cache.get(configs[0]) is not None
+
+        cache.max_size = 2 * (cache.directory / f"{cache.key(configs[0])}.tar").stat().st_size
+        cache.evict()
+
+        assert configs[0] in cache
+        assert configs[1] not in cache
+        assert configs[2] in cache
+
+
+class TestGenerateWithCache:
+    """Test generation through the output cache."""
+
+    def test_cached_project_matches_rendered(self, cache, config):
+        """Test that a cache hit produces the same files without rendering."""
+        rendered = MemorySink()
+        generate_project(config, rendered, cache=cache)
+
+        cached = MemorySink()
+        with patch("fastapi_ms_init.generator.render_project") as render:
+            generate_project(config, cached, cache=cache)
+
+        render.assert_not_called()
+        assert cached.files == rendered.files
+        assert ".fastapi-ms-init.json" in cached.files
+
+    def test_batch_skips_template_loading_when_cached(self, temp_dir, cache, config):
+        """Test that a fully cached batch does not load the templates."""
+        configs = [config, replace(config, service_name="billing-api")]
+        generate_batch(configs, temp_dir / "first", cache=cache)
+
+        with patch("fastapi_ms_init.batch.load_templates") as load:
+            results = generate_batch(configs, temp_dir / "second", cache=cache)
+
+        load.assert_not_called()
+        assert all(result.ok for result in results)
+        assert cache.hits == 2
+        assert (temp_dir / "second" / "billing-api" / "app" / "main.py").exists()
@@ -0,0 +1,230 @@
+"""Unit tests for scanner module."""
+
+import hashlib
+import json
+
+import pytest
+
+from fastapi_ms_init.config import ProjectConfig
+from fastapi_ms_init.errors import ProjectStateError
+from fastapi_ms_init.generator import generate_project
+from fastapi_ms_init.scanner import (
+    DriftStatus,
+    find_projects,
+    hash_file,
+    infer_config,
+    scan_project,
+    scan_projects,
+)
+from fastapi_ms_init.state import PROJECT_STATE_FILE, FileState, read_project_state
+
+
+def generate(root, service_name, **flags):
+    """Generate a project under a directory."""
+    config = ProjectConfig(
+        service_name=service_name,
+        python_package_name=service_name.replace("-", "_"),
+        **flags,
+    )
+    project_path = root / service_name
+    generate_project(config, project_path)
+    return project_path
+
+
+class TestHashFile:
+    """Test file hashing."""
+
+    def test_small_file(self, temp_dir):
+        """Test that small files are hashed in chunks."""
+        path = temp_dir / "small.txt"
+        path.write_bytes(b"hello")
+
+        assert hash_file(path) == hashlib.sha256(b"hello").hexdigest()
+
+    def test_large_file(self, temp_dir, monkeypatch):
+        """Test that large files are hashed through a memory map."""
+        monkeypatch.setattr("fastapi_ms_init.scanner.MMAP_MINIMUM_SIZE", 4)
+        path = temp_dir / "large.bin"
+        path.write_bytes(b"x" * 10000)
+
+        assert hash_file(path) == hashlib.sha256(b"x" * 10000).hexdigest()
+
+
+class TestFindProjects:
+    """Test project discovery."""
+
+    def test_finds_nested_projects(self, temp_dir):
+        """Test that projects are found at any depth."""
+        generate(temp_dir / "team-a", "orders-api")
+        generate(temp_dir / "team-b" / "payments", "billing-api")
+        (temp_dir / "docs").mkdir()
+
+        assert find_projects(temp_dir) == [
+            temp_dir / "team-a" / "orders-api",
+            temp_dir / "team-b" / "payments" / "billing-api",
+        ]
+
+    def test_skips_ignored_directories(self, temp_dir):
+        """Test that VCS and virtualenv directories are not searched."""
+        generate(temp_dir / ".venv", "orders-api")
+        generate(temp_dir / "node_modules", "billing-api")
+
+        assert find_projects(temp_dir) == []
+
+    def test_does_not_search_inside_projects(self, temp_dir):
+        """Test that a project's own directories are not searched."""
+        project = generate(temp_dir, "orders-api")
+        generate(project / "vendor", "billing-api")
+
+        assert find_projects(temp_dir) == [project]
+
+    def test_finds_projects_without_state(self, temp_dir):
+        """Test that generated projects are recognized by their pyproject.toml."""
+        project = generate(temp_dir, "orders-api")
+        (project / PROJECT_STATE_FILE).unlink()
+        other = temp_dir / "other"
+        (other / "app").mkdir(parents=True)
+        (other / "app" / "main.py").write_text("")
+        (other / "pyproject.toml").write_text('[project]\nname = "other"\n')
+
+        assert find_projects(temp_dir) == [project]
+
+
+class TestInferConfig:
+    """Test configuration inference for projects without state."""
+
+    def test_infers_names_and_flags(self, temp_dir):
+        """Test that names and feature flags are read back from the files."""
+        project = generate(
+            temp_dir, "orders-api", use_postgres=True, generate_docker_compose=False
+        )
+
+        config = infer_config(project)
+
+        assert config.service_name == "orders-api"
+        assert config.python_package_name == "orders_api"
+        assert config.use_postgres is True
+        assert config.generate_docker_compose is False
+
+    def test_rejects_other_projects(self, temp_dir):
+        """Test that projects not generated by the tool are rejected."""
+        (temp_dir / "pyproject.toml").write_text(
+            '[project]\nname = "other"\ndescription = "Something else"\n'
+        )
+
+        with pytest.raises(ProjectStateError, match="not generated"):
+            infer_config(temp_dir)
+
+    def test_unreadable_pyproject(self, temp_dir):
+        """Test that a missing pyproject.toml is reported."""
+        with pytest.raises(ProjectStateError, match="Cannot infer"):
+            infer_config(temp_dir)
+
+
+class TestScanProject:
+    """Test drift detection for a single project."""
+
+    def test_fresh_project_is_current(self, temp_dir):
+        """Test that a freshly generated project has no drift."""
+        project = generate(temp_dir, "orders-api")
+
+        drift = scan_project(project)
+
+        assert drift.error is None
+        assert drift.config_source == "state"
+        assert not drift.drifted
+        assert set(drift.files.values()) == {DriftStatus.CURRENT}
+
+    def test_classifies_file_changes(self, temp_dir, templates, edit):
+        """Test outdated, modified, missing and obsolete files."""
+        project = generate(temp_dir, "orders-api")
+        edit(templates / "README.md.j2", "# ", "# Service: ")
+        edit(project / "app" / "main.py", "FastAPI", "FastAPI  ")
+        (project / "Dockerfile").unlink()
+        state = read_project_state(project)
+        state.files["old.txt"] = FileState("old.txt.j2", "0", "old\n")
+        (project / PROJECT_STATE_FILE).write_text(state.to_json())
+        (project / "old.txt").write_text("old\n")
+
+        drift = scan_project(project)
+
+        assert drift.files["README.md"] is DriftStatus.OUTDATED
+        assert drift.files["app/main.py"] is DriftStatus.MODIFIED
+        assert drift.files["Dockerfile"] is DriftStatus.MISSING
+        assert drift.files["old.txt"] is DriftStatus.OBSOLETE
+        assert drift.drifted
+
+    def test_project_without_state(self, temp_dir):
+        """Test that projects without state are compared using the inferred config."""
+        project = generate(temp_dir, "orders-api", use_redis=True)
+        (project / PROJECT_STATE_FILE).unlink()
+
+        drift = scan_project(project)
+
+        assert drift.config_source == "inferred"
+        assert not drift.drifted
+
+    def test_unreadable_state(self, temp_dir):
+        """Test that a corrupt state file is reported as an error."""
+        project = generate(temp_dir, "orders-api")
+        (project / PROJECT_STATE_FILE).write_text("{")
+
+        drift = scan_project(project)
+
+        assert drift.error is not None
+        assert drift.files == {}
+
+    def test_unreadable_file(self, temp_dir):
+        """Test that a file that cannot be read is reported as an error."""
+        project = generate(temp_dir, "orders-api")
+        (project / "Dockerfile").unlink()
+        (project / "Dockerfile").mkdir()
+
+        drift = scan_project(project)
+
+        assert "Dockerfile" in drift.error
+
+
+class TestScanProjects:
+    """Test scanning a directory tree."""
+
+    def test_report(self, temp_dir):
+        """Test the JSON drift report."""
+        generate(temp_dir / "services", "orders-api")
+        drifted = generate(temp_dir / "services", "billing-api")
+        (drifted / "Dockerfile").unlink()
+
+        report = scan_projects(temp_dir, max_workers=2)
+        data = json.loads(report.to_json())
+
+        assert data["summary"] == {"projects": 2, "drifted": 1, "failed": 0}
+        projects = {project["path"]: project for project in data["projects"]}
+        assert projects["services/billing-api"]["files"] == {"Dockerfile": "missing"}
+        assert projects["services/billing-api"]["counts"]["missing"] == 1
+        assert projects["services/orders-api"]["files"] == {}
+        assert projects["services/orders-api"]["drifted"] is False
+        assert "templates_digest" in data
+
+    def test_undecodable_state_does_not_stop_the_scan(self, temp_dir):
+        """Test that a state file that is not UTF-8 fails only its own project."""
+        generate(temp_dir, "orders-api")
+        broken = generate(temp_dir, "billing-api")
+        (broken / PROJECT_STATE_FILE).write_bytes(b"\xff\xfe garbage")
+
+        report = scan_projects(temp_dir, max_workers=2)
+
+        assert [project.path.name for project in report.failed] == ["billing-api"]
+        assert "Invalid project state" in report.failed[0].error
+        assert len(report.projects) == 2
+
+    def test_unreadable_project_does_not_stop_the_scan(self, temp_dir):
+        """Test that the other projects are reported when one cannot be read."""
+        generate(temp_dir, "orders-api")
+        broken = generate(temp_dir, "billing-api")
+        (broken / "Dockerfile").unlink()
+        (broken / "Dockerfile").mkdir()
+
+        report = scan_projects(temp_dir, max_workers=2)
+
+        assert [project.path.name for project in report.failed] == ["billing-api"]
+        assert len(report.projects) == 2
@@ -0,0 +1,216 @@
+"""Unit tests for server module."""
+
+import asyncio
+import io
+import json
+import tarfile
+from unittest.mock import patch
+
+import pytest
+
+from fastapi_ms_init.server import GenerationServer, ServerMetrics
+
+
+def call(app, method, path, body=b""):
+    """Send one request to an ASGI app and collect the response."""
+
+    async def request():
+        messages = []
+        chunks = [{"type": "http.request", "body": body, "more_body": False}]
+
+        async def receive():
+            return chunks.pop(0) if chunks else {"type": "http.disconnect"}
+
+        async def send(message):
+            messages.append(message)
+
+        await app({"type": "http", "method": method, "path": path}, receive, send)
+        return messages
+
+    messages = asyncio.run(request())
+    start = messages[0]
+    headers = {name.decode(): value.decode() for name, value in start["headers"]}
+    content = b"".join(message.get("body", b"") for message in messages[1:])
+    assert not messages[-1].get("more_body", False)
+    return start["status"], headers, content
+
+
+def post_project(app, data):
+    """Request a project for a configuration."""
+    return call(app, "POST", "/projects", json.dumps(data).encode())
+
+
+@pytest.fixture
+def server():
+    """Create a server with warm templates."""
+    app = GenerationServer(max_concurrency=2)
+    app.warm()
+    return app
+
+
+class TestGenerationServer:
+    """Test the generation server."""
+
+    def test_generates_project_archive(self, server):
+        """Test that a configuration is answered with the project as a .tar.gz."""
+        status, headers, content = post_project(
+            server, {"service_name": "orders-api", "use_redis": True}
+        )
+
+        assert status == 200
+        assert headers["content-type"] == "application/gzip"
+        assert 'filename="orders-api.tar.gz"' in headers["content-disposition"]
+        assert headers["server-timing"].startswith("generate;dur=")
+        with tarfile.open(fileobj=io.BytesIO(content), mode="r:gz") as tar:
+            names = tar.getnames()
+            main = tar.extractfile("orders-api/app/main.py").read().decode()
+        assert "orders-api/.fastapi-ms-init.json" in names
+        assert "orders-api/app/core/cache.py" in names
+        assert "FastAPI" in main
+
+    def test_streams_large_archives_in_chunks(self, server, monkeypatch):
+        """Test that the archive is sent in several body messages."""
+        monkeypatch.setattr("fastapi_ms_init.server.CHUNK_SIZE", 1024)
+        messages = []
+
+        async def request():
+            async def receive():
+                return {"type": "http.request", "body": b'{"service_name": "orders-api"}'}
+
+            async def send(message):
+                messages.append(message)
+
+            await server({"type": "http", "method": "POST", "path": "/projects"}, receive, send)
+
+        asyncio.run(request())
+
+        bodies = [message for message in messages if message["type"] == "http.response.body"]
+        assert len(bodies) > 1
+        assert all(message["more_body"] for message in bodies[:-1])
+
+    @pytest.mark.parametrize(
+        ("body", "detail"),
+        [
+            (b"{", "Expecting"),
+            (b"[]", "Expected a JSON object"),
+            (b'{"service_name": "Bad_Name"}', "Invalid service name"),
+            (b'{"service_name": "api", "color": "red"}', "Unknown project fields"),
+            (b'{"service_name": "api", "python_package_name": 5}', "Invalid package name"),
+            (b'{"service_name": "api", "use_redis": "yes"}', "must be a boolean"),
+        ],
+    )
+    def test_rejects_invalid_configs(self, server, body, detail):
+        """Test that invalid request bodies are answered with 400."""
+        status, _, content = call(server, "POST", "/projects", body)
+
+        assert status == 400
+        assert detail in json.loads(content)["detail"]
+
+    def test_rejects_large_bodies(self, server):
+        """Test that oversized request bodies are answered with 413."""
+        status, _, _ = call(server, "POST", "/projects", b" " * (64 * 1024 + 1))
+
+        assert status == 413
+
+    def test_rejects_requests_when_busy(self):
+        """Test that requests over the concurrency limit get 503 after the queue timeout."""
+        app = GenerationServer(max_concurrency=1, queue_timeout=0.01)
+
+        async def scenario():
+            await app._slots.acquire()
+
+        asyncio.run(scenario())
+        status, headers, _ = post_project(app, {"service_name": "orders-api"})
+
+        assert status == 503
+        assert headers["retry-after"] == "1"
+        assert app.metrics.rejected == 1
+
+    def test_generation_failure(self, server):
+        """Test that a failure before any output is answered with 500."""
+        with patch("fastapi_ms_init.server.generate_project", side_effect=RuntimeError("boom")):
+            status, _, content = post_project(server, {"service_name": "orders-api"})
+
+        assert status == 500
+        assert "boom" in json.loads(content)["detail"]
+        assert server.metrics.failed == 1
+        assert server.metrics.in_flight == 0
+
+    def test_health(self, server):
+        """Test the liveness endpoint."""
+        status, _, content = call(server, "GET", "/health")
+
+        assert status == 200
+        assert json.loads(content) == {"status": "ok"}
+
+    def test_metrics(self, server):
+        """Test that requests are counted and timed."""
+        post_project(server, {"service_name": "orders-api"})
+        post_project(server, {"service_name": "billing-api"})
+
+        status, _, content = call(server, "GET", "/metrics")
+        metrics = json.loads(content)
+
+        assert status == 200
+        assert metrics["requests"] == 2
+        assert metrics["generated"] == 2
+        assert metrics["in_flight"] == 0
+        assert metrics["latency_ms"]["p50"] > 0
+
+    def test_unknown_routes(self, server):
+        """Test 404 and 405 responses."""
+        assert call(server, "GET", "/nothing")[0] == 404
+        assert call(server, "GET", "/projects")[0] == 405
+
+    def test_lifespan_warms_templates(self):
+        """Test that startup loads and compiles the templates."""
+        app = GenerationServer()
+        sent = []
+        messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message["type"])
+
+        asyncio.run(app({"type": "lifespan"}, receive, send))
+
+        assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+        assert app.env is not None
+        assert app.env.auto_reload is False
+
+    def test_lifespan_startup_failure(self):
+        """Test that a failure to load the templates fails startup."""
+        app = GenerationServer()
+        sent = []
+
+        async def receive():
+            return {"type": "lifespan.startup"}
+
+        async def send(message):
+            sent.append(message["type"])
+
+        with patch("fastapi_ms_init.server.load_templates", side_effect=OSError("gone")):
+            asyncio.run(app({"type": "lifespan"}, receive, send))
+
+        assert sent == ["lifespan.startup.failed"]
+
+
+class TestServerMetrics:
+    """Test latency bookkeeping."""
+
+    def test_percentiles(self):
+        """Test percentiles over the recent window."""
+        metrics = ServerMetrics(window=100)
+        for millisecond in range(1, 201):
+            metrics.observe(millisecond / 1000)
+
+        summary = metrics.to_dict()["latency_ms"]
+
+        assert summary["p50"] == 151
+        assert summary["max"] == 200
+
+    def test_empty(self):
+        """Test that percentiles are empty before any request."""
+        assert ServerMetrics().to_dict()["latency_ms"]["p95"] is None
@@ -0,0 +1,140 @@
+"""Unit tests for sinks module."""
+
+import io
+import tarfile
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from fastapi_ms_init.errors import OutputDirectoryExistsError
+from fastapi_ms_init.sinks import (
+    DirectorySink,
+    MemorySink,
+    TarSink,
+    ZipSink,
+    project_directories,
+    write_project,
+)
+
+FILES = {"app/main.py": "app = 1\n", "README.md": "# svc\n"}
+
+
+class NonSeekable(io.RawIOBase):
+    """Write-only stream that cannot seek, like a socket."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.buffer += data
+        return len(data)
+
+
+class TestProjectDirectories:
+    """Test directory computation."""
+
+    def test_parents_before_children(self):
+        """Test that directories are ordered for creation."""
+        files = ["app/core/settings.py", "tests/test_main.py", "README.md"]
+        assert project_directories(files) == ["app", "tests", "app/core"]
+
+
+class TestWriteProject:
+    """Test atomic project writing."""
+
+    def test_writes_files(self, temp_dir):
+        """Test that files and directories are created."""
+        output_path = temp_dir / "nested" / "svc"
+
+        write_project({"a/b/c.txt": "c", "d.txt": "d"}, output_path)
+
+        assert (output_path / "a" / "b" / "c.txt").read_text() == "c"
+        assert (output_path / "d.txt").read_text() == "d"
+        assert list((temp_dir / "nested").iterdir()) == [output_path]
+
+    def test_failed_write_leaves_nothing(self, temp_dir):
+        """Test that a failed write removes the staging directory."""
+        output_path = temp_dir / "svc"
+        original_write_text = Path.write_text
+
+        def failing_write_text(self, data, *args, **kwargs):
+            if self.name == "bad.txt":
+                raise OSError("disk full")
+            return original_write_text(self, data, *args, **kwargs)
+
+        with patch.object(Path, "write_text", failing_write_text):
+            with pytest.raises(OSError, match="disk full"):
+                write_project({"good.txt": "ok", "bad.txt": "boom"}, output_path)
+
+        assert list(temp_dir.iterdir()) == []
+
+    def test_output_created_concurrently(self, temp_dir):
+        """Test that a directory appearing during generation is reported."""
+        output_path = temp_dir / "svc"
+        output_path.mkdir()
+        (output_path / "existing.txt").write_text("mine")
+
+        with pytest.raises(OutputDirectoryExistsError):
+            write_project({"a.txt": "a"}, output_path)
+
+        assert list(temp_dir.iterdir()) == [output_path]
+        assert [p.name for p in output_path.iterdir()] == ["existing.txt"]
+
+    def test_rename_failure(self, temp_dir):
+        """Test that other rename errors are propagated."""
+        output_path = temp_dir / "svc"
+
+        with patch.object(Path, "rename", side_effect=OSError("cross-device")):
+            with pytest.raises(OSError, match="cross-device"):
+                write_project({"a.txt": "a"}, output_path)
+
+        assert list(temp_dir.iterdir()) == []
+
+
+class TestSinks:
+    """Test the output sink backends."""
+
+    def test_directory_sink(self, temp_dir):
+        """Test that the directory sink writes the project."""
+        DirectorySink(temp_dir / "svc").write(FILES)
+        assert (temp_dir / "svc" / "app" / "main.py").read_text() == "app = 1\n"
+
+    def test_memory_sink(self):
+        """Test that the memory sink collects bytes."""
+        sink = MemorySink()
+        sink.write(FILES)
+        assert sink.files == {"app/main.py": b"app = 1\n", "README.md": b"# svc\n"}
+
+    @pytest.mark.parametrize("compression", ["", "gz", "xz"])
+    def test_tar_sink_streams(self, compression):
+        """Test that tar archives can be streamed to non-seekable outputs."""
+        stream = NonSeekable()
+        TarSink(stream, prefix="svc", compression=compression).write(FILES)
+
+        with tarfile.open(fileobj=io.BytesIO(stream.buffer), mode="r:*") as tar:
+            names = tar.getnames()
+            main = tar.extractfile("svc/app/main.py").read()
+
+        assert names == ["svc/app", "svc/README.md", "svc/app/main.py"]
+        assert main == b"app = 1\n"
+
+    def test_zip_sink_streams(self):
+        """Test that zip archives can be streamed to non-seekable outputs."""
+        stream = NonSeekable()
+        ZipSink(stream, prefix="svc").write(FILES)
+
+        with zipfile.ZipFile(io.BytesIO(stream.buffer)) as archive:
+            assert sorted(archive.namelist()) == ["svc/README.md", "svc/app/main.py"]
+            assert archive.read("svc/README.md") == b"# svc\n"
+
+    def test_archive_without_prefix(self):
+        """Test that archives can be rooted at the project itself."""
+        buffer = io.BytesIO()
+        ZipSink(buffer).write(FILES)
+        with zipfile.ZipFile(buffer) as archive:
+            assert "app/main.py" in archive.namelist()
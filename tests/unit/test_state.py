@@ -0,0 +1,76 @@
+"""Unit tests for state module."""
+
+import json
+
+import pytest
+
+from fastapi_ms_init.config import ProjectConfig
+from fastapi_ms_init.errors import ProjectStateError
+from fastapi_ms_init.state import (
+    PROJECT_STATE_FILE,
+    FileState,
+    ProjectState,
+    hash_text,
+    read_project_state,
+)
+
+
+@pytest.fixture
+def state():
+    """Return a small project state."""
+    return ProjectState(
+        config=ProjectConfig(service_name="my-service", python_package_name="my_service"),
+        files={"README.md": FileState("README.md.j2", "abc", "# my-service\n")},
+    )
+
+
+class TestProjectState:
+    """Test ProjectState serialization."""
+
+    def test_round_trip(self, state):
+        """Test that to_json and from_json are inverse."""
+        assert ProjectState.from_json(state.to_json()) == state
+
+    def test_records_content_hash(self, state):
+        """Test that file content hashes are stored."""
+        data = json.loads(state.to_json())
+        assert data["files"]["README.md"]["content_hash"] == hash_text("# my-service\n")
+
+    def test_rejects_invalid_json(self):
+        """Test that malformed state is reported."""
+        with pytest.raises(ProjectStateError, match="Invalid project state"):
+            ProjectState.from_json("{")
+
+    def test_rejects_unknown_format(self, state):
+        """Test that future state formats are rejected."""
+        data = json.loads(state.to_json())
+        data["format"] = 99
+        with pytest.raises(ProjectStateError, match="Unsupported state format"):
+            ProjectState.from_json(json.dumps(data))
+
+    def test_rejects_unknown_config_fields(self, state):
+        """Test that configs from newer generators are rejected."""
+        data = json.loads(state.to_json())
+        data["config"]["use_mongo"] = True
+        with pytest.raises(ProjectStateError, match="use_mongo"):
+            ProjectState.from_json(json.dumps(data))
+
+
+class TestReadProjectState:
+    """Test reading state from a project directory."""
+
+    def test_reads_state_file(self, temp_dir, state):
+        """Test reading an existing state file."""
+        (temp_dir / PROJECT_STATE_FILE).write_text(state.to_json())
+        assert read_project_state(temp_dir) == state
+
+    def test_missing_state_file(self, temp_dir):
+        """Test that a missing state file is reported."""
+        with pytest.raises(ProjectStateError, match="not generated by fastapi-ms-init"):
+            read_project_state(temp_dir)
+
+    def test_undecodable_state_file(self, temp_dir):
+        """Test that a state file that is not UTF-8 is reported as invalid."""
+        (temp_dir / PROJECT_STATE_FILE).write_bytes(b"\xff\xfe garbage")
+        with pytest.raises(ProjectStateError, match="Invalid project state"):
+            read_project_state(temp_dir)
@@ -0,0 +1,85 @@
+"""Unit tests for template_manifest module."""
+
+import pytest
+
+from fastapi_ms_init.config import ProjectConfig
+from fastapi_ms_init.errors import TemplateManifestError
+from fastapi_ms_init.generator import TEMPLATES_DIR
+from fastapi_ms_init.template_manifest import (
+    TemplateEntry,
+    TemplateManifest,
+    load_template_manifest,
+)
+
+CONFIG = ProjectConfig(service_name="my-service", python_package_name="my_service")
+
+
+class TestBundledManifest:
+    """Test the manifest shipped with the templates."""
+
+    def test_manifest_covers_every_template(self):
+        """Test that every template file is listed and every entry exists."""
+        listed = {entry.template for entry in load_template_manifest().entries}
+        on_disk = {
+            path.relative_to(TEMPLATES_DIR).as_posix()
+            for path in TEMPLATES_DIR.rglob("*.j2")
+        }
+        assert listed == on_disk
+
+    def test_dependencies_exist(self):
+        """Test that declared dependencies are real templates."""
+        for entry in load_template_manifest().entries:
+            for dependency in entry.depends_on:
+                assert (TEMPLATES_DIR / dependency).is_file(), dependency
+
+    def test_manifest_is_loaded_once(self):
+        """Test that the manifest is indexed once."""
+        assert load_template_manifest() is load_template_manifest()
+
+
+class TestTemplateManifest:
+    """Test manifest parsing and selection."""
+
+    def test_default_output_path(self):
+        """Test that the output defaults to the template without .j2."""
+        manifest = TemplateManifest.from_toml('[[files]]\ntemplate = "app/main.py.j2"\n')
+        assert manifest.entries == (TemplateEntry("app/main.py.j2", "app/main.py"),)
+
+    def test_select_by_condition(self):
+        """Test flag and negated flag conditions."""
+        manifest = TemplateManifest.from_toml(
+            '[[files]]\ntemplate = "a.j2"\n'
+            '[[files]]\ntemplate = "b.j2"\nwhen = ["use_redis"]\n'
+            '[[files]]\ntemplate = "c.j2"\nwhen = ["not use_redis"]\n'
+            '[[files]]\ntemplate = "d.j2"\noutput = "x/d"\nwhen = ["use_redis"]\n'
+        )
+
+        with_redis = ProjectConfig("my-service", "my_service", use_redis=True)
+        assert [e.output for e in manifest.select(with_redis)] == ["a", "b", "x/d"]
+        assert [e.output for e in manifest.select(CONFIG)] == ["a", "c"]
+
+    def test_depends_on(self):
+        """Test that dependencies are parsed."""
+        manifest = TemplateManifest.from_toml(
+            '[[files]]\ntemplate = "a.j2"\ndepends_on = ["_macros.j2"]\n'
+        )
+        assert manifest.entries[0].depends_on == ("_macros.j2",)
+
+    @pytest.mark.parametrize(
+        ("toml", "message"),
+        [
+            ("[[files", "Invalid template manifest"),
+            ("files = 1", r"\[\[files\]\]"),
+            ('[[files]]\ntemplate = "a.txt"', "Invalid template name"),
+            ('[[files]]\ntemplate = "a.j2"\nmode = 1', "Unknown keys"),
+            ('[[files]]\ntemplate = "a.j2"\nwhen = "use_redis"', "must be a list"),
+            ('[[files]]\ntemplate = "a.j2"\nwhen = ["use_mongo"]', "Unknown flag"),
+            ('[[files]]\ntemplate = "a.j2"\nwhen = [1]', "Unknown flag"),
+            ('[[files]]\ntemplate = "a.j2"\ndepends_on = "b.j2"', "depends_on"),
+            ('[[files]]\ntemplate = "a.j2"\n[[files]]\ntemplate = "a.j2"', "Duplicate"),
+        ],
+    )
+    def test_invalid_manifests(self, toml, message):
+        """Test that invalid manifests are rejected."""
+        with pytest.raises(TemplateManifestError, match=message):
+            TemplateManifest.from_toml(toml)
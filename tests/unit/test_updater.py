@@ -0,0 +1,197 @@
+"""Unit tests for updater module."""
+
+from dataclasses import replace
+from unittest.mock import patch
+
+import pytest
+
+from fastapi_ms_init.config import ProjectConfig
+from fastapi_ms_init.generator import generate_project
+from fastapi_ms_init.state import read_project_state
+from fastapi_ms_init.updater import FileStatus, merge3, update_project
+
+
+@pytest.fixture
+def config():
+    """Return the configuration used for generated projects."""
+    return ProjectConfig(service_name="my-service", python_package_name="my_service")
+
+
+@pytest.fixture
+def project(temp_dir, templates, config):
+    """Generate a project from the editable templates."""
+    project_path = temp_dir / "my-service"
+    generate_project(config, project_path)
+    return project_path
+
+
+class TestMerge3:
+    """Test the line-based three-way merge."""
+
+    def test_combines_independent_changes(self):
+        """Test that changes to different lines are combined."""
+        base = "a\nb\nc\nd\n"
+        assert merge3(base, "A\nb\nc\nd\n", "a\nb\nc\nD\n") == "A\nb\nc\nD\n"
+
+    def test_identical_changes(self):
+        """Test that both sides making the same change is not a conflict."""
+        base = "a\nb\n"
+        assert merge3(base, "a\nB\n", "a\nB\n") == "a\nB\n"
+
+    def test_conflicting_changes(self):
+        """Test that different changes to the same line conflict."""
+        assert merge3("a\nb\n", "a\nX\n", "a\nY\n") is None
+
+    def test_insertions(self):
+        """Test insertions at the start and end."""
+        assert merge3("a\nb\nc\n", "top\na\nb\nc\n", "a\nb\nc\nend\n") == "top\na\nb\nc\nend\n"
+
+    def test_adjacent_changes_conflict(self):
+        """Test that changes touching the same boundary conflict."""
+        assert merge3("a\nb\n", "A\nb\n", "a\nB\n") is None
+
+    def test_one_side_only(self):
+        """Test that one-sided changes are taken as is."""
+        assert merge3("a\nb\n", "a\nb\n", "a\nc\n") == "a\nc\n"
+        assert merge3("a\nb\n", "a\nc\n", "a\nb\n") == "a\nc\n"
+
+
+class TestUpdateProject:
+    """Test incremental project updates."""
+
+    def test_nothing_changed_skips_rendering(self, project):
+        """Test that unchanged templates are not re-rendered."""
+        with patch("fastapi_ms_init.updater.render_template") as mock_render:
+            report = update_project(project)
+
+        mock_render.assert_not_called()
+        assert set(report.files.values()) == {FileStatus.UNCHANGED}
+        assert report.changed == []
+
+    def test_updates_untouched_files(self, project, templates, edit):
+        """Test that files the user did not edit are overwritten."""
+        edit(templates / "README.md.j2", "## License", "## Licence")
+
+        report = update_project(project)
+
+        assert report.files["README.md"] is FileStatus.UPDATED
+        assert report.changed == ["README.md"]
+        assert "## Licence" in (project / "README.md").read_text()
+
+    def test_merges_edited_files(self, project, templates, edit):
+        """Test that user edits and template changes are merged."""
+        edit(templates / "README.md.j2", "## License", "## Licence")
+        edit(project / "README.md", "## Quick Start", "## Getting Started")
+
+        report = update_project(project)
+
+        content = (project / "README.md").read_text()
+        assert report.files["README.md"] is FileStatus.MERGED
+        assert "## Licence" in content
+        assert "## Getting Started" in content
+
+    def test_reports_conflicts(self, project, templates, edit):
+        """Test that overlapping edits are left alone and retried later."""
+        edit(templates / "README.md.j2", "## License", "## Licence")
+        edit(project / "README.md", "## License", "## Licensing")
+        before = (project / "README.md").read_text()
+
+        report = update_project(project)
+
+        assert report.conflicts == ["README.md"]
+        assert (project / "README.md").read_text() == before
+        state = read_project_state(project)
+        assert "## License\n" in state.files["README.md"].content
+
+    def test_keeps_user_edits_when_output_unchanged(self, project, config, edit):
+        """Test that edited files are kept if their output did not change."""
+        edit(project / "README.md", "## Quick Start", "## Getting Started")
+
+        report = update_project(project, replace(config, use_dagger=True))
+
+        assert report.files["README.md"] is FileStatus.SKIPPED
+        assert "## Getting Started" in (project / "README.md").read_text()
+
+    def test_deleted_files_stay_deleted(self, project, templates, edit):
+        """Test that files removed by the user are not recreated."""
+        edit(templates / ".gitignore.j2", "# Logs", "# Log files")
+        (project / ".gitignore").unlink()
+
+        report = update_project(project)
+
+        assert report.files[".gitignore"] is FileStatus.SKIPPED
+        assert not (project / ".gitignore").exists()
+
+    def test_regenerated_output_already_present(self, project, templates, edit):
+        """Test that a re-rendered file matching the disk is unchanged."""
+        edit(templates / "README.md.j2", "## License", "## Licence")
+        edit(project / "README.md", "## License", "## Licence")
+
+        report = update_project(project)
+
+        assert report.files["README.md"] is FileStatus.UNCHANGED
+
+    def test_disabling_feature_removes_files(self, project, config):
+        """Test that files of disabled features are removed and restored."""
+        report = update_project(project, replace(config, generate_docker_compose=False))
+
+        assert report.files["docker-compose.yml"] is FileStatus.REMOVED
+        assert not (project / "docker-compose.yml").exists()
+        assert "docker-compose.yml" not in read_project_state(project).files
+
+        report = update_project(project, config)
+
+        assert report.files["docker-compose.yml"] is FileStatus.CREATED
+        assert (project / "docker-compose.yml").exists()
+
+    def test_disabling_feature_keeps_edited_files(self, project, config, edit):
+        """Test that edited files of disabled features are kept."""
+        edit(project / "docker-compose.yml", "LOG_LEVEL=INFO", "LOG_LEVEL=DEBUG")
+
+        report = update_project(project, replace(config, generate_docker_compose=False))
+
+        assert report.files["docker-compose.yml"] is FileStatus.SKIPPED
+        assert (project / "docker-compose.yml").exists()
+
+    def test_disabled_feature_file_already_deleted(self, project, config):
+        """Test that deleted files of disabled features are ignored."""
+        (project / "docker-compose.yml").unlink()
+
+        report = update_project(project, replace(config, generate_docker_compose=False))
+
+        assert "docker-compose.yml" not in report.files
+
+    def test_new_file_blocked_by_foreign_file(self, temp_dir, templates, config):
+        """Test that new template files never overwrite unrelated files."""
+        project = temp_dir / "svc"
+        generate_project(replace(config, generate_docker_compose=False), project)
+        (project / "docker-compose.yml").write_text("mine\n")
+
+        report = update_project(project, config)
+
+        assert report.conflicts == ["docker-compose.yml"]
+        assert (project / "docker-compose.yml").read_text() == "mine\n"
+
+    def test_new_file_identical_to_existing(self, temp_dir, templates, config):
+        """Test that an identical pre-existing file is adopted."""
+        project = temp_dir / "svc"
+        generate_project(config, project)
+        content = (project / "docker-compose.yml").read_text()
+        update_project(project, replace(config, generate_docker_compose=False))
+        (project / "docker-compose.yml").write_text(content)
+
+        report = update_project(project, config)
+
+        assert report.files["docker-compose.yml"] is FileStatus.UNCHANGED
+        assert "docker-compose.yml" in read_project_state(project).files
+
+    def test_dry_run_writes_nothing(self, project, templates, edit):
+        """Test that a dry run only reports changes."""
+        edit(templates / "README.md.j2", "## License", "## Licence")
+        state_before = read_project_state(project)
+
+        report = update_project(project, dry_run=True)
+
+        assert report.files["README.md"] is FileStatus.UPDATED
+        assert "## Licence" not in (project / "README.md").read_text()
+        assert read_project_state(project) == state_before